@@ -1,6 +1,23 @@
 """ComputationalProject package init
 
 This file allows importing modules from the `ComputationalProject` directory.
+Submodules are loaded on first attribute access (PEP 562), so
+``import ComputationalProject`` stays cheap and ``ComputationalProject.sweep``
+only pulls in what that module needs.
 """
 
-__all__ = ["integrator", "visualizer", "numericalIntegrator"]
+import importlib
+
+__all__ = ["integrator", "visualizer", "numericalIntegrator", "sweep", "trajectory_io", "cache", "poincare", "symplectic", "double_pendulum", "telemetry", "kernels", "checkpoint", "export", "lod", "lyapunov", "service", "batch", "normal_modes", "symbolic", "basins", "shared_ensemble"]
+
+
+def __getattr__(name):
+    if name in __all__:
+        module = importlib.import_module(f"{__name__}.{name}")
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,238 @@
+"""Basins of attraction of the damped driven pendulum over (theta0, theta_dot0) grids.
+
+Attractors need dissipation, which the equations in `integrator` do not
+have, so the mapper adds a linear damping term -damping * theta_dot to the
+angular acceleration.  Every grid cell is one member of a vectorized
+Dormand-Prince ensemble (the scheme behind `compute_pendulum_ensemble`).
+The ensemble is advanced window_periods drive periods at a time and its
+stroboscopic points (the state at each multiple of 2*pi) are checked for
+a repeating cycle:
+
+- a member is settled once its last p points repeat the p before them
+  within tol, for the smallest p <= max_period, with theta compared
+  modulo 2*pi and the number of turns per cycle kept as the winding;
+- settled members leave the ensemble, so each window only integrates
+  those still moving;
+- each settled member is matched to a known attractor (same period and
+  winding, last point within match_tol of the cycle) or starts a new one.
+
+`basin_map` labels a grid this way.  With refine_levels > 0 it then
+doubles the resolution repeatedly, integrating only the new cells whose
+coarse neighbours disagree (or are unresolved) and filling the rest with
+their neighbours' label.  Labels index `BasinMap.attractors`; -1
+(`UNRESOLVED`) marks cells that did not settle within max_periods and -2
+(`FAILED`) cells whose trajectory stopped being finite (NaN initial
+conditions, a collapsed step size, ...).
+"""
+
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from ComputationalProject.integrator import _dopri5_ensemble, _pendulum_derivatives
+
+UNRESOLVED = -1
+FAILED = -2
+
+
+@dataclass
+class Attractor:
+    """A periodic attractor seen in the stroboscopic map: `period` drive periods, `winding` turns per cycle."""
+
+    period: int
+    winding: int
+    points: np.ndarray  # (period, 2) stroboscopic (theta mod 2*pi, theta_dot) cycle
+
+
+@dataclass
+class BasinMap:
+    """Result of `basin_map`: labels[i, j] is the attractor of (theta0_values[i], theta_dot0_values[j])."""
+
+    theta0_values: np.ndarray
+    theta_dot0_values: np.ndarray
+    labels: np.ndarray
+    settle_periods: np.ndarray
+    attractors: list = field(default_factory=list)
+    n_integrated: int = 0
+
+
+def _wrap(theta):
+    return np.mod(theta + np.pi, 2 * np.pi) - np.pi
+
+
+def _detect_cycles(theta, theta_dot, max_period, tol):
+    """Smallest period p (0 if none) and winding of each member's stroboscopic history (k, W)."""
+    period = np.zeros(theta.shape[0], dtype=int)
+    winding = np.zeros(theta.shape[0], dtype=int)
+    for p in range(1, max_period + 1):
+        d_theta = theta[:, -p:] - theta[:, -2 * p:-p]
+        turns = np.round(d_theta / (2 * np.pi))
+        residual = np.abs(d_theta - 2 * np.pi * turns) + np.abs(theta_dot[:, -p:] - theta_dot[:, -2 * p:-p])
+        found = (period == 0) & np.all(residual < tol, axis=1) & np.all(turns == turns[:, :1], axis=1)
+        period[found] = p
+        winding[found] = turns[found, 0]
+    return period, winding
+
+
+def _match_attractors(theta, theta_dot, period, winding, attractors, match_tol):
+    """Label settled members (last cycle point theta, theta_dot) by attractor, appending new ones."""
+    labels = np.full(len(period), UNRESOLVED)
+    for label, attractor in enumerate(attractors):
+        candidates = (labels == UNRESOLVED) & (period == attractor.period) & (winding == attractor.winding)
+        labels[candidates & _near_cycle(theta, theta_dot, attractor.points, match_tol)] = label
+    while True:
+        unmatched = np.flatnonzero(labels == UNRESOLVED)
+        if len(unmatched) == 0:
+            return labels
+        first = unmatched[0]
+        p = period[first]
+        points = np.column_stack([_wrap(theta[first, -p:]), theta_dot[first, -p:]])
+        attractors.append(Attractor(period=int(p), winding=int(winding[first]), points=points))
+        candidates = (labels == UNRESOLVED) & (period == p) & (winding == winding[first])
+        near = _near_cycle(theta, theta_dot, points, match_tol)
+        near[first] = True
+        labels[candidates & near] = len(attractors) - 1
+
+
+def _near_cycle(theta, theta_dot, points, match_tol):
+    d_theta = np.abs(_wrap(theta[:, -1:] - points[None, :, 0]))
+    d_theta_dot = np.abs(theta_dot[:, -1:] - points[None, :, 1])
+    return np.any(np.maximum(d_theta, d_theta_dot) < match_tol, axis=1)
+
+
+def classify_initial_conditions(
+    theta0,
+    theta_dot0,
+    x0=1.0,
+    omega=2.0,
+    d=1.0,
+    g=9.81,
+    damping=0.5,
+    max_periods=400,
+    window_periods=8,
+    max_period=4,
+    tol=1e-6,
+    match_tol=1e-3,
+    t_start=0.0,
+    rtol=1e-8,
+    atol=1e-8,
+    attractors=None,
+):
+    """Return (labels, settle_periods, attractors) for every initial condition (flattened).
+
+    theta0 and theta_dot0 are broadcast together.  The ensemble is checked
+    every window_periods periods (at least 2 * max_period) until all members
+    have settled or max_periods is reached.  attractors is a list extended
+    in place, so separate calls can share labels; settle_periods is the
+    period count at which each member settled (-1 if never).  Members whose
+    trajectory stops being finite are labelled FAILED.
+    """
+    if window_periods < 2 * max_period:
+        raise ValueError(f"window_periods must be at least 2 * max_period = {2 * max_period}")
+    if attractors is None:
+        attractors = []
+    theta0, theta_dot0 = (np.ravel(a).astype(float) for a in np.broadcast_arrays(theta0, theta_dot0))
+    n_members = theta0.size
+    labels = np.full(n_members, UNRESOLVED)
+    settle_periods = np.full(n_members, -1)
+
+    def rhs(t, y, idx):
+        derivatives = _pendulum_derivatives(t, y[0], y[1], x0, omega, d, g)
+        derivatives[1] -= damping * y[1]
+        return derivatives
+
+    remaining = np.arange(n_members)
+    y = np.stack([theta0, theta_dot0])
+    t = float(t_start)
+    n_periods = 0
+    while len(remaining) and n_periods < max_periods:
+        n_window = min(window_periods, max_periods - n_periods)
+        t_eval = t + 2 * np.pi * np.arange(1, n_window + 1)
+        out = _dopri5_ensemble(rhs, t, t_eval, y, rtol=rtol, atol=atol)
+        history = np.concatenate([y[:, :, None], out], axis=2)
+        t = t_eval[-1]
+        n_periods += n_window
+
+        failed = ~np.all(np.isfinite(history[:, :, -1]), axis=0)
+        period, winding = _detect_cycles(history[0], history[1], max_period, tol)
+        settled = (period > 0) & ~failed
+        if settled.any():
+            labels[remaining[settled]] = _match_attractors(
+                history[0][settled], history[1][settled], period[settled], winding[settled], attractors, match_tol
+            )
+            settle_periods[remaining[settled]] = n_periods
+        labels[remaining[failed]] = FAILED
+
+        keep = ~(settled | failed)
+        remaining = remaining[keep]
+        y = history[:, keep, -1]
+
+    return labels, settle_periods, attractors
+
+
+def _refine_axis(values):
+    refined = np.empty(2 * len(values) - 1)
+    refined[::2] = values
+    refined[1::2] = 0.5 * (values[:-1] + values[1:])
+    return refined
+
+
+def basin_map(theta0_values, theta_dot0_values, refine_levels=0, **kwargs):
+    """Label the (theta0_values x theta_dot0_values) grid by attractor, refining near basin boundaries.
+
+    Keyword arguments go to `classify_initial_conditions` (x0, omega, d, g,
+    damping, tolerances, ...).  Each of the refine_levels rounds inserts
+    midpoints along both axes; a new cell is integrated only if the coarse
+    cells around it carry different labels or are unresolved or failed,
+    otherwise it takes their label.  Returns a `BasinMap` whose labels image
+    has shape (len(theta0_values), len(theta_dot0_values)) after the final
+    refinement.
+    """
+    theta0_values = np.asarray(theta0_values, dtype=float)
+    theta_dot0_values = np.asarray(theta_dot0_values, dtype=float)
+    TH, THD = np.meshgrid(theta0_values, theta_dot0_values, indexing="ij")
+    labels, settle, attractors = classify_initial_conditions(TH, THD, **kwargs)
+    result = BasinMap(
+        theta0_values=theta0_values,
+        theta_dot0_values=theta_dot0_values,
+        labels=labels.reshape(TH.shape),
+        settle_periods=settle.reshape(TH.shape),
+        attractors=attractors,
+        n_integrated=TH.size,
+    )
+
+    for _ in range(refine_levels):
+        coarse = result.labels
+        fine_shape = (2 * coarse.shape[0] - 1, 2 * coarse.shape[1] - 1)
+        rows, cols = np.indices(fine_shape)
+        # The (up to four) coarse cells surrounding each fine cell
+        corners = [coarse[r // 2, c // 2] for r in (rows, rows + 1) for c in (cols, cols + 1)]
+        uniform = np.all([corner == corners[0] for corner in corners], axis=0) & (corners[0] >= 0)
+
+        labels = np.where(uniform, corners[0], UNRESOLVED)
+        settle = np.full(fine_shape, -1)
+        labels[::2, ::2] = coarse
+        settle[::2, ::2] = result.settle_periods
+        uniform[::2, ::2] = True
+
+        theta0_values = _refine_axis(result.theta0_values)
+        theta_dot0_values = _refine_axis(result.theta_dot0_values)
+        todo = np.nonzero(~uniform)
+        new_labels, new_settle, _ = classify_initial_conditions(
+            theta0_values[todo[0]], theta_dot0_values[todo[1]], attractors=result.attractors, **kwargs
+        )
+        labels[todo] = new_labels
+        settle[todo] = new_settle
+        result = BasinMap(
+            theta0_values=theta0_values,
+            theta_dot0_values=theta_dot0_values,
+            labels=labels,
+            settle_periods=settle,
+            attractors=result.attractors,
+            n_integrated=result.n_integrated + len(todo[0]),
+        )
+
+    return result
+
+
+__all__ = ["basin_map", "classify_initial_conditions", "BasinMap", "Attractor", "UNRESOLVED", "FAILED"]
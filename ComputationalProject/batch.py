@@ -0,0 +1,220 @@
+"""Run many pendulum trajectories from one parameter table in a single process.
+
+A run table is a CSV file with a header row, a JSON-lines file
+(``.jsonl``/``.ndjson``) with one object per line, or a ``.json`` file
+holding a list of such objects.  Its columns use the `numericalIntegrator` option names
+(x0, omega, theta0, theta_dot0, periods, samples_per_period, d, g, method,
+rtol, atol, step_size, backend, plus an optional free-form name); empty or
+missing fields take the defaults given to `run_batch`.
+
+All results go to one place:
+
+- an ``.npz`` path collects every run as a ``run_00000`` (T, 3) array of
+  (time, theta, theta_dot) rows, written entry by entry, plus a
+  ``runs.json`` manifest of parameters and status;
+- any other path is a directory of ``run_00000.npy`` trajectory files (see
+  `trajectory_io`) with a ``runs.jsonl`` manifest.
+
+A run that raises is recorded as failed in the manifest and the batch goes on.
+"""
+
+import csv
+import json
+import os
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from ComputationalProject.integrator import DEFAULT_STEP_SIZE, compute_pendulum_trajectory
+from ComputationalProject.trajectory_io import save_trajectory
+
+RUN_FIELDS = {
+    "name": str,
+    "x0": float,
+    "omega": float,
+    "theta0": float,
+    "theta_dot0": float,
+    "periods": int,
+    "samples_per_period": int,
+    "d": float,
+    "g": float,
+    "method": str,
+    "rtol": float,
+    "atol": float,
+    "step_size": float,
+    "backend": str,
+}
+
+DEFAULTS = {
+    "x0": 1.0,
+    "omega": 2.0,
+    "theta0": np.pi,
+    "theta_dot0": 2.5,
+    "periods": 50,
+    "samples_per_period": 1,
+    "d": 1.0,
+    "g": 9.81,
+    "method": "RK45",
+    "rtol": 1e-8,
+    "atol": 1e-8,
+    "step_size": DEFAULT_STEP_SIZE,
+    "backend": "scipy",
+}
+
+
+def _parse_run(row, where):
+    if not isinstance(row, dict):
+        raise ValueError(f"{where}: expected an object of run parameters, got {type(row).__name__}")
+    unknown = sorted(set(row) - set(RUN_FIELDS))
+    if unknown:
+        raise ValueError(f"{where}: unknown run parameter(s) {', '.join(unknown)}")
+    run = {}
+    for key, value in row.items():
+        if value is None or value == "":
+            continue
+        run[key] = RUN_FIELDS[key](value)
+    return run
+
+
+def load_run_table(path):
+    """Read a CSV, JSON-lines or JSON run table into a list of parameter dicts (only the fields given)."""
+    runs = []
+    suffix = str(path).lower()
+    with open(path, "r", newline="") as file:
+        if suffix.endswith((".jsonl", ".ndjson")):
+            for line_number, line in enumerate(file, start=1):
+                if line.strip():
+                    runs.append(_parse_run(json.loads(line), f"line {line_number}"))
+        elif suffix.endswith(".json"):
+            table = json.load(file)
+            if not isinstance(table, list):
+                raise ValueError(
+                    f"{path}: a .json run table must be a list of run objects (use .jsonl for one per line)"
+                )
+            runs = [_parse_run(row, f"run {index}") for index, row in enumerate(table)]
+        else:
+            reader = csv.DictReader(file)
+            for row in reader:
+                # DictReader keys surplus fields by None and fills short rows with None values
+                if None in row:
+                    raise ValueError(f"line {reader.line_num}: more fields than header columns")
+                fields = {key.strip(): value.strip() for key, value in row.items() if value is not None}
+                runs.append(_parse_run(fields, f"line {reader.line_num}"))
+    return runs
+
+
+def run_one(index, params):
+    """Integrate one run; returns (index, params, (times, theta, theta_dot) or None, error or None)."""
+    try:
+        n_samples = params["periods"] * params["samples_per_period"] + 1
+        result = compute_pendulum_trajectory(
+            x0=params["x0"],
+            omega=params["omega"],
+            theta0=params["theta0"],
+            theta_dot0=params["theta_dot0"],
+            d=params["d"],
+            g=params["g"],
+            N_periods=params["periods"],
+            t_eval=2 * np.pi / params["samples_per_period"] * np.arange(n_samples),
+            solver_method=params["method"],
+            rtol=params["rtol"],
+            atol=params["atol"],
+            step_size=params["step_size"],
+            backend=params["backend"],
+        )
+        return index, params, result, None
+    except Exception as exc:
+        return index, params, None, f"{type(exc).__name__}: {exc}"
+
+
+class _NpzOutput:
+    def __init__(self, path):
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.archive = zipfile.ZipFile(path, "w", allowZip64=True)
+        self.manifest = []
+
+    def write(self, entry, data):
+        if data is not None:
+            with self.archive.open(entry["key"] + ".npy", "w", force_zip64=True) as file:
+                np.lib.format.write_array(file, data)
+        self.manifest.append(entry)
+
+    def close(self):
+        self.manifest.sort(key=lambda entry: entry["index"])
+        self.archive.writestr("runs.json", json.dumps(self.manifest, indent=2))
+        self.archive.close()
+
+
+class _DirectoryOutput:
+    def __init__(self, path):
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.manifest = open(os.path.join(path, "runs.jsonl"), "w")
+
+    def write(self, entry, data):
+        if data is not None:
+            entry["file"] = entry["key"] + ".npy"
+            save_trajectory(os.path.join(self.path, entry["file"]), *data.T, metadata=entry["params"])
+        self.manifest.write(json.dumps(entry) + "\n")
+        self.manifest.flush()
+
+    def close(self):
+        self.manifest.close()
+
+
+def run_batch(runs, out, defaults=None, max_workers=1, progress=print):
+    """Execute every run in `runs` and collect the results in `out` (.npz file or directory).
+
+    defaults fills parameters a run leaves out (falling back to `DEFAULTS`).
+    max_workers > 1 spreads runs over a process pool; the default runs them
+    in-process.  progress receives status lines (pass None to silence it).
+    Returns a summary dict with n_runs, n_failed, elapsed and runs_per_second.
+    """
+    base = dict(DEFAULTS, **(defaults or {}))
+    jobs = [(index, dict(base, **run)) for index, run in enumerate(runs)]
+    output = _NpzOutput(out) if str(out).lower().endswith(".npz") else _DirectoryOutput(out)
+    report_every = max(1, len(jobs) // 20)
+
+    start = time.perf_counter()
+    n_done = n_failed = 0
+    pool = None
+    try:
+        if max_workers == 1:
+            results = (run_one(index, params) for index, params in jobs)
+        else:
+            pool = ProcessPoolExecutor(max_workers=max_workers)
+            results = (future.result() for future in as_completed([pool.submit(run_one, *job) for job in jobs]))
+
+        for index, params, result, error in results:
+            entry = {"index": index, "key": f"run_{index:05d}", "params": params, "error": error}
+            data = None if result is None else np.column_stack(result)
+            output.write(entry, data)
+            n_done += 1
+            n_failed += error is not None
+            if progress and (n_done % report_every == 0 or n_done == len(jobs)):
+                elapsed = time.perf_counter() - start
+                progress(f"[{n_done}/{len(jobs)}] {n_done / elapsed:.1f} runs/s, {n_failed} failed")
+    finally:
+        output.close()
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    elapsed = time.perf_counter() - start
+    summary = {
+        "n_runs": len(jobs),
+        "n_failed": n_failed,
+        "elapsed": elapsed,
+        "runs_per_second": len(jobs) / elapsed if elapsed > 0 else float("inf"),
+    }
+    if progress:
+        progress(
+            f"Finished {summary['n_runs']} runs ({n_failed} failed) in {elapsed:.2f} s: "
+            f"{summary['runs_per_second']:.1f} runs/s, results in {out}"
+        )
+    return summary
+
+
+__all__ = ["load_run_table", "run_batch", "run_one", "RUN_FIELDS", "DEFAULTS"]
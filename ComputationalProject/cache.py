@@ -0,0 +1,230 @@
+"""Content-addressed cache for pendulum trajectories.
+
+`compute_pendulum_trajectory` looks every run up here before integrating, so
+repeated runs with identical physical and solver parameters are free.  There
+are two layers:
+
+- an in-process LRU of recently used results (checked first), and
+- an on-disk store with one ``<key>.npy`` file per trajectory, bounded in
+  total size and evicted least-recently-used first.
+
+The on-disk layer lives in ``$PHYS111_CACHE_DIR`` (default
+``~/.cache/phys111/trajectories``) and holds at most ``$PHYS111_CACHE_MAX_BYTES``
+bytes (default 512 MiB).  Set ``PHYS111_CACHE=0`` to turn caching off, or call
+`configure_cache` from code.
+
+Each process keeps an index of the disk layer so a store does not rescan the
+directory.  When several processes (sweep or batch workers) share it, a
+change in the directory's modification time since this process last wrote
+shows that another one added or removed entries, and the index is rebuilt
+before evicting, so the bound holds for the directory as a whole.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+
+import numpy as np
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "phys111", "trajectories")
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+DEFAULT_MEMORY_ITEMS = 32
+# Part of every key: bump whenever a change to the integrators alters results,
+# so trajectories computed by older code are never served again.
+CACHE_VERSION = 1
+
+
+def trajectory_key(
+    x0, omega, theta0, theta_dot0, d, g, t_start, t_eval, solver_method, rtol, atol, step_size=None, backend=None
+):
+    """Return the hex digest identifying one trajectory computation.
+
+    step_size (fixed-step methods only) and backend (non-default backends only)
+    are left out of the key when None.  `CACHE_VERSION` is always included.
+    """
+    t_eval = np.ascontiguousarray(t_eval, dtype=np.float64)
+    params = {
+        "cache_version": CACHE_VERSION,
+        "x0": float(x0),
+        "omega": float(omega),
+        "theta0": float(theta0),
+        "theta_dot0": float(theta_dot0),
+        "d": float(d),
+        "g": float(g),
+        "t_start": float(t_start),
+        "t_eval": hashlib.sha256(t_eval.tobytes()).hexdigest(),
+        "solver_method": getattr(solver_method, "__name__", str(solver_method)),
+        "rtol": float(rtol),
+        "atol": float(atol),
+    }
+    if step_size is not None:
+        params["step_size"] = float(step_size)
+    if backend is not None:
+        params["backend"] = str(backend)
+    return hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()
+
+
+class TrajectoryCache:
+    """Two-level (memory, then disk) LRU cache of (times, theta_values, theta_dot_values)."""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES, memory_items=DEFAULT_MEMORY_ITEMS):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.memory_items = memory_items
+        self._memory = OrderedDict()
+        # Disk entries (key -> size in bytes), least recently used first.  Built
+        # here and kept up to date, so put() rescans the directory only when
+        # another process changed it (see _dir_stamp).
+        self._disk = OrderedDict()
+        self._disk_bytes = 0
+        self._stamp = None
+        self._scan_disk()
+
+    def _dir_stamp(self):
+        try:
+            return os.stat(self.cache_dir).st_mtime_ns
+        except OSError:
+            return None
+
+    def _scan_disk(self):
+        self._disk.clear()
+        self._disk_bytes = 0
+        # Taken before listing, so changes made during the scan trigger another one
+        self._stamp = self._dir_stamp()
+        try:
+            names = [n for n in os.listdir(self.cache_dir) if n.endswith(".npy")]
+        except FileNotFoundError:
+            return
+        entries = []
+        for name in names:
+            try:
+                st = os.stat(os.path.join(self.cache_dir, name))
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, name[: -len(".npy")], st.st_size))
+        for _, key, size in sorted(entries):
+            self._disk[key] = size
+        self._disk_bytes = sum(self._disk.values())
+
+    def _index(self, key, size):
+        self._disk_bytes += size - self._disk.pop(key, 0)
+        self._disk[key] = size
+
+    def _unindex(self, key):
+        self._disk_bytes -= self._disk.pop(key, 0)
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key + ".npy")
+
+    def get(self, key):
+        """Return a fresh copy of the cached trajectory for key, or None on a miss."""
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return tuple(a.copy() for a in self._memory[key])
+
+        path = self._path(key)
+        try:
+            data = np.load(path)
+        except (FileNotFoundError, ValueError, OSError):
+            return None
+        try:
+            os.utime(path)  # mark as recently used for LRU eviction
+        except OSError:
+            pass
+        self._index(key, self._disk.get(key) or os.path.getsize(path))
+        result = (data[0], data[1], data[2])
+        self._remember(key, result)
+        return tuple(a.copy() for a in result)
+
+    def put(self, key, times, theta_values, theta_dot_values):
+        """Store a trajectory under key in both layers, then enforce the size bound."""
+        data = np.vstack([times, theta_values, theta_dot_values]).astype(np.float64, copy=False)
+        self._remember(key, (data[0].copy(), data[1].copy(), data[2].copy()))
+
+        if self.max_bytes <= 0 or data.nbytes > self.max_bytes:
+            # Too big for the disk layer: writing it would only evict everything else, itself included
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Entries added or removed by other processes since our last change
+        shared_changes = self._dir_stamp() != self._stamp
+        # Write to a temporary file and rename so concurrent readers (e.g. sweep
+        # workers) never see a partially written entry.
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                np.save(file, data)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        if shared_changes:
+            self._scan_disk()
+        else:
+            self._index(key, os.path.getsize(self._path(key)))
+            self._stamp = self._dir_stamp()
+        self.evict()
+
+    def _remember(self, key, result):
+        if self.memory_items <= 0:
+            return
+        self._memory[key] = result
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+
+    def evict(self):
+        """Delete least-recently-used disk entries until the store fits in max_bytes."""
+        if self._disk_bytes <= self.max_bytes:
+            return
+        while self._disk_bytes > self.max_bytes and len(self._disk) > 1:
+            key = next(iter(self._disk))
+            try:
+                os.remove(self._path(key))
+            except FileNotFoundError:
+                pass
+            self._unindex(key)
+        self._stamp = self._dir_stamp()
+
+    def clear(self):
+        """Drop every entry from memory and disk."""
+        self._memory.clear()
+        self._disk.clear()
+        self._disk_bytes = 0
+        if not os.path.isdir(self.cache_dir):
+            return
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".npy"):
+                os.remove(os.path.join(self.cache_dir, name))
+        self._stamp = self._dir_stamp()
+
+
+_default_cache = None
+_configured = False
+
+
+def configure_cache(cache_dir=None, max_bytes=None, memory_items=None, enabled=True):
+    """Replace the process-wide default cache; enabled=False turns caching off."""
+    global _default_cache, _configured
+    _configured = True
+    if not enabled:
+        _default_cache = None
+        return None
+    _default_cache = TrajectoryCache(
+        cache_dir=cache_dir or os.environ.get("PHYS111_CACHE_DIR", DEFAULT_CACHE_DIR),
+        max_bytes=int(os.environ.get("PHYS111_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES)) if max_bytes is None else max_bytes,
+        memory_items=DEFAULT_MEMORY_ITEMS if memory_items is None else memory_items,
+    )
+    return _default_cache
+
+
+def get_default_cache():
+    """Return the process-wide cache (built from the environment on first use), or None if disabled."""
+    if not _configured:
+        configure_cache(enabled=os.environ.get("PHYS111_CACHE", "1") != "0")
+    return _default_cache
+
+
+__all__ = ["TrajectoryCache", "trajectory_key", "configure_cache", "get_default_cache"]
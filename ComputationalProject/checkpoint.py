@@ -0,0 +1,153 @@
+"""Checkpoints for stored trajectories, so long runs can be extended and resumed.
+
+A checkpoint lives next to the trajectory file as ``<filename>.ckpt.json``.
+It records the run parameters and the final state (t, theta, theta_dot) at
+full precision, independent of the output format, together with how many
+rows and periods the file holds.  `extend` resumes integration from that
+state, appends the new samples and rewrites the checkpoint after every chunk,
+so an interrupted run loses at most one chunk and can simply be extended
+again.
+"""
+
+import json
+import os
+import tempfile
+
+import numpy as np
+
+from ComputationalProject.integrator import DEFAULT_STEP_SIZE, iter_pendulum_trajectory
+from ComputationalProject.trajectory_io import append_trajectory, is_binary_path, save_trajectory, truncate_trajectory
+
+# Parameters that must match for a checkpointed run to be continued.
+RUN_PARAMS = ("x0", "omega", "d", "g", "samples_per_period", "solver_method", "rtol", "atol", "step_size", "backend")
+
+
+def checkpoint_path(filename):
+    """Return the path of the checkpoint stored alongside a trajectory file."""
+    return str(filename) + ".ckpt.json"
+
+
+def read_checkpoint(filename):
+    """Load the checkpoint of a trajectory file (raises FileNotFoundError if there is none)."""
+    with open(checkpoint_path(filename), "r") as file:
+        return json.load(file)
+
+
+def write_checkpoint(filename, params, t, theta, theta_dot, n_rows, n_periods):
+    """Atomically write the checkpoint for a trajectory file and return it as a dict."""
+    checkpoint = {
+        "params": params,
+        "t": float(t),
+        "theta": float(theta),
+        "theta_dot": float(theta_dot),
+        "n_rows": int(n_rows),
+        "n_periods": int(n_periods),
+        # Byte size at this point, so a CSV can be cut back after an interruption
+        "size": os.path.getsize(filename),
+    }
+    directory = os.path.dirname(os.path.abspath(filename))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "w") as file:
+        json.dump(checkpoint, file, indent=2, sort_keys=True)
+    os.replace(tmp_path, checkpoint_path(filename))
+    return checkpoint
+
+
+def run_params(
+    x0=1.0,
+    omega=2.0,
+    d=1.0,
+    g=9.81,
+    samples_per_period=1,
+    solver_method="RK45",
+    rtol=1e-8,
+    atol=1e-8,
+    step_size=DEFAULT_STEP_SIZE,
+    backend="scipy",
+):
+    """Collect the parameters that define a checkpointed run into a dict."""
+    return {
+        "x0": float(x0),
+        "omega": float(omega),
+        "d": float(d),
+        "g": float(g),
+        "samples_per_period": int(samples_per_period),
+        "solver_method": solver_method,
+        "rtol": float(rtol),
+        "atol": float(atol),
+        "step_size": float(step_size),
+        "backend": backend,
+    }
+
+
+def start_trajectory(filename, params, theta0=np.pi, theta_dot0=2.5, t_start=0.0, metadata=None):
+    """Create a trajectory file holding only the initial sample, plus its checkpoint."""
+    meta = dict(params, theta0=theta0, theta_dot0=theta_dot0)
+    meta.update(metadata or {})
+    save_trajectory(filename, [t_start], [theta0], [theta_dot0], metadata=meta)
+    return write_checkpoint(filename, params, t_start, theta0, theta_dot0, n_rows=1, n_periods=0)
+
+
+def extend(trajectory, N_more_periods, chunk_periods=50):
+    """Continue a checkpointed trajectory file by N_more_periods drive periods.
+
+    Integration restarts from the checkpointed state and the new samples are
+    appended to the file, whatever its format.  Rows written after the last
+    checkpoint (e.g. by an interrupted run) are discarded first.  Returns the
+    updated checkpoint.
+    """
+    checkpoint = read_checkpoint(trajectory)
+    truncate_trajectory(trajectory, checkpoint["n_rows"], None if is_binary_path(trajectory) else checkpoint["size"])
+
+    params = checkpoint["params"]
+    samples_per_period = params["samples_per_period"]
+    chunks = iter_pendulum_trajectory(
+        x0=params["x0"],
+        omega=params["omega"],
+        theta0=checkpoint["theta"],
+        theta_dot0=checkpoint["theta_dot"],
+        d=params["d"],
+        g=params["g"],
+        N_periods=N_more_periods,
+        samples_per_period=samples_per_period,
+        chunk_periods=chunk_periods,
+        t_start=checkpoint["t"],
+        solver_method=params["solver_method"],
+        rtol=params["rtol"],
+        atol=params["atol"],
+        step_size=params["step_size"],
+        backend=params.get("backend", "scipy"),
+    )
+
+    n_rows = checkpoint["n_rows"]
+    first = True
+    for times, theta_values, theta_dot_values in chunks:
+        if first:
+            # The first sample repeats the checkpointed state, which is already stored
+            times, theta_values, theta_dot_values = times[1:], theta_values[1:], theta_dot_values[1:]
+            first = False
+        if len(times) == 0:
+            continue
+        append_trajectory(trajectory, times, theta_values, theta_dot_values)
+        n_rows += len(times)
+        checkpoint = write_checkpoint(
+            trajectory,
+            params,
+            times[-1],
+            theta_values[-1],
+            theta_dot_values[-1],
+            n_rows=n_rows,
+            n_periods=(n_rows - 1) // samples_per_period,
+        )
+    return checkpoint
+
+
+__all__ = [
+    "extend",
+    "start_trajectory",
+    "run_params",
+    "read_checkpoint",
+    "write_checkpoint",
+    "checkpoint_path",
+    "RUN_PARAMS",
+]
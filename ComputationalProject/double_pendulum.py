@@ -0,0 +1,211 @@
+"""Conservative double pendulum (the model of Pset6/6c.py) as library functions.
+
+States are ordered (theta1, omega1, theta2, omega2) as in 6c.  Besides the
+velocity-form equations of motion this module provides the canonical
+(theta, p) form of the Hamiltonian, which the symplectic integrators in
+`ComputationalProject.symplectic` need to conserve energy over long runs.
+Every function accepts scalars or arrays (ensembles) for the state.
+"""
+
+import numpy as np
+
+from ComputationalProject.symplectic import implicit_midpoint, stormer_verlet
+
+
+def hamiltonian(theta1, theta2, omega1, omega2, g=9.81, L1=1.0, L2=1.0, m1=1.0, m2=1.0):
+    """Total energy H in terms of angles and angular velocities (same as 6c's hamiltonian)."""
+    delta_theta = theta2 - theta1
+    return (
+        0.5 * (m1 + m2) * L1**2 * omega1**2
+        + 0.5 * m2 * L2**2 * omega2**2
+        + m2 * L1 * L2 * omega1 * omega2 * np.cos(delta_theta)
+        - (m1 + m2) * g * L1 * np.cos(theta1)
+        - m2 * g * L2 * np.cos(theta2)
+    )
+
+
+def generate_initial_conditions(
+    H_target,
+    n,
+    rng=None,
+    omega1_range=(-3.0, 3.0),
+    oversample=2.0,
+    max_rounds=100,
+    g=9.81,
+    L1=1.0,
+    L2=1.0,
+    m1=1.0,
+    m2=1.0,
+):
+    """Draw exactly n states (theta1, omega1, theta2, omega2) on the energy shell H = H_target.
+
+    theta1, theta2 are uniform on [-pi, pi) and omega1 uniform on omega1_range;
+    omega2 is then a randomly chosen root of the quadratic H(omega2) = H_target.
+    Candidates are drawn in vectorized batches, sized from the acceptance rate
+    seen so far, until n have a real root.  rng is a numpy.random.Generator
+    (or a seed); pass a seeded one for reproducible ensembles.  Returns an
+    array of shape (n, 4).
+    """
+    rng = np.random.default_rng(rng)
+    H_min = -(m1 + m2) * g * L1 - m2 * g * L2
+    if H_target < H_min:
+        raise ValueError(f"H_target={H_target} is below the minimum energy {H_min} of the double pendulum")
+
+    A = 0.5 * m2 * L2**2
+    states = np.empty((n, 4))
+    n_filled = 0
+    acceptance = 1.0
+    for _ in range(max_rounds):
+        if n_filled == n:
+            break
+        batch = max(16, int(np.ceil((n - n_filled) * oversample / acceptance)))
+        theta1 = rng.uniform(-np.pi, np.pi, batch)
+        theta2 = rng.uniform(-np.pi, np.pi, batch)
+        omega1 = rng.uniform(omega1_range[0], omega1_range[1], batch)
+        sign = rng.choice([-1.0, 1.0], batch)
+
+        B = m2 * L1 * L2 * omega1 * np.cos(theta2 - theta1)
+        C = (
+            0.5 * (m1 + m2) * L1**2 * omega1**2
+            - (m1 + m2) * g * L1 * np.cos(theta1)
+            - m2 * g * L2 * np.cos(theta2)
+            - H_target
+        )
+        discriminant = B**2 - 4 * A * C
+        valid = np.flatnonzero(discriminant >= 0)
+        acceptance = max(len(valid) / batch, 1.0 / batch)
+
+        take = valid[: n - n_filled]
+        omega2 = (-B[take] + sign[take] * np.sqrt(discriminant[take])) / (2 * A)
+        states[n_filled : n_filled + len(take)] = np.column_stack([theta1[take], omega1[take], theta2[take], omega2])
+        n_filled += len(take)
+
+    if n_filled < n:
+        raise RuntimeError(
+            f"only {n_filled} of {n} initial conditions found on H={H_target} after {max_rounds} batches; "
+            "widen omega1_range"
+        )
+    return states
+
+
+def double_pendulum_rhs(t, y, g=9.81, L1=1.0, L2=1.0, m1=1.0, m2=1.0):
+    """solve_ivp-compatible equations of motion; y has shape (4,) or (4, k)."""
+    theta1, omega1, theta2, omega2 = y
+    delta_theta = theta2 - theta1
+    sin_delta = np.sin(delta_theta)
+    cos_delta = np.cos(delta_theta)
+    sin_theta1 = np.sin(theta1)
+    sin_theta2 = np.sin(theta2)
+
+    denom1 = (m1 + m2) * L1 - m2 * L1 * cos_delta**2
+    denom2 = (L2 / L1) * denom1
+
+    domega1_dt = (
+        m2 * L1 * omega1**2 * sin_delta * cos_delta
+        + m2 * g * sin_theta2 * cos_delta
+        + m2 * L2 * omega2**2 * sin_delta
+        - (m1 + m2) * g * sin_theta1
+    ) / denom1
+    domega2_dt = (
+        -m2 * L2 * omega2**2 * sin_delta * cos_delta
+        + (m1 + m2) * (g * sin_theta1 * cos_delta - L1 * omega1**2 * sin_delta - g * sin_theta2)
+    ) / denom2
+    return np.array([omega1, domega1_dt, omega2, domega2_dt])
+
+
+def _mass_matrix(theta1, theta2, L1, L2, m1, m2):
+    a = (m1 + m2) * L1**2
+    b = m2 * L2**2
+    c = m2 * L1 * L2 * np.cos(theta2 - theta1)
+    return a, b, c
+
+
+def to_canonical(theta1, omega1, theta2, omega2, g=9.81, L1=1.0, L2=1.0, m1=1.0, m2=1.0):
+    """Return the conjugate momenta (p1, p2) for the given angular velocities."""
+    a, b, c = _mass_matrix(theta1, theta2, L1, L2, m1, m2)
+    return a * omega1 + c * omega2, c * omega1 + b * omega2
+
+
+def from_canonical(theta1, p1, theta2, p2, g=9.81, L1=1.0, L2=1.0, m1=1.0, m2=1.0):
+    """Return the angular velocities (omega1, omega2) for the given momenta."""
+    a, b, c = _mass_matrix(theta1, theta2, L1, L2, m1, m2)
+    det = a * b - c**2
+    return (b * p1 - c * p2) / det, (a * p2 - c * p1) / det
+
+
+def hamiltonian_gradients(q, p, g=9.81, L1=1.0, L2=1.0, m1=1.0, m2=1.0):
+    """Return (dH/dq, dH/dp) for q = (theta1, theta2), p = (p1, p2), each stacked on axis 0."""
+    theta1, theta2 = q[0], q[1]
+    omega1, omega2 = from_canonical(theta1, p[0], theta2, p[1], g=g, L1=L1, L2=L2, m1=m1, m2=m2)
+    # d(kinetic)/d(theta) at fixed p is minus the derivative at fixed omega.
+    coupling = m2 * L1 * L2 * omega1 * omega2 * np.sin(theta2 - theta1)
+    dH_dq = np.array([
+        -coupling + (m1 + m2) * g * L1 * np.sin(theta1),
+        coupling + m2 * g * L2 * np.sin(theta2),
+    ])
+    return dH_dq, np.array([omega1, omega2])
+
+
+def hamilton_equations(t, z, g=9.81, L1=1.0, L2=1.0, m1=1.0, m2=1.0):
+    """Hamilton's equations for z = (theta1, theta2, p1, p2); returns (dH/dp, -dH/dq) stacked like z."""
+    dH_dq, dH_dp = hamiltonian_gradients(z[:2], z[2:], g=g, L1=L1, L2=L2, m1=m1, m2=m2)
+    return np.concatenate([dH_dp, -dH_dq])
+
+
+def integrate_double_pendulum(
+    y0,
+    step_size,
+    n_steps,
+    method="stormer_verlet",
+    t_start=0.0,
+    record_every=1,
+    g=9.81,
+    L1=1.0,
+    L2=1.0,
+    m1=1.0,
+    m2=1.0,
+):
+    """Integrate an ensemble of double pendulums with a fixed-step symplectic method.
+
+    y0 holds (theta1, omega1, theta2, omega2) with shape (4,) or (4, k).  The
+    step is taken in canonical (theta, p) variables, where both methods are
+    symplectic, and converted back.  Returns (times, y) with y shaped
+    y0.shape + (n_records,).
+    """
+    params = dict(g=g, L1=L1, L2=L2, m1=m1, m2=m2)
+    theta1, omega1, theta2, omega2 = np.asarray(y0, dtype=float)
+    p1, p2 = to_canonical(theta1, omega1, theta2, omega2, **params)
+    q0 = np.array([theta1, theta2])
+    p0 = np.array([p1, p2])
+
+    if method == "stormer_verlet":
+        times, q, p = stormer_verlet(
+            lambda t, q, p: hamiltonian_gradients(q, p, **params)[1],
+            lambda t, q, p: -hamiltonian_gradients(q, p, **params)[0],
+            t_start,
+            q0,
+            p0,
+            step_size,
+            n_steps,
+            record_every=record_every,
+        )
+    elif method == "implicit_midpoint":
+        times, z = implicit_midpoint(lambda t, z: hamilton_equations(t, z, **params), t_start, np.concatenate([q0, p0]), step_size, n_steps, record_every=record_every)
+        q, p = z[:2], z[2:]
+    else:
+        raise ValueError(f"unknown method {method!r}; expected 'stormer_verlet' or 'implicit_midpoint'")
+
+    omega1, omega2 = from_canonical(q[0], p[0], q[1], p[1], **params)
+    return times, np.array([q[0], omega1, q[1], omega2])
+
+
+__all__ = [
+    "hamiltonian",
+    "generate_initial_conditions",
+    "double_pendulum_rhs",
+    "to_canonical",
+    "from_canonical",
+    "hamiltonian_gradients",
+    "hamilton_equations",
+    "integrate_double_pendulum",
+]
@@ -0,0 +1,257 @@
+"""Headless export of pendulum animations to MP4, GIF or numbered PNG frames.
+
+Frames are drawn with matplotlib's Agg canvas, so no display is needed.  Each
+worker process keeps one canvas with the static background (guide line)
+cached via `copy_from_bbox`; a frame only restores that background and redraws
+the rod and bob artists.  Frames are rendered in contiguous chunks across a
+`concurrent.futures` process pool and consumed strictly in order, with only a
+bounded number of chunks in flight, so an animation is never held in memory
+all at once:
+
+- MP4 and GIF frames are piped as raw RGB into ``ffmpeg`` as they arrive
+  (GIF falls back to Pillow, which buffers the palette frames, when ffmpeg is
+  not installed);
+- PNG frames are written by the workers themselves as ``frame_00000.png``, ...
+
+The geometry matches the pygame visualizer: frames are
+`visualizer.precompute_frames` positions on a screen-sized canvas.
+
+Usage:
+    python -m ComputationalProject.export run1.npy run2.npy --format mp4 --outdir videos
+"""
+
+import argparse
+import itertools
+import os
+import shutil
+import subprocess
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from ComputationalProject.sweep import chunk_bounds
+from ComputationalProject.visualizer import load_theta_series, precompute_frames
+
+FORMATS = ("mp4", "gif", "png")
+
+WHITE = "#ffffff"
+LIGHT_GREY = "#c8c8c8"
+BLUE = "#3232c8"
+
+
+class FrameRenderer:
+    """Offscreen Agg canvas that draws the pendulum at given screen positions."""
+
+    def __init__(self, screen=(800, 600), pivot=None, x0=300, radius=10, dpi=100):
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        width, height = screen
+        self.pivot = pivot if pivot is not None else (width // 2, height // 2)
+        self.figure = Figure(figsize=(width / dpi, height / dpi), dpi=dpi, facecolor=WHITE)
+        self.canvas = FigureCanvasAgg(self.figure)
+        ax = self.figure.add_axes([0, 0, 1, 1])
+        # Axes in screen pixels with y pointing down, as in pygame
+        ax.set_xlim(0, width)
+        ax.set_ylim(height, 0)
+        ax.set_axis_off()
+        ax.plot([self.pivot[0] - x0, self.pivot[0] + x0], [self.pivot[1]] * 2, color=LIGHT_GREY, linewidth=1.5)
+
+        # Points per pixel, so the bob's marker size is given in pixels
+        pt = 72.0 / dpi
+        (self.rod,) = ax.plot([], [], color=BLUE, linewidth=4 * pt, animated=True)
+        (self.bob,) = ax.plot([], [], "o", color=BLUE, markersize=2 * radius * pt, animated=True)
+        self.ax = ax
+
+        self.canvas.draw()
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self.size = self.canvas.get_width_height()
+
+    def render(self, x, y):
+        """Draw the pendulum with its bob at (x, y) and return the frame as an (H, W, 3) uint8 array."""
+        self.canvas.restore_region(self.background)
+        self.rod.set_data([self.pivot[0], x], [self.pivot[1], y])
+        self.bob.set_data([x], [y])
+        self.ax.draw_artist(self.rod)
+        self.ax.draw_artist(self.bob)
+        return np.asarray(self.canvas.buffer_rgba())[..., :3].copy()
+
+
+_renderer = None
+
+
+def _init_renderer(screen, pivot, x0, radius):
+    global _renderer
+    _renderer = FrameRenderer(screen=screen, pivot=pivot, x0=x0, radius=radius)
+
+
+def _render_chunk(start, x_positions, y_positions, png_dir=None):
+    """Render one chunk of frames: raw RGB bytes, or the number of PNGs written to png_dir."""
+    if png_dir is not None:
+        from matplotlib.image import imsave
+
+        for i, (x, y) in enumerate(zip(x_positions, y_positions)):
+            imsave(os.path.join(png_dir, f"frame_{start + i:05d}.png"), _renderer.render(x, y))
+        return len(x_positions)
+    return b"".join(_renderer.render(x, y).tobytes() for x, y in zip(x_positions, y_positions))
+
+
+def _ordered_results(pool, fn, args_list, window):
+    """Yield fn(*args) for each args in order, keeping at most `window` tasks in flight."""
+    args_iter = iter(args_list)
+    pending = deque(pool.submit(fn, *args) for args in itertools.islice(args_iter, window))
+    while pending:
+        result = pending.popleft().result()
+        args = next(args_iter, None)
+        if args is not None:
+            pending.append(pool.submit(fn, *args))
+        yield result
+
+
+def _ffmpeg_command(path, fmt, size, fps):
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        return None
+    width, height = size
+    command = [ffmpeg, "-loglevel", "error", "-y", "-f", "rawvideo", "-pix_fmt", "rgb24"]
+    command += ["-s", f"{width}x{height}", "-r", str(fps), "-i", "-"]
+    if fmt == "mp4":
+        command += ["-vcodec", "libx264", "-pix_fmt", "yuv420p"]
+    return command + [path]
+
+
+def export_animation(
+    trajectory,
+    out,
+    fmt=None,
+    duration=20.0,
+    fps=30,
+    d=200.0,
+    x0=300,
+    screen=(800, 600),
+    radius=10,
+    max_workers=None,
+    chunk_frames=64,
+):
+    """Render a trajectory file (or theta array) to an MP4/GIF file or a directory of PNG frames.
+
+    fmt defaults to the extension of `out` ("png" if it has none).  The
+    animation has exactly duration*fps frames.  max_workers defaults to
+    os.cpu_count(); max_workers=1 renders in-process without a pool.
+    Returns the number of frames written.
+    """
+    if fmt is None:
+        fmt = os.path.splitext(str(out))[1].lstrip(".").lower() or "png"
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format {fmt!r}; expected one of {FORMATS}")
+
+    theta_values = load_theta_series(trajectory) if isinstance(trajectory, (str, os.PathLike)) else trajectory
+    screen = tuple(int(s) for s in screen)
+    pivot = (screen[0] // 2, screen[1] // 2)
+    x_positions, y_positions = precompute_frames(theta_values, duration, fps, pivot, d)
+    n_frames = len(x_positions)
+
+    png_dir = None
+    if fmt == "png":
+        png_dir = str(out)
+        os.makedirs(png_dir, exist_ok=True)
+    else:
+        out_dir = os.path.dirname(os.path.abspath(out))
+        os.makedirs(out_dir, exist_ok=True)
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    tasks = [
+        (start, x_positions[start:stop], y_positions[start:stop], png_dir)
+        for start, stop in chunk_bounds(n_frames, chunk_frames)
+    ]
+    init_args = (screen, pivot, x0, radius)
+
+    if max_workers == 1:
+        _init_renderer(*init_args)
+        _write_frames(out, fmt, (_render_chunk(*task) for task in tasks), screen, fps)
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_renderer, initargs=init_args) as pool:
+            _write_frames(out, fmt, _ordered_results(pool, _render_chunk, tasks, window=2 * max_workers), screen, fps)
+    return n_frames
+
+
+def _write_frames(out, fmt, chunks, size, fps):
+    if fmt == "png":
+        for _ in chunks:  # the workers have already written the files
+            pass
+        return
+
+    command = _ffmpeg_command(str(out), fmt, size, fps)
+    if command is None:
+        if fmt == "mp4":
+            raise RuntimeError("MP4 export needs ffmpeg on PATH; use --format gif or png instead")
+        _write_gif_pillow(out, chunks, size, fps)
+        return
+
+    process = subprocess.Popen(command, stdin=subprocess.PIPE)
+    try:
+        for chunk in chunks:
+            process.stdin.write(chunk)
+    finally:
+        process.stdin.close()
+        returncode = process.wait()
+    if returncode != 0:
+        raise RuntimeError(f"ffmpeg exited with status {returncode} while writing {out}")
+
+
+def _write_gif_pillow(out, chunks, size, fps):
+    from PIL import Image
+
+    width, height = size
+    frame_bytes = width * height * 3
+
+    def frames():
+        for chunk in chunks:
+            for offset in range(0, len(chunk), frame_bytes):
+                image = Image.frombytes("RGB", (width, height), chunk[offset : offset + frame_bytes])
+                yield image.quantize(colors=16)
+
+    frame_iter = frames()
+    first = next(frame_iter)
+    first.save(out, save_all=True, append_images=frame_iter, duration=1000.0 / fps, loop=0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render pendulum animations without a display")
+    parser.add_argument("inputs", nargs="+", help="Trajectory files: CSV (Time,Theta,Theta Dot) or binary .npy")
+    parser.add_argument("--format", choices=FORMATS, default="mp4", help="Output format (png writes a frame directory)")
+    parser.add_argument("--outdir", default="figures/animations", help="Directory for the rendered outputs")
+    parser.add_argument("--duration", type=float, default=20.0, help="Animation length in seconds")
+    parser.add_argument("--fps", type=int, default=30, help="Frames per second")
+    parser.add_argument("--d", type=float, default=200.0, help="Pendulum rod length in pixels")
+    parser.add_argument("--x0", type=int, default=300, help="Half-width of horizontal guide line in pixels")
+    parser.add_argument("--screen", type=int, nargs=2, default=[800, 600], help="Frame size W H")
+    parser.add_argument("--workers", type=int, default=None, help="Rendering processes (default: all cores)")
+    parser.add_argument("--chunk-frames", type=int, default=64, help="Frames rendered per task")
+    args = parser.parse_args()
+
+    for path in args.inputs:
+        stem = os.path.splitext(os.path.basename(path))[0]
+        out = os.path.join(args.outdir, stem if args.format == "png" else f"{stem}.{args.format}")
+        n_frames = export_animation(
+            path,
+            out,
+            fmt=args.format,
+            duration=args.duration,
+            fps=args.fps,
+            d=args.d,
+            x0=args.x0,
+            screen=args.screen,
+            max_workers=args.workers,
+            chunk_frames=args.chunk_frames,
+        )
+        print(f"Rendered {n_frames} frames of {path} to {out}")
+
+
+__all__ = ["FrameRenderer", "export_animation", "FORMATS"]
+
+
+if __name__ == "__main__":
+    main()
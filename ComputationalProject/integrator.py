@@ -1,13 +1,27 @@
+import time
+
 import numpy as np
-from scipy.integrate import solve_ivp
+
+from ComputationalProject.cache import get_default_cache, trajectory_key
+from ComputationalProject.symplectic import STEP_METHODS, integrate_to_times
+from ComputationalProject.telemetry import InstrumentedODE, SolverStats, solve_with_stats
 
 
-def pendulum_ode_factory(x0, omega, d=1.0, g=9.81):
+def pendulum_ode_factory(x0, omega, d=1.0, g=9.81, vectorized=False):
     """Return an ODE function f(t, y) that computes the pendulum acceleration.
 
     The returned function uses outer-scope x0, omega, d, and g to compute the
     second derivative. It's written to be compatible with scipy.integrate.solve_ivp.
+
+    With vectorized=True the function accepts y of shape (2,) or (2, k) and
+    returns an ndarray of the same shape, as solve_ivp(..., vectorized=True) expects.
     """
+    if vectorized:
+        def pendulum_ode_vectorized(t, y):
+            return _pendulum_derivatives(t, y[0], y[1], x0, omega, d, g)
+
+        return pendulum_ode_vectorized
+
     def pendulum_ode(t, y):
         theta = y[0]
         theta_dot = y[1]
@@ -22,6 +36,166 @@ def pendulum_ode_factory(x0, omega, d=1.0, g=9.81):
     return pendulum_ode
 
 
+def pendulum_jacobian_factory(x0, omega, d=1.0, g=9.81):
+    """Return the analytic Jacobian J(t, y) of the pendulum ODE for implicit solvers.
+
+    Pass it as jac= to solve_ivp so Radau/BDF/LSODA do not have to build the
+    Jacobian by finite differences.
+    """
+    def pendulum_jacobian(t, y):
+        d_theta, d_theta_dot = _pendulum_jacobian_terms(t, y[0], y[1], x0, omega, d, g)
+        return np.array([[0.0, 1.0], [d_theta, d_theta_dot]])
+
+    return pendulum_jacobian
+
+
+def _pendulum_jacobian_terms(t, theta, theta_dot, x0, omega, d, g):
+    """Partial derivatives of theta_double_dot w.r.t. theta and theta_dot; arguments may be ndarrays."""
+    sin_theta = np.sin(theta)
+    cos_theta = np.cos(theta)
+    cos_t = np.cos(t)
+    d_theta = (
+        cos_theta * (g - theta_dot * omega * x0 * cos_t)
+        + omega * x0 * (cos_t * cos_theta - omega * sin_theta * np.sin(t))
+    ) / d
+    d_theta_dot = -sin_theta * omega * x0 * cos_t / d
+    return d_theta, d_theta_dot
+
+
+def _pendulum_derivatives(t, theta, theta_dot, x0, omega, d, g):
+    """Array form of the pendulum equations; every argument may be an ndarray.
+
+    theta and theta_dot must share a shape; returns (theta_dot, theta_double_dot)
+    stacked along a new first axis.  sin(theta) and cos(t) are computed once.
+    """
+    sin_theta = np.sin(theta)
+    cos_t = np.cos(t)
+    numerator = (
+        sin_theta * (g - theta_dot * omega * x0 * cos_t)
+        + omega * x0 * (omega * np.cos(theta) * np.sin(t) + cos_t * sin_theta)
+    )
+    return np.array([theta_dot, numerator / d])
+
+
+# Dormand-Prince 5(4) tableau, identical to the one used by solve_ivp's RK45.
+_DP_C = np.array([0.0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1.0])
+_DP_A = [
+    [],
+    [1 / 5],
+    [3 / 40, 9 / 40],
+    [44 / 45, -56 / 15, 32 / 9],
+    [19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729],
+    [9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656],
+]
+_DP_B = np.array([35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84])
+_DP_E = np.array([-71 / 57600, 0.0, 71 / 16695, -71 / 1920, 17253 / 339200, -22 / 525, 1 / 40])
+
+
+def _rms(x):
+    return np.sqrt(np.mean(x**2, axis=0))
+
+
+def _dopri5_ensemble(rhs, t_start, t_eval, y0, rtol=1e-8, atol=1e-8):
+    """Integrate an ensemble of ODEs with one adaptive Dormand-Prince step size per member.
+
+    rhs(t, y, idx) receives member times t (k,), states y (n, k) and the member
+    indices idx (k,) so it can pick per-member parameters; it returns (n, k).
+    y0 has shape (n, N).  Steps are clipped so every member lands exactly on
+    each t_eval point.  Returns an (n, N, T) array; members whose step size
+    collapses, or whose state, error estimate or step size stops being
+    finite, are left as NaN from that point on.
+    """
+    y0 = np.asarray(y0, dtype=float)
+    t_eval = np.asarray(t_eval, dtype=float)
+    n_dim, n_members = y0.shape
+    n_times = len(t_eval)
+    out = np.full((n_dim, n_members, n_times), np.nan)
+    if n_members == 0 or n_times == 0:
+        return out
+
+    all_idx = np.arange(n_members)
+    t = np.full(n_members, float(t_start))
+    y = y0.copy()
+    f = rhs(t, y, all_idx)
+    next_out = np.zeros(n_members, dtype=int)
+
+    # Initial step selection (Hairer, Norsett & Wanner), as in solve_ivp.
+    scale = atol + np.abs(y) * rtol
+    d0 = _rms(y / scale)
+    d1 = _rms(f / scale)
+    h0 = np.where((d0 < 1e-5) | (d1 < 1e-5), 1e-6, 0.01 * d0 / np.where(d1 == 0, 1.0, d1))
+    f1 = rhs(t + h0, y + h0 * f, all_idx)
+    d2 = _rms((f1 - f) / scale) / h0
+    d12 = np.maximum(d1, d2)
+    h1 = np.where(
+        d12 <= 1e-15,
+        np.maximum(1e-6, h0 * 1e-3),
+        (0.01 / np.where(d12 == 0, 1.0, d12)) ** (1 / 5),
+    )
+    h = np.minimum(100 * h0, h1)
+
+    active = np.ones(n_members, dtype=bool)
+    while active.any():
+        idx = np.flatnonzero(active)
+        t_a, y_a, f_a, h_a = t[idx], y[:, idx], f[:, idx], h[idx]
+        t_target = t_eval[next_out[idx]]
+        h_step = np.minimum(h_a, t_target - t_a)
+
+        K = [f_a]
+        for c, a in zip(_DP_C[1:], _DP_A[1:]):
+            dy = sum(coef * k for coef, k in zip(a, K)) * h_step
+            K.append(rhs(t_a + c * h_step, y_a + dy, idx))
+        y_new = y_a + h_step * sum(b * k for b, k in zip(_DP_B, K))
+        f_new = rhs(t_a + h_step, y_new, idx)
+        K.append(f_new)
+
+        scale = atol + np.maximum(np.abs(y_a), np.abs(y_new)) * rtol
+        err = _rms(h_step * sum(e * k for e, k in zip(_DP_E, K)) / scale)
+        # NaN never compares below the stall threshold, so non-finite members are stopped explicitly
+        broken = ~np.isfinite(err) | ~np.all(np.isfinite(y_a), axis=0) | ~np.all(np.isfinite(f_a), axis=0)
+        err = np.where(np.isfinite(err), err, np.inf)
+        accept = err <= 1.0
+
+        with np.errstate(divide="ignore"):
+            factor = np.where(err == 0, 10.0, 0.9 * err ** (-1 / 5))
+        factor = np.where(accept, np.clip(factor, 0.2, 10.0), np.clip(factor, 0.2, 1.0))
+        h_new = h_step * factor
+        # A step shortened only to hit an output time says nothing about the
+        # step the member could really take, so keep the previous proposal.
+        clipped = h_step < h_a
+        h_new = np.where(accept & clipped, np.maximum(h_new, h_a), h_new)
+        h[idx] = h_new
+
+        reached = accept & ~(h_a < t_target - t_a)
+        acc_idx = idx[accept]
+        t[acc_idx] = t_a[accept] + h_step[accept]
+        y[:, acc_idx] = y_new[:, accept]
+        f[:, acc_idx] = f_new[:, accept]
+
+        hit = idx[reached]
+        t[hit] = t_target[reached]
+        out[:, hit, next_out[hit]] = y[:, hit]
+        next_out[hit] += 1
+        active[hit[next_out[hit] >= n_times]] = False
+
+        tiny = 10 * np.finfo(float).eps * np.maximum(np.abs(t_a), 1.0)
+        stalled = idx[broken | ~np.isfinite(h_new) | (h_new < tiny)]
+        stalled = stalled[active[stalled]]
+        active[stalled] = False
+
+    return out
+
+
+# solve_ivp methods that use a Jacobian; they get the analytic one.
+_IMPLICIT_METHODS = ("Radau", "BDF", "LSODA")
+
+# Default step for the fixed-step methods: 1/100 of a drive period.
+DEFAULT_STEP_SIZE = 2 * np.pi / 100
+
+# Methods available as compiled loops with backend="numba".
+COMPILED_METHODS = ("RK45", "RK4")
+
+
 def compute_pendulum_trajectory(
     x0=1.0,
     omega=2.0,
@@ -35,10 +209,31 @@ def compute_pendulum_trajectory(
     solver_method="RK45",
     rtol=1e-8,
     atol=1e-8,
+    cache=None,
+    step_size=DEFAULT_STEP_SIZE,
+    return_stats=False,
+    backend="scipy",
 ):
     """Compute pendulum trajectory using solve_ivp and return (times, theta_values, theta_dot_values).
 
     If t_eval is None, samples once per 2*pi period similar to earlier scripts.
+
+    solver_method may also be one of the fixed-step symplectic schemes
+    "implicit_midpoint" or "stormer_verlet" (see `ComputationalProject.symplectic`);
+    they take steps no longer than step_size and ignore rtol/atol.
+
+    With return_stats=True a `telemetry.SolverStats` (RHS calls and time,
+    accepted/rejected steps, nfev/njev, wall time) is returned as a fourth item.
+
+    backend="numba" runs "RK45" (and the fixed-step "RK4") as compiled loops
+    from `ComputationalProject.kernels`.  Without numba installed, or for any
+    other solver_method, it falls back to the scipy path.  "RK4" exists only
+    as a kernel, so it requires backend="numba" (interpreted if numba is
+    missing).
+
+    Results are looked up in and stored to the trajectory cache (see
+    `ComputationalProject.cache`): cache=None uses the process-wide default,
+    cache=False bypasses it, or a `TrajectoryCache` instance may be passed.
     """
     y0 = [theta0, theta_dot0]
 
@@ -49,7 +244,79 @@ def compute_pendulum_trajectory(
     else:
         t_end = float(t_eval[-1])
 
-    ode = pendulum_ode_factory(x0=x0, omega=omega, d=d, g=g)
+    if solver_method == "RK4" and backend != "numba":
+        raise ValueError(f'solver_method "RK4" requires backend="numba", got backend={backend!r}')
+    use_kernels = backend == "numba" and solver_method in COMPILED_METHODS
+    if use_kernels and solver_method == "RK45":
+        from ComputationalProject.kernels import HAVE_NUMBA
+
+        if not HAVE_NUMBA:
+            use_kernels = False  # solve_ivp's RK45 beats an interpreted loop
+
+    if cache is None:
+        cache = get_default_cache()
+    if cache:
+        key = trajectory_key(
+            x0, omega, theta0, theta_dot0, d, g, t_start, t_eval, solver_method, rtol, atol,
+            step_size=step_size if solver_method in STEP_METHODS + ("RK4",) else None,
+            backend="kernels" if use_kernels else None,
+        )
+        cached = cache.get(key)
+        if cached is not None:
+            if return_stats:
+                return cached + (SolverStats(method=str(solver_method), cache_hit=True),)
+            return cached
+
+    if use_kernels:
+        times, theta_values, theta_dot_values, stats = _compute_with_kernels(
+            x0, omega, theta0, theta_dot0, d, g, t_start, t_eval, solver_method, rtol, atol, step_size
+        )
+        if cache and stats.success:
+            cache.put(key, times, theta_values, theta_dot_values)
+        if return_stats:
+            return times, theta_values, theta_dot_values, stats
+        return times, theta_values, theta_dot_values
+
+    ode = pendulum_ode_factory(x0=x0, omega=omega, d=d, g=g, vectorized=True)
+
+    if solver_method in STEP_METHODS:
+        if return_stats:
+            ode = InstrumentedODE(ode)
+        wall_start = time.perf_counter()
+        times = np.asarray(t_eval, dtype=float)
+        theta_values, theta_dot_values = integrate_to_times(solver_method, ode, t_start, y0, times, step_size)
+        if cache:
+            cache.put(key, times, theta_values, theta_dot_values)
+        if return_stats:
+            wall_time = time.perf_counter() - wall_start
+            stats = SolverStats(
+                method=solver_method,
+                nfev=ode.calls,
+                rhs_calls=ode.calls,
+                rhs_time=ode.time,
+                wall_time=wall_time,
+                solver_time=wall_time - ode.time,
+            )
+            return times, theta_values, theta_dot_values, stats
+        return times, theta_values, theta_dot_values
+
+    options = {}
+    if solver_method in _IMPLICIT_METHODS:
+        options["jac"] = pendulum_jacobian_factory(x0=x0, omega=omega, d=d, g=g)
+        options["vectorized"] = True
+
+    if return_stats:
+        times, y, stats = solve_with_stats(
+            ode, [t_start, t_end], y0, t_eval, method=solver_method, rtol=rtol, atol=atol, **options
+        )
+        theta_values, theta_dot_values = y[0], y[1]
+        if cache and stats.success:
+            cache.put(key, times, theta_values, theta_dot_values)
+        return times, theta_values, theta_dot_values, stats
+
+    # Imported here rather than at module level: scipy.integrate takes about
+    # half a second to import, which short CLI runs should not pay up front.
+    from scipy.integrate import solve_ivp
 
     sol = solve_ivp(
         ode,
@@ -59,15 +326,195 @@ def compute_pendulum_trajectory(
         method=solver_method,
         rtol=rtol,
         atol=atol,
+        **options,
     )
 
     theta_values = sol.y[0]
     theta_dot_values = sol.y[1]
     times = sol.t
 
+    if cache and sol.success:
+        cache.put(key, times, theta_values, theta_dot_values)
+
     return times, theta_values, theta_dot_values
 
 
+def _compute_with_kernels(x0, omega, theta0, theta_dot0, d, g, t_start, t_eval, solver_method, rtol, atol, step_size):
+    from ComputationalProject.kernels import dopri5_pendulum, rk4_pendulum
+
+    times = np.ascontiguousarray(t_eval, dtype=float)
+    out = np.empty((2, len(times)))
+    args = (times, float(theta0), float(theta_dot0), float(x0), float(omega), float(d), float(g), float(t_start))
+    wall_start = time.perf_counter()
+    if solver_method == "RK4":
+        nfev = rk4_pendulum(*args, float(step_size), out)
+        stats = SolverStats(method="RK4", nfev=nfev, rhs_calls=nfev)
+    else:
+        status, nfev, n_accepted, n_rejected = dopri5_pendulum(*args, float(rtol), float(atol), out)
+        stats = SolverStats(
+            method=solver_method,
+            nfev=nfev,
+            rhs_calls=nfev,
+            n_accepted=n_accepted,
+            n_rejected=n_rejected,
+            success=status == 0,
+        )
+    stats.wall_time = time.perf_counter() - wall_start
+    stats.solver_time = stats.wall_time
+    return times, out[0], out[1], stats
+
+
+def iter_pendulum_trajectory(
+    x0=1.0,
+    omega=2.0,
+    theta0=np.pi,
+    theta_dot0=2.5,
+    d=1.0,
+    g=9.81,
+    N_periods=10,
+    samples_per_period=1,
+    chunk_periods=50,
+    t_start=0.0,
+    solver_method="RK45",
+    rtol=1e-8,
+    atol=1e-8,
+    step_size=DEFAULT_STEP_SIZE,
+    backend="scipy",
+):
+    """Yield a trajectory as (times, theta_values, theta_dot_values) chunks with bounded memory.
+
+    Samples are taken samples_per_period times per 2*pi period, N_periods*samples_per_period + 1
+    samples in total starting at t_start.  The run is integrated in windows of
+    chunk_periods periods; each window restarts solve_ivp from the final state of
+    the previous one (as Pset6/6b.py does with y_current), so only one window is
+    ever held in memory however long the run is.
+    """
+    dt = 2 * np.pi / samples_per_period
+    n_samples = N_periods * samples_per_period + 1
+    chunk_samples = max(1, chunk_periods * samples_per_period)
+
+    t_current = t_start
+    y_current = (theta0, theta_dot0)
+    for i0 in range(0, n_samples, chunk_samples):
+        i1 = min(i0 + chunk_samples, n_samples)
+        t_eval = t_start + dt * np.arange(i0, i1)
+        times, theta_values, theta_dot_values = compute_pendulum_trajectory(
+            x0=x0,
+            omega=omega,
+            theta0=y_current[0],
+            theta_dot0=y_current[1],
+            d=d,
+            g=g,
+            t_start=t_current,
+            t_eval=t_eval,
+            solver_method=solver_method,
+            rtol=rtol,
+            atol=atol,
+            cache=False,
+            step_size=step_size,
+            backend=backend,
+        )
+        yield times, theta_values, theta_dot_values
+
+        t_current = times[-1]
+        y_current = (theta_values[-1], theta_dot_values[-1])
+
+
+def compute_stroboscopic_map(
+    x0=1.0,
+    omega=2.0,
+    theta0=np.pi,
+    theta_dot0=2.5,
+    d=1.0,
+    g=9.81,
+    N_periods=1000,
+    transient_periods=0,
+    t_start=0.0,
+    solver_method="RK45",
+    rtol=1e-8,
+    atol=1e-8,
+    out=None,
+):
+    """Return (times, theta_values, theta_dot_values) at the drive period boundaries t_start + 2*pi*n only.
+
+    Equivalent to compute_pendulum_trajectory(..., t_eval=None) for t_start=0,
+    but without building a dense t_eval: the state is interpolated at each
+    boundary from a per-step callback (`poincare.stroboscopic_map`) into a
+    preallocated (n, 2) buffer, which may be passed as out (e.g. an
+    np.memmap).  The first transient_periods periods are integrated but not
+    recorded, so n = N_periods - transient_periods + 1.  solver_method is any
+    solve_ivp method; results are not cached.
+    """
+    from ComputationalProject.poincare import SOLVERS, stroboscopic_map
+
+    if solver_method not in SOLVERS:
+        raise ValueError(f"unsupported stroboscopic solver_method {solver_method!r}")
+    times, y = stroboscopic_map(
+        pendulum_ode_factory(x0=x0, omega=omega, d=d, g=g),
+        [theta0, theta_dot0],
+        2 * np.pi,
+        N_periods,
+        t_start=t_start,
+        transient_periods=transient_periods,
+        method=solver_method,
+        rtol=rtol,
+        atol=atol,
+        out=out,
+    )
+    return times, y[:, 0], y[:, 1]
+
+
+def compute_pendulum_ensemble(
+    x0=1.0,
+    omega=2.0,
+    theta0=np.pi,
+    theta_dot0=2.5,
+    d=1.0,
+    g=9.81,
+    N_periods=10,
+    t_start=0.0,
+    t_eval=None,
+    rtol=1e-8,
+    atol=1e-8,
+    solver_method="RK45",
+    step_size=DEFAULT_STEP_SIZE,
+):
+    """Batched counterpart of compute_pendulum_trajectory for many initial conditions at once.
+
+    x0, omega, theta0, theta_dot0, d and g may be scalars or arrays; they are
+    broadcast together and flattened into N ensemble members.  All members are
+    advanced together with a vectorized Dormand-Prince (RK45) scheme, each with
+    its own adaptive step size, unless solver_method names one of the
+    fixed-step symplectic schemes ("implicit_midpoint", "stormer_verlet").
+    Returns (times, theta_values, theta_dot_values)
+    with shapes (T,), (N, T) and (N, T); a member whose step size collapses or
+    whose state stops being finite (NaN inputs, d = 0, ...) is NaN from that
+    point on, without holding up the others.
+    """
+    x0, omega, theta0, theta_dot0, d, g = (
+        np.ravel(a).astype(float) for a in np.broadcast_arrays(x0, omega, theta0, theta_dot0, d, g)
+    )
+
+    if t_eval is None:
+        t_eval = 2 * np.pi * np.arange(0, N_periods + 1)
+    t_eval = np.asarray(t_eval, dtype=float)
+
+    if solver_method in STEP_METHODS:
+        def ode(t, y):
+            return _pendulum_derivatives(t, y[0], y[1], x0, omega, d, g)
+
+        out = integrate_to_times(solver_method, ode, t_start, np.stack([theta0, theta_dot0]), t_eval, step_size)
+        return t_eval, out[0], out[1]
+    if solver_method != "RK45":
+        raise ValueError(f"unsupported ensemble solver_method {solver_method!r}")
+
+    def rhs(t, y, idx):
+        return _pendulum_derivatives(t, y[0], y[1], x0[idx], omega[idx], d[idx], g[idx])
+
+    out = _dopri5_ensemble(rhs, t_start, t_eval, np.stack([theta0, theta_dot0]), rtol=rtol, atol=atol)
+    return t_eval, out[0], out[1]
+
+
 def save_trajectory_to_csv(filename, times, theta_values, theta_dot_values, fmt="{:.4f}"):
     """Save theta & theta_dot to a CSV file with header (Time, Theta, Theta_dot).
 
@@ -82,4 +529,10 @@ def save_trajectory_to_csv(filename, times, theta_values, theta_dot_values, fmt=
             writer.writerow([fmt.format(t), fmt.format(th), fmt.format(thd)])
 
 
-__all__ = ["compute_pendulum_trajectory", "save_trajectory_to_csv"]
+__all__ = [
+    "compute_pendulum_trajectory",
+    "compute_pendulum_ensemble",
+    "compute_stroboscopic_map",
+    "iter_pendulum_trajectory",
+    "save_trajectory_to_csv",
+]
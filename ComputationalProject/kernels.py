@@ -0,0 +1,260 @@
+"""JIT-compiled kernels for the pendulum models, with a pure-Python fallback.
+
+When numba is installed the functions below are compiled on first use (and
+cached on disk), which removes the per-call Python overhead that dominates
+solve_ivp with scalar right-hand sides.  Without numba the same functions run
+as ordinary Python, so they stay correct, just slow; callers that care, such
+as `compute_pendulum_trajectory(backend="numba")`, check `HAVE_NUMBA` and use
+their scipy path instead.
+
+Kernels:
+
+- `pendulum_rhs` / `double_pendulum_rhs_kernel`: the scalar equations of
+  motion of the driven pendulum (integrator.py) and double pendulum (6c).
+- `rk4_pendulum` / `rk4_double_pendulum`: fixed-step classic RK4 loops.
+- `dopri5_pendulum`: adaptive Dormand-Prince 5(4) with the same tableau and
+  step-size control as solve_ivp's RK45, sampling exactly at t_eval.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def pendulum_rhs(t, theta, theta_dot, x0, omega, d, g):
+    """Return (theta_dot, theta_double_dot) for the driven pendulum."""
+    sin_theta = math.sin(theta)
+    cos_t = math.cos(t)
+    numerator = (
+        sin_theta * (g - theta_dot * omega * x0 * cos_t)
+        + omega * x0 * (omega * math.cos(theta) * math.sin(t) + cos_t * sin_theta)
+    )
+    return theta_dot, numerator / d
+
+
+@njit(cache=True)
+def rk4_pendulum(t_eval, theta0, theta_dot0, x0, omega, d, g, t_start, step_size, out):
+    """Fixed-step RK4 for the driven pendulum, writing (theta, theta_dot) at t_eval into out (2, T).
+
+    Each gap between output times is split into the fewest equal steps no
+    longer than step_size.  Returns the number of RHS evaluations.
+    """
+    t = t_start
+    theta = theta0
+    theta_dot = theta_dot0
+    nfev = 0
+    for i in range(t_eval.shape[0]):
+        t_next = t_eval[i]
+        n_steps = int(math.ceil((t_next - t) / step_size - 1e-12))
+        if n_steps > 0:
+            h = (t_next - t) / n_steps
+            for step in range(n_steps):
+                ts = t + step * h
+                k1a, k1b = pendulum_rhs(ts, theta, theta_dot, x0, omega, d, g)
+                k2a, k2b = pendulum_rhs(ts + 0.5 * h, theta + 0.5 * h * k1a, theta_dot + 0.5 * h * k1b, x0, omega, d, g)
+                k3a, k3b = pendulum_rhs(ts + 0.5 * h, theta + 0.5 * h * k2a, theta_dot + 0.5 * h * k2b, x0, omega, d, g)
+                k4a, k4b = pendulum_rhs(ts + h, theta + h * k3a, theta_dot + h * k3b, x0, omega, d, g)
+                theta += h / 6.0 * (k1a + 2.0 * k2a + 2.0 * k3a + k4a)
+                theta_dot += h / 6.0 * (k1b + 2.0 * k2b + 2.0 * k3b + k4b)
+            nfev += 4 * n_steps
+        t = t_next
+        out[0, i] = theta
+        out[1, i] = theta_dot
+    return nfev
+
+
+@njit(cache=True)
+def dopri5_pendulum(t_eval, theta0, theta_dot0, x0, omega, d, g, t_start, rtol, atol, out):
+    """Adaptive Dormand-Prince 5(4) for the driven pendulum, sampling at t_eval into out (2, T).
+
+    Steps are shortened to land exactly on each output time.  Returns
+    (status, nfev, n_accepted, n_rejected); status is 0 on success and -1 if
+    the step size collapsed, in which case the remaining outputs are NaN.
+    """
+    n_times = t_eval.shape[0]
+    for i in range(n_times):
+        out[0, i] = np.nan
+        out[1, i] = np.nan
+
+    t = t_start
+    y0 = theta0
+    y1 = theta_dot0
+    f0, f1 = pendulum_rhs(t, y0, y1, x0, omega, d, g)
+    nfev = 1
+
+    # Initial step selection, as in solve_ivp
+    s0 = atol + abs(y0) * rtol
+    s1 = atol + abs(y1) * rtol
+    d0 = math.sqrt(((y0 / s0) ** 2 + (y1 / s1) ** 2) / 2)
+    d1 = math.sqrt(((f0 / s0) ** 2 + (f1 / s1) ** 2) / 2)
+    if d0 < 1e-5 or d1 < 1e-5:
+        h0 = 1e-6
+    else:
+        h0 = 0.01 * d0 / d1
+    g0, g1 = pendulum_rhs(t + h0, y0 + h0 * f0, y1 + h0 * f1, x0, omega, d, g)
+    nfev += 1
+    d2 = math.sqrt((((g0 - f0) / s0) ** 2 + ((g1 - f1) / s1) ** 2) / 2) / h0
+    if d1 <= 1e-15 and d2 <= 1e-15:
+        h1 = max(1e-6, h0 * 1e-3)
+    else:
+        h1 = (0.01 / max(d1, d2)) ** 0.2
+    h = min(100 * h0, h1)
+
+    n_accepted = 0
+    n_rejected = 0
+    i = 0
+    while i < n_times:
+        t_target = t_eval[i]
+        remaining = t_target - t
+        h_step = min(h, remaining)
+
+        k1a, k1b = f0, f1
+        k2a, k2b = pendulum_rhs(t + h_step / 5, y0 + h_step * (k1a / 5), y1 + h_step * (k1b / 5), x0, omega, d, g)
+        k3a, k3b = pendulum_rhs(
+            t + 3 * h_step / 10,
+            y0 + h_step * (3 / 40 * k1a + 9 / 40 * k2a),
+            y1 + h_step * (3 / 40 * k1b + 9 / 40 * k2b),
+            x0, omega, d, g,
+        )
+        k4a, k4b = pendulum_rhs(
+            t + 4 * h_step / 5,
+            y0 + h_step * (44 / 45 * k1a - 56 / 15 * k2a + 32 / 9 * k3a),
+            y1 + h_step * (44 / 45 * k1b - 56 / 15 * k2b + 32 / 9 * k3b),
+            x0, omega, d, g,
+        )
+        k5a, k5b = pendulum_rhs(
+            t + 8 * h_step / 9,
+            y0 + h_step * (19372 / 6561 * k1a - 25360 / 2187 * k2a + 64448 / 6561 * k3a - 212 / 729 * k4a),
+            y1 + h_step * (19372 / 6561 * k1b - 25360 / 2187 * k2b + 64448 / 6561 * k3b - 212 / 729 * k4b),
+            x0, omega, d, g,
+        )
+        k6a, k6b = pendulum_rhs(
+            t + h_step,
+            y0 + h_step * (9017 / 3168 * k1a - 355 / 33 * k2a + 46732 / 5247 * k3a + 49 / 176 * k4a - 5103 / 18656 * k5a),
+            y1 + h_step * (9017 / 3168 * k1b - 355 / 33 * k2b + 46732 / 5247 * k3b + 49 / 176 * k4b - 5103 / 18656 * k5b),
+            x0, omega, d, g,
+        )
+        n0 = y0 + h_step * (35 / 384 * k1a + 500 / 1113 * k3a + 125 / 192 * k4a - 2187 / 6784 * k5a + 11 / 84 * k6a)
+        n1 = y1 + h_step * (35 / 384 * k1b + 500 / 1113 * k3b + 125 / 192 * k4b - 2187 / 6784 * k5b + 11 / 84 * k6b)
+        k7a, k7b = pendulum_rhs(t + h_step, n0, n1, x0, omega, d, g)
+        nfev += 6
+
+        e0 = h_step * (
+            -71 / 57600 * k1a + 71 / 16695 * k3a - 71 / 1920 * k4a + 17253 / 339200 * k5a - 22 / 525 * k6a + 1 / 40 * k7a
+        )
+        e1 = h_step * (
+            -71 / 57600 * k1b + 71 / 16695 * k3b - 71 / 1920 * k4b + 17253 / 339200 * k5b - 22 / 525 * k6b + 1 / 40 * k7b
+        )
+        s0 = atol + max(abs(y0), abs(n0)) * rtol
+        s1 = atol + max(abs(y1), abs(n1)) * rtol
+        err = math.sqrt(((e0 / s0) ** 2 + (e1 / s1) ** 2) / 2)
+        if not math.isfinite(err):
+            err = math.inf
+
+        if err <= 1.0:
+            factor = 10.0 if err == 0 else min(10.0, max(0.2, 0.9 * err ** -0.2))
+            h_new = h_step * factor
+            if h_step < h:
+                # Shortened only to hit an output time: keep the previous proposal
+                h_new = max(h_new, h)
+            n_accepted += 1
+            if h < remaining:
+                t = t + h_step
+            else:
+                t = t_target
+                out[0, i] = n0
+                out[1, i] = n1
+                i += 1
+            y0, y1 = n0, n1
+            f0, f1 = k7a, k7b
+        else:
+            n_rejected += 1
+            h_new = h_step * max(0.2, 0.9 * err ** -0.2)
+        h = h_new
+
+        if h < 10 * 2.220446049250313e-16 * max(abs(t), 1.0):
+            return -1, nfev, n_accepted, n_rejected
+    return 0, nfev, n_accepted, n_rejected
+
+
+@njit(cache=True)
+def double_pendulum_rhs_kernel(theta1, omega1, theta2, omega2, g, L1, L2, m1, m2):
+    """Return (omega1, domega1, omega2, domega2) for the double pendulum of Pset6/6c.py."""
+    delta_theta = theta2 - theta1
+    sin_delta = math.sin(delta_theta)
+    cos_delta = math.cos(delta_theta)
+    sin_theta1 = math.sin(theta1)
+    sin_theta2 = math.sin(theta2)
+
+    denom1 = (m1 + m2) * L1 - m2 * L1 * cos_delta**2
+    denom2 = (L2 / L1) * denom1
+
+    domega1_dt = (
+        m2 * L1 * omega1**2 * sin_delta * cos_delta
+        + m2 * g * sin_theta2 * cos_delta
+        + m2 * L2 * omega2**2 * sin_delta
+        - (m1 + m2) * g * sin_theta1
+    ) / denom1
+    domega2_dt = (
+        -m2 * L2 * omega2**2 * sin_delta * cos_delta
+        + (m1 + m2) * (g * sin_theta1 * cos_delta - L1 * omega1**2 * sin_delta - g * sin_theta2)
+    ) / denom2
+    return omega1, domega1_dt, omega2, domega2_dt
+
+
+@njit(cache=True)
+def rk4_double_pendulum(y0, step_size, n_steps, record_every, g, L1, L2, m1, m2, out):
+    """Fixed-step RK4 for the double pendulum from y0 = (theta1, omega1, theta2, omega2).
+
+    Records the state at the start and every record_every steps into out
+    (4, n_steps // record_every + 1).
+    """
+    a, b, c, e = y0[0], y0[1], y0[2], y0[3]
+    h = step_size
+    out[0, 0], out[1, 0], out[2, 0], out[3, 0] = a, b, c, e
+    for step in range(1, n_steps + 1):
+        k1 = double_pendulum_rhs_kernel(a, b, c, e, g, L1, L2, m1, m2)
+        k2 = double_pendulum_rhs_kernel(
+            a + 0.5 * h * k1[0], b + 0.5 * h * k1[1], c + 0.5 * h * k1[2], e + 0.5 * h * k1[3], g, L1, L2, m1, m2
+        )
+        k3 = double_pendulum_rhs_kernel(
+            a + 0.5 * h * k2[0], b + 0.5 * h * k2[1], c + 0.5 * h * k2[2], e + 0.5 * h * k2[3], g, L1, L2, m1, m2
+        )
+        k4 = double_pendulum_rhs_kernel(a + h * k3[0], b + h * k3[1], c + h * k3[2], e + h * k3[3], g, L1, L2, m1, m2)
+        a += h / 6.0 * (k1[0] + 2.0 * k2[0] + 2.0 * k3[0] + k4[0])
+        b += h / 6.0 * (k1[1] + 2.0 * k2[1] + 2.0 * k3[1] + k4[1])
+        c += h / 6.0 * (k1[2] + 2.0 * k2[2] + 2.0 * k3[2] + k4[2])
+        e += h / 6.0 * (k1[3] + 2.0 * k2[3] + 2.0 * k3[3] + k4[3])
+        if step % record_every == 0:
+            j = step // record_every
+            out[0, j], out[1, j], out[2, j], out[3, j] = a, b, c, e
+
+
+def double_pendulum_rhs_compiled(t, y, g=9.81, L1=1.0, L2=1.0, m1=1.0, m2=1.0):
+    """solve_ivp-compatible wrapper around the compiled double pendulum kernel."""
+    return np.array(double_pendulum_rhs_kernel(y[0], y[1], y[2], y[3], g, L1, L2, m1, m2))
+
+
+__all__ = [
+    "HAVE_NUMBA",
+    "pendulum_rhs",
+    "rk4_pendulum",
+    "dopri5_pendulum",
+    "double_pendulum_rhs_kernel",
+    "rk4_double_pendulum",
+    "double_pendulum_rhs_compiled",
+]
@@ -0,0 +1,138 @@
+"""Level-of-detail reduction for plotting very large trajectories.
+
+Drawing millions of markers makes matplotlib slow and memory hungry, yet a
+figure can only show a few hundred thousand pixels.  Above a point threshold
+`plot_lod` therefore reduces the data to what the axes can display:
+
+- series with ascending x (e.g. theta against time) are decimated to the
+  first, last, minimum and maximum sample of every pixel column, which keeps
+  every peak and trough visible;
+- anything else (phase portraits, bob paths) is rasterized into a 2D
+  histogram at the axes' pixel resolution and drawn as a density image.
+
+Both reductions are accumulated in chunks, so memory-mapped ``.npy``
+trajectories are never loaded as a whole.
+"""
+
+import numpy as np
+
+DEFAULT_MAX_POINTS = 100_000
+CHUNK_SIZE = 1_000_000
+
+
+def is_ascending(x, chunk_size=CHUNK_SIZE):
+    """Return True if x is non-decreasing, checking chunk_size samples at a time."""
+    x = np.asarray(x)
+    for start in np.arange(0, len(x), chunk_size):
+        # Overlap by one sample so the boundary between chunks is checked too
+        if not np.all(np.diff(x[start:start + chunk_size + 1]) >= 0):
+            return False
+    return True
+
+
+def minmax_decimate(x, y, n_columns, chunk_size=CHUNK_SIZE):
+    """Keep the first, last, min and max sample of y in each of n_columns equal-width x columns.
+
+    x must be ascending.  Returns (x, y) with at most 4 * n_columns points, in
+    their original order.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if len(x) <= 4 * n_columns:
+        return x, y
+    edges = np.linspace(x[0], x[-1], n_columns + 1)[1:-1]
+    first = np.full(n_columns, -1)
+    last = np.full(n_columns, -1)
+    lowest = np.full(n_columns, -1)
+    highest = np.full(n_columns, -1)
+    low = np.full(n_columns, np.inf)
+    high = np.full(n_columns, -np.inf)
+
+    for start in np.arange(0, len(x), chunk_size):
+        y_chunk = np.asarray(y[start:start + chunk_size])
+        column = np.searchsorted(edges, x[start:start + chunk_size], side="right")
+        # x is ascending, so each column present in the chunk is one contiguous run
+        cols, starts = np.unique(column, return_index=True)
+        ends = np.append(starts[1:], len(column))
+        first[cols] = np.where(first[cols] < 0, start + starts, first[cols])
+        last[cols] = start + ends - 1
+
+        run = np.repeat(np.arange(len(cols)), ends - starts)
+        for reduce, best, index in ((np.minimum, low, lowest), (np.maximum, high, highest)):
+            extreme = reduce.reduceat(y_chunk, starts)
+            hits = np.flatnonzero(y_chunk == extreme[run])
+            # First hit per run; earlier chunks win ties
+            _, first_hit = np.unique(run[hits], return_index=True)
+            better = reduce(extreme, best[cols]) != best[cols]
+            best[cols[better]] = extreme[better]
+            index[cols[better]] = start + hits[first_hit][better]
+
+    keep = np.concatenate([first, last, lowest, highest])
+    keep = np.unique(keep[keep >= 0])
+    return x[keep], y[keep]
+
+
+def density_image(x, y, bins, range=None, chunk_size=CHUNK_SIZE):
+    """Histogram the points (x, y) onto a bins=(nx, ny) grid.
+
+    Returns (counts, extent) where counts has shape (ny, nx) with row 0 at the
+    lowest y (ready for imshow(origin="lower")) and extent is
+    (xmin, xmax, ymin, ymax).  range defaults to the data bounds.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if range is None:
+        range = ((float(np.nanmin(x)), float(np.nanmax(x))), (float(np.nanmin(y)), float(np.nanmax(y))))
+    (xmin, xmax), (ymin, ymax) = range
+    # Degenerate (constant) data still needs a non-empty extent
+    if xmax <= xmin:
+        xmin, xmax = xmin - 0.5, xmax + 0.5
+    if ymax <= ymin:
+        ymin, ymax = ymin - 0.5, ymax + 0.5
+    nx, ny = bins
+
+    counts = np.zeros((nx, ny), dtype=np.int64)
+    for start in np.arange(0, len(x), chunk_size):
+        stop = start + chunk_size
+        chunk_counts, _, _ = np.histogram2d(x[start:stop], y[start:stop], bins=(nx, ny), range=((xmin, xmax), (ymin, ymax)))
+        counts += chunk_counts.astype(np.int64)
+    return counts.T, (xmin, xmax, ymin, ymax)
+
+
+def _axes_pixels(ax, dpi=None):
+    """Size of ax in pixels when the figure is rendered at dpi (default: the figure's own dpi)."""
+    bbox = ax.get_window_extent()
+    scale = 1.0 if dpi is None else dpi / ax.figure.dpi
+    return max(1, int(bbox.width * scale)), max(1, int(bbox.height * scale))
+
+
+def plot_lod(ax, x, y, style="line", max_points=DEFAULT_MAX_POINTS, color="tab:blue", dpi=None, **kwargs):
+    """Plot y against x on ax, reducing the data first if it has more than max_points samples.
+
+    style is "line" (ax.plot) or "scatter" (ax.scatter); kwargs go to that
+    call when the data is drawn as is.  dpi is the resolution the figure will
+    be saved at (default: the figure's dpi), which sets the reduced
+    resolution.  Returns the created artist.
+    """
+    n_points = len(x)
+    if n_points <= max_points:
+        if style == "scatter":
+            return ax.scatter(x, y, color=color, **kwargs)
+        return ax.plot(x, y, color=color, **kwargs)[0]
+
+    width, height = _axes_pixels(ax, dpi)
+    if style == "line" and is_ascending(x):
+        x_small, y_small = minmax_decimate(x, y, width)
+        line_kwargs = {k: v for k, v in kwargs.items() if k in ("linewidth", "label", "alpha", "zorder")}
+        return ax.plot(x_small, y_small, color=color, **line_kwargs)[0]
+
+    from matplotlib.colors import LinearSegmentedColormap, to_rgba
+
+    counts, extent = density_image(x, y, bins=(width, height))
+    # Log-scaled counts fading from translucent to the requested colour; empty pixels stay blank
+    cmap = LinearSegmentedColormap.from_list("lod", [to_rgba(color, 0.25), to_rgba(color, 1.0)])
+    image = np.ma.masked_equal(np.log1p(counts), 0)
+    return ax.imshow(image, origin="lower", extent=extent, cmap=cmap, aspect="auto", interpolation="nearest")
+
+
+__all__ = ["plot_lod", "minmax_decimate", "density_image", "is_ascending", "DEFAULT_MAX_POINTS"]
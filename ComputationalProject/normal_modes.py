@@ -0,0 +1,109 @@
+"""Batched generalized eigenproblems for the Pset7 cart-pendulum normal modes.
+
+`Pset7/Matrix.py` solves K x = w^2 M x once with scipy.linalg.eig.  Here the
+matrices are stacked with shape (..., n, n) and every problem in the stack
+is solved at once:
+
+- for n == 2 in closed form: the roots of the quadratic det(K - w^2 M) = 0
+  and the null vectors of K - w^2 M, all as NumPy array expressions;
+- for larger n through NumPy's batched LAPACK eig on M^-1 K (M must be
+  invertible).
+
+Eigenvalues come back sorted by real part, each mode normalized to unit
+length with its largest component positive, and as real arrays whenever the
+imaginary parts vanish.  The matrices follow the Pset7 convention:
+K = [[M + m, m], [m, m]] and M = [[k, 0], [0, -m g / l]].
+"""
+
+import numpy as np
+
+
+def cart_pendulum_matrices(M=1.0, m=0.1, l=0.0155, k=158.0, g=9.81):
+    """Build the stacked K and M matrices of the cart-pendulum for broadcast parameters.
+
+    M, m, l, k and g may be scalars or arrays; for a grid pass e.g.
+    l=l_values[:, None], k=k_values[None, :].  Returns (K, M) with shape
+    broadcast_shape + (2, 2).
+    """
+    M, m, l, k, g = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in (M, m, l, k, g)))
+    K_mat = np.empty(M.shape + (2, 2))
+    K_mat[..., 0, 0] = M + m
+    K_mat[..., 0, 1] = m
+    K_mat[..., 1, 0] = m
+    K_mat[..., 1, 1] = m
+    M_mat = np.zeros(M.shape + (2, 2))
+    M_mat[..., 0, 0] = k
+    M_mat[..., 1, 1] = -m * g / l
+    return K_mat, M_mat
+
+
+def _eig_2x2(A, B):
+    a11, a12, a21, a22 = A[..., 0, 0], A[..., 0, 1], A[..., 1, 0], A[..., 1, 1]
+    b11, b12, b21, b22 = B[..., 0, 0], B[..., 0, 1], B[..., 1, 0], B[..., 1, 1]
+    # det(A - lam B) = qa lam^2 + qb lam + qc
+    qa = b11 * b22 - b12 * b21
+    qb = -(a11 * b22 + a22 * b11 - a12 * b21 - a21 * b12)
+    qc = a11 * a22 - a12 * a21
+    sqrt_disc = np.sqrt((qb**2 - 4 * qa * qc).astype(complex))
+    # Numerically stable roots: avoid subtracting nearly equal numbers
+    sign = np.where(np.real(np.conj(qb) * sqrt_disc) >= 0, 1.0, -1.0)
+    q = -0.5 * (qb + sign * sqrt_disc)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # q = 0 only for a double root at zero (qb = qc = 0)
+        lam = np.stack([q / qa, np.where(q == 0, 0.0, qc / q)], axis=-1)
+
+    # Null vector of R = A - lam B from whichever row of R is larger
+    R = A[..., None, :, :] - lam[..., :, None, None] * B[..., None, :, :]
+    from_row0 = np.stack([-R[..., 0, 1], R[..., 0, 0]], axis=-1)
+    from_row1 = np.stack([-R[..., 1, 1], R[..., 1, 0]], axis=-1)
+    norm0 = np.linalg.norm(from_row0, axis=-1)
+    norm1 = np.linalg.norm(from_row1, axis=-1)
+    vectors = np.where((norm0 >= norm1)[..., None], from_row0, from_row1)
+    # R = 0 (A = lam B, a double root with a 2D eigenspace): every vector is a
+    # mode, so take the canonical basis vector e_i for root i
+    scale = np.abs(A).max(axis=(-2, -1))[..., None] + np.abs(lam) * np.abs(B).max(axis=(-2, -1))[..., None]
+    degenerate = np.maximum(norm0, norm1) <= 1e-12 * scale
+    vectors = np.where(degenerate[..., None], np.eye(2), vectors)
+    # Stack eigenvectors as columns, as scipy.linalg.eig does
+    return lam, np.swapaxes(vectors, -1, -2)
+
+
+def generalized_eig(A, B):
+    """Solve A x = w2 B x for stacked (..., n, n) matrices A and B.
+
+    Returns (w2, modes) with shapes (..., n) and (..., n, n), where
+    modes[..., :, i] is the unit-norm mode belonging to w2[..., i].
+    """
+    A = np.asarray(A, dtype=float)
+    B = np.asarray(B, dtype=float)
+    A, B = np.broadcast_arrays(A, B)
+    if A.shape[-1] == 2:
+        w2, modes = _eig_2x2(A, B)
+    else:
+        w2, modes = np.linalg.eig(np.linalg.solve(B, A))
+
+    return sort_and_normalize_modes(w2, modes)
+
+
+def sort_and_normalize_modes(w2, modes):
+    """Sort eigenpairs by the real part of w2 and scale each mode column to unit norm, largest entry positive."""
+    order = np.argsort(np.real(w2), axis=-1)
+    w2 = np.take_along_axis(w2, order, axis=-1)
+    modes = np.take_along_axis(modes, order[..., None, :], axis=-1)
+
+    modes = modes / np.linalg.norm(modes, axis=-2, keepdims=True)
+    largest = np.take_along_axis(modes, np.argmax(np.abs(modes), axis=-2)[..., None, :], axis=-2)
+    modes = modes * np.where(np.real(largest) < 0, -1.0, 1.0)
+    return np.real_if_close(w2, tol=1000), np.real_if_close(modes, tol=1000)
+
+
+def cart_pendulum_modes(M=1.0, m=0.1, l=0.0155, k=158.0, g=9.81):
+    """Normal-mode w^2 values and modes of the cart-pendulum over broadcast parameters.
+
+    Shorthand for generalized_eig(*cart_pendulum_matrices(...)); returns
+    arrays of shape broadcast_shape + (2,) and broadcast_shape + (2, 2).
+    """
+    return generalized_eig(*cart_pendulum_matrices(M=M, m=m, l=l, k=k, g=g))
+
+
+__all__ = ["cart_pendulum_matrices", "generalized_eig", "cart_pendulum_modes", "sort_and_normalize_modes"]
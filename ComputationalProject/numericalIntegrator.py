@@ -5,9 +5,27 @@ This script keeps the original behavior but calls into the canonical
 we don't duplicate numerical logic across scripts.
 """
 
-from ComputationalProject.integrator import compute_pendulum_trajectory, save_trajectory_to_csv
-import matplotlib.pyplot as plt
+from ComputationalProject.batch import load_run_table, run_batch
+from ComputationalProject.checkpoint import (
+    RUN_PARAMS,
+    checkpoint_path,
+    extend,
+    read_checkpoint,
+    run_params,
+    start_trajectory,
+    write_checkpoint,
+)
+from ComputationalProject.integrator import (
+    DEFAULT_STEP_SIZE,
+    compute_pendulum_trajectory,
+    compute_stroboscopic_map,
+    iter_pendulum_trajectory,
+)
+from ComputationalProject.lod import DEFAULT_MAX_POINTS, plot_lod
+from ComputationalProject.trajectory_io import load_trajectory, save_trajectory, write_trajectory_stream
+import numpy as np
 import argparse
+import json
 import os
 from datetime import datetime
 
@@ -19,28 +37,241 @@ def main():
     parser.add_argument("--theta0", type=float, default=3.141592653589793, help="Initial theta")
     parser.add_argument("--theta_dot0", type=float, default=2.5, help="Initial theta dot")
     parser.add_argument("--periods", type=int, default=50, help="Number of 2*pi periods to simulate")
-    parser.add_argument("--save", type=str, default="theta_theta_dot.csv", help="CSV filename to write results")
+    parser.add_argument("--samples-per-period", type=int, default=1, help="Samples recorded per 2*pi period")
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Integrate in windows and write each one to disk as it finishes (constant memory)",
+    )
+    parser.add_argument("--chunk-periods", type=int, default=50, help="Periods per window when streaming")
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue the run checkpointed next to --save until it has --periods periods (starts it if missing)",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        action="store_true",
+        help="Also write a checkpoint next to --save so a later --resume can extend this run",
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="RUNS_FILE",
+        default=None,
+        help="Execute every run of a CSV/JSON-lines parameter table in this process; the other options "
+        "are defaults for missing fields and --save is the .npz archive or directory for all results",
+    )
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes for --batch")
+    parser.add_argument(
+        "--strobe",
+        action="store_true",
+        help="Record only the stroboscopic map (the state at each 2*pi period boundary) from a step callback",
+    )
+    parser.add_argument(
+        "--transient", type=int, default=0, help="With --strobe, integrate this many periods before recording"
+    )
+    parser.add_argument("--d", type=float, default=1.0, help="Pendulum length d")
+    parser.add_argument("--g", type=float, default=9.81, help="Gravitational acceleration g")
+    parser.add_argument(
+        "--method",
+        type=str,
+        default="RK45",
+        help="solve_ivp method (RK45, DOP853, Radau, ...) or a fixed-step symplectic one (stormer_verlet, implicit_midpoint)",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["scipy", "numba"],
+        default="scipy",
+        help="numba runs RK45/RK4 as compiled loops (falls back to scipy if numba is missing)",
+    )
+    parser.add_argument("--step-size", type=float, default=DEFAULT_STEP_SIZE, help="Step size for fixed-step methods")
+    parser.add_argument("--rtol", type=float, default=1e-8, help="Relative tolerance")
+    parser.add_argument("--atol", type=float, default=1e-8, help="Absolute tolerance")
+    parser.add_argument(
+        "--save",
+        type=str,
+        default="theta_theta_dot.csv",
+        help="Output filename; a .npy extension writes the binary format, anything else CSV",
+    )
+    parser.add_argument(
+        "--stats",
+        nargs="?",
+        const="-",
+        default=None,
+        metavar="JSON_PATH",
+        help="Report solver telemetry (RHS calls, steps, timing); prints JSON, or writes it to JSON_PATH",
+    )
     parser.add_argument("--plot", action="store_true", help="Show a phase-space plot")
+    parser.add_argument(
+        "--max-points",
+        type=int,
+        default=DEFAULT_MAX_POINTS,
+        help="Above this many samples the phase plot is drawn as a density image",
+    )
     parser.add_argument("--outdir", type=str, default="figures", help="Directory to save generated plots")
     parser.add_argument("--no-save", action="store_true", help="Do not save plots to disk")
 
     args = parser.parse_args()
+    if args.stats and (args.stream or args.resume):
+        parser.error("--stats is not supported together with --stream or --resume")
+
+    if args.strobe and (
+        args.stats or args.stream or args.resume or args.checkpoint or args.batch or args.samples_per_period != 1
+    ):
+        parser.error(
+            "--strobe cannot be combined with --stats, --stream, --resume, --checkpoint, --batch or --samples-per-period"
+        )
+    if args.transient and not args.strobe:
+        parser.error("--transient requires --strobe")
+
+    if args.batch:
+        if args.stats or args.stream or args.resume or args.checkpoint or args.plot:
+            parser.error("--batch cannot be combined with --stats, --stream, --resume, --checkpoint or --plot")
+        out = "batch_results.npz" if args.save == parser.get_default("save") else args.save
+        defaults = {name: getattr(args, name) for name in ("x0", "omega", "theta0", "theta_dot0", "periods", "d", "g")}
+        defaults.update(
+            samples_per_period=args.samples_per_period,
+            method=args.method,
+            rtol=args.rtol,
+            atol=args.atol,
+            step_size=args.step_size,
+            backend=args.backend,
+        )
+        summary = run_batch(load_run_table(args.batch), out, defaults=defaults, max_workers=args.workers)
+        if summary["n_failed"]:
+            raise SystemExit(1)
+        return
 
-    times, theta_values, theta_dot_values = compute_pendulum_trajectory(
+    metadata = {
+        "x0": args.x0,
+        "omega": args.omega,
+        "theta0": args.theta0,
+        "theta_dot0": args.theta_dot0,
+        "d": args.d,
+        "g": args.g,
+        "rtol": args.rtol,
+        "atol": args.atol,
+        "solver_method": args.method,
+        "step_size": args.step_size,
+        "backend": args.backend,
+        "samples_per_period": args.samples_per_period,
+    }
+    n_samples = args.periods * args.samples_per_period + 1
+    params = run_params(
         x0=args.x0,
         omega=args.omega,
-        theta0=args.theta0,
-        theta_dot0=args.theta_dot0,
-        N_periods=args.periods,
+        d=args.d,
+        g=args.g,
+        samples_per_period=args.samples_per_period,
+        solver_method=args.method,
+        rtol=args.rtol,
+        atol=args.atol,
+        step_size=args.step_size,
+        backend=args.backend,
     )
 
-    save_trajectory_to_csv(args.save, times, theta_values, theta_dot_values)
+    if args.resume:
+        if os.path.exists(checkpoint_path(args.save)):
+            checkpoint = read_checkpoint(args.save)
+            mismatched = [name for name in RUN_PARAMS if checkpoint["params"].get(name) != params[name]]
+            if mismatched:
+                parser.error(f"cannot resume {args.save}: parameters differ from its checkpoint ({', '.join(mismatched)})")
+        else:
+            checkpoint = start_trajectory(
+                args.save, params, theta0=args.theta0, theta_dot0=args.theta_dot0, metadata=metadata
+            )
+        remaining = args.periods - checkpoint["n_periods"]
+        if remaining > 0:
+            checkpoint = extend(args.save, remaining, chunk_periods=args.chunk_periods)
+        print(f"{args.save} holds {checkpoint['n_rows']} points ({checkpoint['n_periods']} periods)")
+        if args.plot:
+            times, theta_values, theta_dot_values, _ = load_trajectory(args.save, mmap_mode="r")
+    elif args.strobe:
+        times, theta_values, theta_dot_values = compute_stroboscopic_map(
+            x0=args.x0,
+            omega=args.omega,
+            theta0=args.theta0,
+            theta_dot0=args.theta_dot0,
+            d=args.d,
+            g=args.g,
+            N_periods=args.periods,
+            transient_periods=args.transient,
+            solver_method=args.method,
+            rtol=args.rtol,
+            atol=args.atol,
+        )
+        metadata["transient_periods"] = args.transient
+        save_trajectory(args.save, times, theta_values, theta_dot_values, metadata=metadata)
+        print(f"Written {len(times)} stroboscopic points to {args.save}")
+    elif args.stream:
+        chunks = iter_pendulum_trajectory(
+            x0=args.x0,
+            omega=args.omega,
+            theta0=args.theta0,
+            theta_dot0=args.theta_dot0,
+            d=args.d,
+            g=args.g,
+            N_periods=args.periods,
+            samples_per_period=args.samples_per_period,
+            chunk_periods=args.chunk_periods,
+            solver_method=args.method,
+            rtol=args.rtol,
+            atol=args.atol,
+            step_size=args.step_size,
+            backend=args.backend,
+        )
+        last = {}
 
-    print(f"Written {len(times)} points to {args.save}")
+        def remember_last(chunks):
+            for chunk in chunks:
+                last["chunk"] = chunk
+                yield chunk
+
+        n_written = write_trajectory_stream(args.save, remember_last(chunks), n_samples=n_samples, metadata=metadata)
+        t_last, theta_last, theta_dot_last = (column[-1] for column in last["chunk"])
+        if args.checkpoint:
+            write_checkpoint(args.save, params, t_last, theta_last, theta_dot_last, n_written, args.periods)
+        print(f"Written {n_written} points to {args.save}")
+        if args.plot:
+            times, theta_values, theta_dot_values, _ = load_trajectory(args.save, mmap_mode="r")
+    else:
+        result = compute_pendulum_trajectory(
+            x0=args.x0,
+            omega=args.omega,
+            theta0=args.theta0,
+            theta_dot0=args.theta_dot0,
+            d=args.d,
+            g=args.g,
+            N_periods=args.periods,
+            t_eval=2 * np.pi / args.samples_per_period * np.arange(n_samples),
+            solver_method=args.method,
+            rtol=args.rtol,
+            atol=args.atol,
+            step_size=args.step_size,
+            return_stats=bool(args.stats),
+            backend=args.backend,
+        )
+        times, theta_values, theta_dot_values = result[:3]
+        save_trajectory(args.save, times, theta_values, theta_dot_values, metadata=metadata)
+        if args.checkpoint:
+            write_checkpoint(args.save, params, times[-1], theta_values[-1], theta_dot_values[-1], len(times), args.periods)
+        print(f"Written {len(times)} points to {args.save}")
+
+        if args.stats:
+            stats_json = json.dumps(result[3].to_dict(), indent=2)
+            if args.stats == "-":
+                print(stats_json)
+            else:
+                with open(args.stats, "w") as file:
+                    file.write(stats_json + "\n")
+                print(f"Wrote solver stats to {args.stats}")
 
     if args.plot:
+        # matplotlib is only imported when plotting; it dominates start-up time otherwise
+        import matplotlib.pyplot as plt
+
         plt.figure(figsize=(10, 6))
-        plt.scatter(theta_values, theta_dot_values, color="red", s=8)
+        plot_lod(plt.gca(), theta_values, theta_dot_values, style="scatter", max_points=args.max_points, color="red", s=8, dpi=200)
         plt.title(f"Phase-Space: x0={args.x0}, omega={args.omega}, theta0={args.theta0}, theta_dot0={args.theta_dot0}")
         plt.xlabel("Theta (rad)")
         plt.ylabel("Theta_dot (rad/s)")
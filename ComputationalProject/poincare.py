@@ -0,0 +1,280 @@
+"""Poincaré surface-of-section engine.
+
+`poincare_section` drives a scipy `OdeSolver` one step at a time, watches a
+section function g(t, y) for sign changes and locates each crossing by root
+finding on that step's local interpolant.  Nothing but the crossings is kept:
+no dense output is stored and integration stops as soon as the requested
+number of crossings has been collected.  `poincare_sections` runs many initial
+conditions in parallel in a process pool.
+
+`stroboscopic_map` is the time-periodic special case: it records the state at
+every drive period boundary t_start + k * period from the same step loop,
+straight into a preallocated buffer, optionally after discarding a transient.
+
+The RHS and section functions follow solve_ivp conventions, and the section
+may carry a ``direction`` attribute exactly like a solve_ivp event.  Besides
+scipy's adaptive solvers, method may be "implicit_midpoint" or
+"stormer_verlet": the fixed-step symplectic schemes of `symplectic`, wrapped
+as `OdeSolver` classes (step_size= sets their step).  Stormer-Verlet splits
+y into (q, p) halves, so fun must be in canonical form; for a Hamiltonian
+system both keep the energy bounded over very long section runs.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+from scipy.integrate import BDF, DOP853, LSODA, RK23, RK45, DenseOutput, OdeSolver, Radau
+from scipy.optimize import brentq
+
+from ComputationalProject.symplectic import midpoint_step, stormer_verlet_step
+
+
+class _HermiteDenseOutput(DenseOutput):
+    """Cubic Hermite interpolant of one step from the end states and their derivatives."""
+
+    def __init__(self, t_old, t, y_old, y, f_old, f):
+        super().__init__(t_old, t)
+        self.h = t - t_old
+        self.y_old, self.y, self.f_old, self.f = y_old, y, f_old, f
+
+    def _call_impl(self, t):
+        s = (np.asarray(t) - self.t_old) / self.h
+        h00 = (1 + 2 * s) * (1 - s) ** 2
+        h10 = s * (1 - s) ** 2
+        h01 = s**2 * (3 - 2 * s)
+        h11 = s**2 * (s - 1)
+        y = np.multiply.outer(self.y_old, h00) + np.multiply.outer(self.h * self.f_old, h10)
+        return y + np.multiply.outer(self.y, h01) + np.multiply.outer(self.h * self.f, h11)
+
+
+class _FixedStepSolver(OdeSolver):
+    """Base for fixed-step `OdeSolver`s; rtol/atol are accepted for interface compatibility and ignored."""
+
+    def __init__(self, fun, t0, y0, t_bound, step_size=0.01, max_step=np.inf, rtol=None, atol=None, vectorized=False):
+        super().__init__(fun, t0, y0, t_bound, vectorized)
+        self.h_max = min(float(step_size), float(max_step))
+        self.t_old = None
+        self.y_old = None
+
+    def _step_impl(self):
+        h = self.direction * min(self.h_max, abs(self.t_bound - self.t))
+        try:
+            y_new = self._advance(self.t, self.y, h)
+        except RuntimeError as exc:
+            return False, str(exc)
+        self.t_old, self.y_old = self.t, self.y
+        self.t = self.t + h
+        self.y = y_new
+        return True, None
+
+    def _dense_output_impl(self):
+        return _HermiteDenseOutput(
+            self.t_old, self.t, self.y_old, self.y, self.fun(self.t_old, self.y_old), self.fun(self.t, self.y)
+        )
+
+
+class ImplicitMidpointSolver(_FixedStepSolver):
+    """The implicit midpoint rule (`symplectic.midpoint_step`) as a scipy `OdeSolver`."""
+
+    def _advance(self, t, y, h):
+        return midpoint_step(self.fun, t, y, h)
+
+
+class StormerVerletSolver(_FixedStepSolver):
+    """Generalized Stormer-Verlet as a scipy `OdeSolver`; y is (q, p) with q the first half."""
+
+    def __init__(self, fun, t0, y0, t_bound, **options):
+        super().__init__(fun, t0, y0, t_bound, **options)
+        if self.n % 2:
+            raise ValueError("stormer_verlet needs a state of even length, (q, p) halves")
+
+    def _advance(self, t, y, h):
+        half = self.n // 2
+
+        def f_q(t, q, p):
+            return self.fun(t, np.concatenate([q, p]))[:half]
+
+        def f_p(t, q, p):
+            return self.fun(t, np.concatenate([q, p]))[half:]
+
+        q, p = stormer_verlet_step(f_q, f_p, t, y[:half], y[half:], h)
+        return np.concatenate([q, p])
+
+
+SOLVERS = {
+    "RK23": RK23,
+    "RK45": RK45,
+    "DOP853": DOP853,
+    "Radau": Radau,
+    "BDF": BDF,
+    "LSODA": LSODA,
+    "implicit_midpoint": ImplicitMidpointSolver,
+    "stormer_verlet": StormerVerletSolver,
+}
+
+
+def _is_crossing(g_old, g_new, direction):
+    # Same rule as solve_ivp's event detection
+    up = g_old <= 0 <= g_new
+    down = g_old >= 0 >= g_new
+    if direction > 0:
+        return up
+    if direction < 0:
+        return down
+    return up or down
+
+
+def _step_until(solver, on_step):
+    """Advance an OdeSolver one step at a time, calling on_step(t_old, solver) after each step.
+
+    Stops when on_step returns False, the solver reaches its t_bound, or a step fails.
+    """
+    while solver.status == "running":
+        t_old = solver.t
+        solver.step()
+        if solver.status == "failed" or not on_step(t_old, solver):
+            break
+
+
+def poincare_section(
+    fun,
+    y0,
+    section,
+    n_crossings,
+    t_start=0.0,
+    t_max=np.inf,
+    direction=None,
+    method="RK45",
+    rtol=1e-3,
+    atol=1e-6,
+    max_step=np.inf,
+    **solver_options,
+):
+    """Collect up to n_crossings points where the trajectory crosses section(t, y) = 0.
+
+    direction selects upward (> 0), downward (< 0) or all (0) crossings and
+    defaults to section.direction if set.  Integration stops after
+    n_crossings crossings, at t_max, or if the solver fails.  Extra keyword
+    arguments (e.g. step_size for the symplectic methods) go to the solver.
+
+    Returns (t_crossings, y_crossings) with shapes (k,) and (k, len(y0)), k <= n_crossings.
+    """
+    if direction is None:
+        direction = getattr(section, "direction", 0)
+    solver_cls = SOLVERS[method] if isinstance(method, str) else method
+    solver = solver_cls(
+        fun, t_start, np.asarray(y0, dtype=float), t_max, rtol=rtol, atol=atol, max_step=max_step, **solver_options
+    )
+
+    t_crossings = []
+    y_crossings = []
+    g_old = section(solver.t, solver.y)
+
+    def on_step(t_old, solver):
+        nonlocal g_old
+        g_new = section(solver.t, solver.y)
+        if _is_crossing(g_old, g_new, direction):
+            interpolant = solver.dense_output()
+            if g_new == 0:
+                t_root = solver.t
+            else:
+                t_root = brentq(lambda t: section(t, interpolant(t)), t_old, solver.t, xtol=4 * np.finfo(float).eps)
+            t_crossings.append(t_root)
+            y_crossings.append(interpolant(t_root))
+        g_old = g_new
+        return len(t_crossings) < n_crossings
+
+    if n_crossings > 0:
+        _step_until(solver, on_step)
+
+    return np.array(t_crossings), np.array(y_crossings).reshape(len(t_crossings), len(y0))
+
+
+def poincare_sections(fun, y0s, section, n_crossings, max_workers=None, **kwargs):
+    """Run `poincare_section` for every initial condition in y0s, in parallel.
+
+    fun and section must be picklable (module-level functions).  max_workers
+    defaults to os.cpu_count(); max_workers=1 runs serially in-process.
+    Returns a list of (t_crossings, y_crossings) in the order of y0s.
+    """
+    run = partial(poincare_section, fun, section=section, n_crossings=n_crossings, **kwargs)
+    y0s = [np.asarray(y0, dtype=float) for y0 in y0s]
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_workers == 1 or len(y0s) <= 1:
+        return [run(y0) for y0 in y0s]
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(y0s))) as pool:
+        return list(pool.map(run, y0s))
+
+
+def stroboscopic_map(
+    fun,
+    y0,
+    period,
+    n_periods,
+    t_start=0.0,
+    transient_periods=0,
+    method="RK45",
+    rtol=1e-3,
+    atol=1e-6,
+    max_step=np.inf,
+    out=None,
+    **solver_options,
+):
+    """Record the state at the period boundaries t_start + k * period, transient_periods <= k <= n_periods.
+
+    The first transient_periods periods are integrated but not recorded.  Each
+    solver step interpolates only the boundaries it passed over into out, a
+    preallocated (n_periods - transient_periods + 1, len(y0)) array (allocated
+    here if None; pass e.g. an np.memmap to stream a very long map to disk).
+    Steps and sampled values are the ones solve_ivp would give for the same
+    boundaries as t_eval.
+
+    Extra keyword arguments go to the solver, as in `poincare_section`.
+
+    Returns (t_samples, y_samples), views truncated to the points recorded
+    before the solver stopped (all of them unless a step failed).
+    """
+    if not 0 <= transient_periods <= n_periods:
+        raise ValueError(f"transient_periods must lie in [0, n_periods], got {transient_periods}")
+    y0 = np.asarray(y0, dtype=float)
+    n_samples = n_periods - transient_periods + 1
+    if out is None:
+        out = np.empty((n_samples, len(y0)))
+    elif out.shape != (n_samples, len(y0)):
+        raise ValueError(f"out must have shape {(n_samples, len(y0))}, got {out.shape}")
+    times = t_start + period * np.arange(transient_periods, n_periods + 1, dtype=float)
+
+    n_recorded = 0
+    if transient_periods == 0:
+        out[0] = y0
+        n_recorded = 1
+
+    def on_step(t_old, solver):
+        nonlocal n_recorded
+        stop = np.searchsorted(times, solver.t, side="right")
+        if stop > n_recorded:
+            out[n_recorded:stop] = solver.dense_output()(times[n_recorded:stop]).T
+            n_recorded = stop
+        return n_recorded < n_samples
+
+    if n_recorded < n_samples:
+        solver_cls = SOLVERS[method] if isinstance(method, str) else method
+        solver = solver_cls(
+            fun, t_start, y0, times[-1], rtol=rtol, atol=atol, max_step=max_step, **solver_options
+        )
+        _step_until(solver, on_step)
+
+    return times[:n_recorded], out[:n_recorded]
+
+
+__all__ = [
+    "poincare_section",
+    "poincare_sections",
+    "stroboscopic_map",
+    "ImplicitMidpointSolver",
+    "StormerVerletSolver",
+    "SOLVERS",
+]
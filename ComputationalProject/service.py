@@ -0,0 +1,376 @@
+"""Local HTTP service that computes trajectories and sweeps on demand.
+
+Other programs POST a JSON job and read back a binary ``.npy`` payload, so
+nobody has to shell out to `numericalIntegrator.py` and parse CSV:
+
+- ``POST /trajectory`` takes `compute_pendulum_trajectory` parameters plus
+  ``samples_per_period`` and returns a (T, 3) float64 array of
+  (time, theta, theta_dot) rows, the layout `trajectory_io` uses on disk.
+- ``POST /sweep`` takes `sweep_pendulum` parameters and returns a
+  (2, len(x0_values), len(omega_values), N_periods + 1) array of theta and
+  theta_dot sampled at t = 2*pi*k.
+- ``GET /health`` reports queue and pool state as JSON.
+
+Jobs run in a process pool whose workers import scipy and integrate a short
+trajectory when they start, so requests never pay the import cost.  Identical
+jobs that are in flight together are computed once and every caller gets the
+result.  At most `max_concurrency` jobs run at a time and at most `max_queue`
+more may wait; anything beyond that is refused with 503.  A job running longer
+than `job_timeout` seconds is answered with 504; its worker still finishes the
+computation (which then lands in the trajectory cache unless the service runs
+with --no-cache) and the job keeps its concurrency slot until it does.
+Clients get `read_timeout` seconds to send their request (408 after).  Results
+are streamed with chunked transfer encoding.
+
+The server is plain asyncio with no third-party dependencies:
+
+    python -m ComputationalProject.service --port 8111 --workers 4
+"""
+
+import argparse
+import asyncio
+import functools
+import io
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+TRAJECTORY_PARAMS = frozenset(
+    ["x0", "omega", "theta0", "theta_dot0", "d", "g", "N_periods", "samples_per_period", "t_start"]
+    + ["solver_method", "rtol", "atol", "step_size", "backend"]
+)
+SWEEP_PARAMS = frozenset(["x0_values", "omega_values", "theta0", "theta_dot0", "d", "g", "N_periods", "rtol", "atol"])
+
+REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    408: "Request Timeout",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+    504: "Gateway Timeout",
+}
+MAX_BODY_BYTES = 1 << 20
+
+
+@dataclass
+class ServiceConfig:
+    """Settings for `TrajectoryService`; None for max_workers/max_concurrency means os.cpu_count()."""
+
+    host: str = "127.0.0.1"
+    port: int = 8111
+    max_workers: Optional[int] = None
+    max_concurrency: Optional[int] = None
+    max_queue: int = 64
+    job_timeout: float = 300.0
+    read_timeout: float = 30.0
+    chunk_bytes: int = 1 << 16
+    use_cache: bool = True
+
+
+class HTTPError(Exception):
+    """Raised while handling a request to answer it with the given status code."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _warm_worker(use_cache=True):
+    # Pay for the scipy import and the first solve_ivp call once per worker
+    from ComputationalProject.cache import configure_cache
+    from ComputationalProject.integrator import compute_pendulum_trajectory
+
+    if not use_cache:
+        configure_cache(enabled=False)
+
+    compute_pendulum_trajectory(N_periods=1, cache=False)
+
+
+def _ping():
+    return os.getpid()
+
+
+def _npy_bytes(array):
+    buffer = io.BytesIO()
+    np.save(buffer, np.ascontiguousarray(array, dtype=np.float64))
+    return buffer.getvalue()
+
+
+def run_trajectory_job(params):
+    """Compute one trajectory job and return it as .npy bytes of (time, theta, theta_dot) rows."""
+    from ComputationalProject.integrator import compute_pendulum_trajectory
+
+    params = dict(params)
+    samples_per_period = int(params.pop("samples_per_period", 1))
+    n_periods = int(params.get("N_periods", 10))
+    t_start = float(params.get("t_start", 0.0))
+    t_eval = t_start + 2 * np.pi / samples_per_period * np.arange(n_periods * samples_per_period + 1)
+    times, theta_values, theta_dot_values = compute_pendulum_trajectory(t_eval=t_eval, **params)
+    return _npy_bytes(np.column_stack([times, theta_values, theta_dot_values]))
+
+
+def run_sweep_job(params):
+    """Compute one sweep job and return np.stack([theta, theta_dot]) as .npy bytes."""
+    from ComputationalProject.sweep import sweep_pendulum
+
+    # Already inside a pool worker, so the sweep itself runs in-process
+    _, theta_values, theta_dot_values = sweep_pendulum(max_workers=1, **params)
+    return _npy_bytes(np.stack([theta_values, theta_dot_values]))
+
+
+JOBS = {
+    "/trajectory": (run_trajectory_job, TRAJECTORY_PARAMS),
+    "/sweep": (run_sweep_job, SWEEP_PARAMS),
+}
+
+
+class TrajectoryService:
+    """asyncio HTTP front end that runs trajectory and sweep jobs on a warm process pool."""
+
+    def __init__(self, config=None, jobs=None):
+        self.config = config or ServiceConfig()
+        self.jobs = JOBS if jobs is None else jobs
+        self.max_workers = self.config.max_workers or os.cpu_count() or 1
+        self.max_concurrency = self.config.max_concurrency or self.max_workers
+        self.stats = {"requests": 0, "jobs": 0, "coalesced": 0, "rejected": 0, "timeouts": 0}
+        self._inflight = {}
+        self._admitted = 0
+        self._abandoned = 0
+        self._semaphore = None
+        self._pool = None
+        self._server = None
+
+    @property
+    def port(self):
+        """Port the server is bound to (useful with port=0)."""
+        return self._server.sockets[0].getsockname()[1]
+
+    async def start(self):
+        """Start the worker pool, warm every worker and begin accepting connections."""
+        loop = asyncio.get_running_loop()
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.max_workers, initializer=_warm_worker, initargs=(self.config.use_cache,)
+        )
+        await asyncio.gather(*(loop.run_in_executor(self._pool, _ping) for _ in range(self.max_workers)))
+        self._server = await asyncio.start_server(self._handle, self.config.host, self.config.port)
+        return self
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+
+    async def serve_forever(self):
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def run_job(self, path, params):
+        """Run (or join an identical in-flight) job and return its result bytes."""
+        fn, allowed = self.jobs[path]
+        unknown = sorted(set(params) - allowed)
+        if unknown:
+            raise HTTPError(400, f"unknown parameter(s) for {path}: {', '.join(unknown)}")
+
+        key = path + json.dumps(params, sort_keys=True)
+        task = self._inflight.get(key)
+        if task is None:
+            if self._admitted >= self.max_concurrency + self.config.max_queue:
+                self.stats["rejected"] += 1
+                raise HTTPError(503, "job queue is full")
+            # Count the job now, not when its task first runs, so a burst cannot overshoot the limit
+            self._admitted += 1
+            task = asyncio.ensure_future(self._execute(fn, params))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.stats["coalesced"] += 1
+        # Shield so one caller disconnecting does not cancel the job for the others
+        return await asyncio.shield(task)
+
+    async def _execute(self, fn, params):
+        try:
+            await self._semaphore.acquire()
+        except BaseException:
+            self._admitted -= 1
+            raise
+        future = None
+        abandoned = False
+        try:
+            self.stats["jobs"] += 1
+            future = asyncio.get_running_loop().run_in_executor(self._pool, fn, params)
+            # Shielded: a timeout answers the caller but must not detach the job from its slot
+            return await asyncio.wait_for(asyncio.shield(future), self.config.job_timeout)
+        except asyncio.TimeoutError:
+            self.stats["timeouts"] += 1
+            self._abandoned += 1
+            abandoned = True
+            raise HTTPError(504, f"job exceeded {self.config.job_timeout} s") from None
+        except (TypeError, ValueError) as exc:
+            raise HTTPError(400, str(exc)) from None
+        finally:
+            # The slot is held until the worker is really done, even after a timeout
+            if future is None:
+                self._release()
+            else:
+                future.add_done_callback(functools.partial(self._job_done, abandoned))
+
+    def _job_done(self, abandoned, future):
+        if abandoned:
+            self._abandoned -= 1
+            if not future.cancelled():
+                future.exception()  # retrieved, so asyncio does not log it as unhandled
+        self._release()
+
+    def _release(self):
+        self._admitted -= 1
+        self._semaphore.release()
+
+    def health(self):
+        return dict(
+            self.stats,
+            running=min(self._admitted, self.max_concurrency),
+            queued=max(0, self._admitted - self.max_concurrency),
+            abandoned=self._abandoned,
+            workers=self.max_workers,
+            max_queue=self.config.max_queue,
+        )
+
+    async def _handle(self, reader, writer):
+        try:
+            try:
+                try:
+                    method, path, body = await asyncio.wait_for(_read_request(reader), self.config.read_timeout)
+                except asyncio.TimeoutError:
+                    raise HTTPError(408, f"request not received within {self.config.read_timeout} s") from None
+                self.stats["requests"] += 1
+                if path == "/health":
+                    if method != "GET":
+                        raise HTTPError(405, "use GET")
+                    await _send(writer, 200, json.dumps(self.health()).encode(), "application/json")
+                    return
+                if path not in self.jobs:
+                    raise HTTPError(404, f"no such endpoint {path}")
+                if method != "POST":
+                    raise HTTPError(405, "use POST with a JSON body")
+                try:
+                    params = json.loads(body or b"{}")
+                except json.JSONDecodeError as exc:
+                    raise HTTPError(400, f"invalid JSON: {exc}") from None
+                if not isinstance(params, dict):
+                    raise HTTPError(400, "request body must be a JSON object")
+                payload = await self.run_job(path, params)
+            except HTTPError as exc:
+                await _send(writer, exc.status, json.dumps({"error": str(exc)}).encode(), "application/json")
+                return
+            except Exception as exc:  # keep serving whatever a job raises
+                await _send(writer, 500, json.dumps({"error": repr(exc)}).encode(), "application/json")
+                return
+            await _send_chunked(writer, payload, self.config.chunk_bytes)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+async def _read_request(reader):
+    request_line = (await reader.readline()).decode("latin-1").split()
+    if len(request_line) != 3:
+        raise HTTPError(400, "malformed request line")
+    method, target, _ = request_line
+    headers = {}
+    while True:
+        line = (await reader.readline()).decode("latin-1").strip()
+        if not line:
+            break
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    try:
+        length = int(headers.get("content-length", 0))
+    except ValueError:
+        raise HTTPError(400, "invalid Content-Length") from None
+    if length < 0:
+        raise HTTPError(400, "invalid Content-Length")
+    if length > MAX_BODY_BYTES:
+        raise HTTPError(413, "request body too large")
+    body = await reader.readexactly(length) if length else b""
+    return method.upper(), target.split("?", 1)[0], body
+
+
+def _status_line(status):
+    return f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+
+
+async def _send(writer, status, body, content_type):
+    head = _status_line(status)
+    head += f"Content-Type: {content_type}\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n"
+    writer.write(head.encode("latin-1") + body)
+    await writer.drain()
+
+
+async def _send_chunked(writer, payload, chunk_bytes):
+    head = _status_line(200)
+    head += "Content-Type: application/octet-stream\r\nTransfer-Encoding: chunked\r\nConnection: close\r\n\r\n"
+    writer.write(head.encode("latin-1"))
+    view = memoryview(payload)
+    for start in range(0, len(view), chunk_bytes):
+        chunk = view[start : start + chunk_bytes]
+        writer.write(b"%x\r\n" % len(chunk) + chunk + b"\r\n")
+        await writer.drain()
+    writer.write(b"0\r\n\r\n")
+    await writer.drain()
+
+
+async def serve(config):
+    service = await TrajectoryService(config).start()
+    print(f"Serving trajectories on http://{config.host}:{service.port} with {service.max_workers} workers")
+    try:
+        await service.serve_forever()
+    finally:
+        await service.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve pendulum trajectories and sweeps over local HTTP")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind")
+    parser.add_argument("--port", type=int, default=8111, help="Port to listen on")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument("--max-concurrency", type=int, default=None, help="Jobs run at once (default: --workers)")
+    parser.add_argument("--max-queue", type=int, default=64, help="Jobs allowed to wait before requests get 503")
+    parser.add_argument("--timeout", type=float, default=300.0, help="Per-job time limit in seconds (504 after)")
+    parser.add_argument(
+        "--read-timeout", type=float, default=30.0, help="Seconds a client may take to send its request (408 after)"
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Do not use the trajectory cache in the workers")
+    args = parser.parse_args()
+
+    config = ServiceConfig(
+        host=args.host,
+        port=args.port,
+        max_workers=args.workers,
+        max_concurrency=args.max_concurrency,
+        max_queue=args.max_queue,
+        job_timeout=args.timeout,
+        read_timeout=args.read_timeout,
+        use_cache=not args.no_cache,
+    )
+    try:
+        asyncio.run(serve(config))
+    except KeyboardInterrupt:
+        pass
+
+
+__all__ = ["ServiceConfig", "TrajectoryService", "run_trajectory_job", "run_sweep_job", "serve"]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Process-pool ensembles whose workers write results straight into a shared memory-mapped array.
+
+With a plain `ProcessPoolExecutor` every chunk's (theta_values,
+theta_dot_values) arrays are pickled in the worker and unpickled in the
+parent, which dominates large sweeps.  Here the parent creates one
+``.npy`` file of shape (n_outputs, n_members, ...) and maps it; each worker
+maps the same file, writes its chunk's outputs into the rows
+[start:stop] and returns only the (start, stop) pair as a completion
+notice.  The parent's mapping sees the data without any copy.
+
+Without an explicit path the file is a scratch file in ``/dev/shm`` (RAM
+backed) when that has room, otherwise in the temporary directory
+(``PHYS111_SHARED_DIR`` overrides both).  It is unlinked once the workers are
+done; the returned memmap stays valid until it is dropped.  With a path the
+results are kept there as an ordinary ``.npy`` file.
+"""
+
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+
+def scratch_dir(nbytes):
+    """Directory for a temporary nbytes-sized output: $PHYS111_SHARED_DIR, /dev/shm if it fits, else the temp dir."""
+    directory = os.environ.get("PHYS111_SHARED_DIR")
+    if directory:
+        return directory
+    try:
+        stats = os.statvfs("/dev/shm")
+        # Leave headroom: writing past a full tmpfs kills the writer with SIGBUS
+        if stats.f_bavail * stats.f_frsize > 2 * nbytes:
+            return "/dev/shm"
+    except (AttributeError, OSError):
+        pass
+    return tempfile.gettempdir()
+
+
+def _run_chunk(path, fn, start, stop, args):
+    values = fn(*args)
+    out = np.load(path, mmap_mode="r+")
+    for k, value in enumerate(values):
+        out[k, start:stop] = value
+    del out
+    return start, stop
+
+
+def run_shared_ensemble(fn, tasks, shape, path=None, max_workers=None, on_complete=None):
+    """Run fn(*args) for every (start, stop, args) in tasks and gather the outputs into one array.
+
+    fn returns a sequence of shape[0] arrays, each of shape
+    (stop - start,) + shape[2:]; output k lands in result[k, start:stop].
+    Tasks run in a process pool of max_workers (default os.cpu_count()), so fn
+    and args must be picklable; max_workers=1 runs in-process.
+    on_complete(start, stop) is called in the parent as chunks finish.
+
+    Returns the (shape) float array: an np.memmap of path if given, or of an
+    unlinked scratch file when a pool is used, else an in-memory ndarray.
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if path is None and max_workers == 1:
+        result = np.empty(shape)
+        for start, stop, args in tasks:
+            for k, value in enumerate(fn(*args)):
+                result[k, start:stop] = value
+            if on_complete:
+                on_complete(start, stop)
+        return result
+
+    temporary = path is None
+    if temporary:
+        fd, path = tempfile.mkstemp(suffix=".npy", dir=scratch_dir(8 * int(np.prod(shape))))
+        os.close(fd)
+    try:
+        result = np.lib.format.open_memmap(path, mode="w+", dtype=float, shape=shape)
+        if max_workers == 1:
+            done = (_run_chunk(path, fn, start, stop, args) for start, stop, args in tasks)
+            for start, stop in done:
+                if on_complete:
+                    on_complete(start, stop)
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                futures = [pool.submit(_run_chunk, path, fn, start, stop, args) for start, stop, args in tasks]
+                for future in as_completed(futures):
+                    start, stop = future.result()
+                    if on_complete:
+                        on_complete(start, stop)
+        if not temporary:
+            result.flush()
+        return result
+    finally:
+        if temporary:
+            # The mapping outlives the name on POSIX; elsewhere the file is left behind
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+
+__all__ = ["run_shared_ensemble", "scratch_dir"]
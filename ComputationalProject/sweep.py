@@ -0,0 +1,103 @@
+"""Parameter sweeps of the driven pendulum over (x0, omega) grids.
+
+The grid is flattened, cut into contiguous chunks and each chunk is integrated
+as one batched ensemble (see `integrator.compute_pendulum_ensemble`) inside a
+`concurrent.futures` process pool.  Workers write their chunks straight into
+one shared memory-mapped result array by position (see `shared_ensemble`), so
+results are never pickled back and the output order never depends on which
+worker finishes first.
+"""
+
+import os
+
+import numpy as np
+
+from ComputationalProject.integrator import compute_pendulum_ensemble
+from ComputationalProject.shared_ensemble import run_shared_ensemble
+
+
+def chunk_bounds(n_items, chunk_size):
+    """Return a list of (start, stop) pairs covering range(n_items) in chunk_size steps."""
+    return [(start, min(start + chunk_size, n_items)) for start in range(0, n_items, chunk_size)]
+
+
+def _default_chunk_size(n_items, max_workers):
+    # Aim for a few chunks per worker so a slow chunk cannot leave cores idle,
+    # while keeping chunks big enough for the vectorized ensemble to pay off.
+    return max(1, min(1024, -(-n_items // (4 * max_workers))))
+
+
+def _integrate_chunk(x0, omega, theta0, theta_dot0, d, g, t_start, t_eval, rtol, atol):
+    _, theta_values, theta_dot_values = compute_pendulum_ensemble(
+        x0=x0,
+        omega=omega,
+        theta0=theta0,
+        theta_dot0=theta_dot0,
+        d=d,
+        g=g,
+        t_start=t_start,
+        t_eval=t_eval,
+        rtol=rtol,
+        atol=atol,
+    )
+    return theta_values, theta_dot_values
+
+
+def sweep_pendulum(
+    x0_values,
+    omega_values,
+    theta0=np.pi,
+    theta_dot0=2.5,
+    d=1.0,
+    g=9.81,
+    N_periods=10,
+    t_start=0.0,
+    t_eval=None,
+    rtol=1e-8,
+    atol=1e-8,
+    max_workers=None,
+    chunk_size=None,
+    out=None,
+):
+    """Integrate the pendulum for every point of the (x0_values x omega_values) grid.
+
+    theta0 and theta_dot0 may be scalars or arrays broadcastable to the grid
+    shape (len(x0_values), len(omega_values)).  max_workers defaults to
+    os.cpu_count(); max_workers=1 runs in-process without a pool.  out may
+    name a .npy file that receives theta and theta_dot as one
+    (2, len(x0_values) * len(omega_values), T) array, grid flattened in C order.
+
+    Returns (times, theta_values, theta_dot_values) with shapes (T,),
+    (len(x0_values), len(omega_values), T) and the same again; with a pool
+    or out these are views of a memory-mapped array.
+    """
+    X0, OMEGA = np.meshgrid(np.asarray(x0_values, dtype=float), np.asarray(omega_values, dtype=float), indexing="ij")
+    grid_shape = X0.shape
+    theta0 = np.broadcast_to(np.asarray(theta0, dtype=float), grid_shape).ravel()
+    theta_dot0 = np.broadcast_to(np.asarray(theta_dot0, dtype=float), grid_shape).ravel()
+    x0, omega = X0.ravel(), OMEGA.ravel()
+
+    if t_eval is None:
+        t_eval = 2 * np.pi * np.arange(0, N_periods + 1)
+    t_eval = np.asarray(t_eval, dtype=float)
+
+    n_points = x0.size
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = _default_chunk_size(n_points, max_workers)
+
+    def chunk_args(start, stop):
+        s = slice(start, stop)
+        return (x0[s], omega[s], theta0[s], theta_dot0[s], d, g, t_start, t_eval, rtol, atol)
+
+    tasks = [(start, stop, chunk_args(start, stop)) for start, stop in chunk_bounds(n_points, chunk_size)]
+    result = run_shared_ensemble(
+        _integrate_chunk, tasks, (2, n_points, len(t_eval)), path=out, max_workers=max_workers
+    )
+
+    out_shape = grid_shape + (len(t_eval),)
+    return t_eval, result[0].reshape(out_shape), result[1].reshape(out_shape)
+
+
+__all__ = ["sweep_pendulum", "chunk_bounds"]
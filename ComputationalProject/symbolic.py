@@ -0,0 +1,201 @@
+"""Compile-once symbolic eigensystems: derive with SymPy, evaluate with NumPy.
+
+A model is a small JSON-able dict naming its parameters and giving the two
+matrices of the generalized eigenproblem K x = w2 M x as expression strings,
+e.g. `CART_PENDULUM` for the Pset7 system.  `compile_eigensystem` derives,
+once per model,
+
+- the coefficients of the characteristic polynomial det(K - w2 M),
+- its roots w2, and
+- for every root the columns of adj(K - w2 M), which span its null space,
+
+simplifies them with common-subexpression elimination and prints them as a
+small Python module of NumPy code.  That source is cached on disk under
+``$PHYS111_KERNEL_DIR`` (default ``~/.cache/phys111/kernels``), keyed by a
+hash of the model definition, so later runs skip SymPy entirely, not even
+importing it.  A cached file that does not load (truncated or corrupt) is
+regenerated.  ``PHYS111_CACHE=0`` turns the disk cache off.
+
+The roots come from sympy.solve, so this suits the small systems (n = 2 or 3)
+of the problem sets; `normal_modes.generalized_eig` handles larger ones.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+
+import numpy as np
+
+from ComputationalProject.normal_modes import sort_and_normalize_modes
+
+DEFAULT_KERNEL_DIR = os.path.join(os.path.expanduser("~"), ".cache", "phys111", "kernels")
+# Bump when the generated source changes shape, so stale cache entries are ignored
+KERNEL_FORMAT = 1
+
+CART_PENDULUM = {
+    "params": ["M", "m", "l", "k", "g"],
+    "K": [["M + m", "m"], ["m", "m"]],
+    "M": [["k", "0"], ["0", "-m*g/l"]],
+}
+
+_compiled = {}
+# Every generated module defines these; a source lacking one was cut short
+_GENERATED_NAMES = ("PARAMS", "N", "characteristic_coefficients", "eigensystem")
+
+
+def model_key(model):
+    """Return the hex digest identifying a model definition (and the generated-code format)."""
+    payload = json.dumps({"model": model, "format": KERNEL_FORMAT}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _function_source(name, params, exprs, printer, sp):
+    replacements, reduced = sp.cse(exprs, symbols=sp.numbered_symbols("_cse"))
+    lines = [f"def {name}({', '.join(params)}):"]
+    for symbol, expr in replacements:
+        lines.append(f"    {symbol} = {printer.doprint(expr)}")
+    lines.append(f"    return [{', '.join(printer.doprint(expr) for expr in reduced)}]")
+    return "\n".join(lines) + "\n"
+
+
+def generate_eigensystem_source(model):
+    """Derive the eigensystem of a model with SymPy and return it as NumPy module source."""
+    import sympy as sp
+    from sympy.printing.numpy import NumPyPrinter
+
+    params = list(model["params"])
+    symbols = {name: sp.Symbol(name) for name in params}
+    K = sp.Matrix(sp.sympify(model["K"], locals=symbols))
+    M = sp.Matrix(sp.sympify(model["M"], locals=symbols))
+    if K.shape != M.shape or K.shape[0] != K.shape[1]:
+        raise ValueError(f"K and M must be square matrices of the same size, got {K.shape} and {M.shape}")
+    n = K.shape[0]
+
+    w2 = sp.Dummy("w2")
+    A = K - w2 * M
+    polynomial = sp.Poly(sp.expand(A.det()), w2)
+    roots = sp.solve(polynomial.as_expr(), w2)
+    if len(roots) != n:
+        raise ValueError(f"expected {n} distinct generic roots of the characteristic polynomial, got {len(roots)}")
+    coefficients = [0] * (n + 1 - len(polynomial.all_coeffs())) + polynomial.all_coeffs()
+
+    adjugate = A.adjugate()
+    candidates = [adjugate[i, j].subs(w2, root) for root in roots for j in range(n) for i in range(n)]
+
+    printer = NumPyPrinter()
+    header = (
+        f"# Generated by ComputationalProject.symbolic (format {KERNEL_FORMAT}) for model\n"
+        f"# {json.dumps(model, sort_keys=True)}\n"
+        f"PARAMS = {tuple(params)!r}\n"
+        f"N = {n}\n\n\n"
+    )
+    return (
+        header
+        + _function_source("characteristic_coefficients", params, coefficients, printer, sp)
+        + "\n\n"
+        + _function_source("eigensystem", params, list(roots) + candidates, printer, sp)
+    )
+
+
+class CompiledEigensystem:
+    """NumPy evaluation of a model's eigensystem; see `compile_eigensystem`."""
+
+    def __init__(self, source):
+        self.source = source
+        self._namespace = {"numpy": np}
+        exec(compile(source, "<compiled eigensystem>", "exec"), self._namespace)
+        missing = [name for name in _GENERATED_NAMES if name not in self._namespace]
+        if missing:
+            raise ValueError(f"generated eigensystem source is incomplete: missing {', '.join(missing)}")
+        self.params = self._namespace["PARAMS"]
+        self.n = self._namespace["N"]
+
+    def _bind(self, args, kwargs):
+        values = dict(zip(self.params, args))
+        values.update(kwargs)
+        missing = [name for name in self.params if name not in values]
+        if missing or len(values) != len(self.params):
+            raise TypeError(f"expected parameters {self.params}, got {sorted(values)}")
+        arrays = np.broadcast_arrays(*(np.asarray(values[name], dtype=float) for name in self.params))
+        return arrays, arrays[0].shape
+
+    def _evaluate(self, name, arrays, shape):
+        return np.stack([np.broadcast_to(value, shape) for value in self._namespace[name](*arrays)], axis=-1)
+
+    def characteristic_coefficients(self, *args, **kwargs):
+        """Coefficients of det(K - w2 M) in w2, highest power first, shape broadcast_shape + (n + 1,)."""
+        arrays, shape = self._bind(args, kwargs)
+        return self._evaluate("characteristic_coefficients", arrays, shape)
+
+    def __call__(self, *args, **kwargs):
+        """Return (w2, modes) with shapes broadcast_shape + (n,) and broadcast_shape + (n, n)."""
+        arrays, shape = self._bind(args, kwargs)
+        with np.errstate(invalid="ignore"):
+            out = self._evaluate("eigensystem", arrays, shape)
+        if np.isnan(out).any():
+            # Negative discriminants: redo the whole batch in complex arithmetic
+            out = self._evaluate("eigensystem", [a.astype(complex) for a in arrays], shape)
+
+        n = self.n
+        w2 = out[..., :n]
+        candidates = out[..., n:].reshape(shape + (n, n, n))  # (root, adjugate column, component)
+        # The largest adjugate column is the best-conditioned null vector
+        best = np.argmax(np.linalg.norm(candidates, axis=-1), axis=-1)
+        vectors = np.take_along_axis(candidates, best[..., None, None], axis=-2)[..., 0, :]
+        return sort_and_normalize_modes(w2, np.swapaxes(vectors, -1, -2))
+
+
+def _write_source(cache_dir, path, source):
+    # Write to a temporary file and rename so readers never see a partial entry
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as file:
+            file.write(source)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def compile_eigensystem(model=CART_PENDULUM, cache_dir=None, use_cache=None):
+    """Return a `CompiledEigensystem` for model, generating and caching its source if needed.
+
+    cache_dir defaults to $PHYS111_KERNEL_DIR or ~/.cache/phys111/kernels;
+    use_cache=None follows PHYS111_CACHE (anything but "0" enables it).
+    """
+    key = model_key(model)
+    if key in _compiled:
+        return _compiled[key]
+
+    if use_cache is None:
+        use_cache = os.environ.get("PHYS111_CACHE", "1") != "0"
+    cache_dir = cache_dir or os.environ.get("PHYS111_KERNEL_DIR", DEFAULT_KERNEL_DIR)
+    path = os.path.join(cache_dir, key + ".py")
+
+    compiled = None
+    if use_cache:
+        try:
+            with open(path, "r") as file:
+                compiled = CompiledEigensystem(file.read())
+        except OSError:
+            pass
+        except (SyntaxError, ValueError, TypeError, NameError):
+            # Truncated or corrupt entry: drop it and regenerate below
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    if compiled is None:
+        source = generate_eigensystem_source(model)
+        compiled = CompiledEigensystem(source)
+        if use_cache:
+            _write_source(cache_dir, path, source)
+
+    _compiled[key] = compiled
+    return compiled
+
+
+__all__ = ["compile_eigensystem", "generate_eigensystem_source", "CompiledEigensystem", "model_key", "CART_PENDULUM"]
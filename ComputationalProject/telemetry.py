@@ -0,0 +1,112 @@
+"""Solver instrumentation: RHS call counts, step counts and timing for one run.
+
+`solve_with_stats` is a drop-in for the parts of solve_ivp that
+`compute_pendulum_trajectory` uses.  It steps a scipy `OdeSolver` directly so
+it can count accepted steps, infers rejected steps for the explicit
+Runge-Kutta methods, and wraps the RHS in `InstrumentedODE` to split wall
+time between RHS evaluation and solver overhead.
+"""
+
+import time
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+import numpy as np
+
+
+@dataclass
+class SolverStats:
+    """Telemetry for one trajectory computation."""
+
+    method: str
+    nfev: int = 0
+    njev: int = 0
+    nlu: int = 0
+    n_accepted: Optional[int] = None
+    n_rejected: Optional[int] = None
+    rhs_calls: int = 0
+    rhs_time: float = 0.0
+    wall_time: float = 0.0
+    solver_time: float = 0.0
+    success: bool = True
+    cache_hit: bool = False
+
+    def to_dict(self):
+        return asdict(self)
+
+
+class InstrumentedODE:
+    """Wrap an ODE function f(t, y), counting calls and the time spent inside it."""
+
+    def __init__(self, fun):
+        self.fun = fun
+        self.calls = 0
+        self.time = 0.0
+
+    def __call__(self, t, y):
+        start = time.perf_counter()
+        try:
+            return self.fun(t, y)
+        finally:
+            self.time += time.perf_counter() - start
+            self.calls += 1
+
+
+def solve_with_stats(fun, t_span, y0, t_eval, method="RK45", rtol=1e-3, atol=1e-6, **options):
+    """Integrate like solve_ivp(fun, t_span, y0, t_eval=t_eval, ...) and collect `SolverStats`.
+
+    Returns (t, y, stats) with y of shape (len(y0), len(t_eval)).
+    """
+    from ComputationalProject.poincare import SOLVERS  # pulls in scipy.integrate
+
+    solver_cls = SOLVERS[method] if isinstance(method, str) else method
+    ode = InstrumentedODE(fun)
+    stats = SolverStats(method=getattr(solver_cls, "__name__", str(method)))
+    n_stages = getattr(solver_cls, "n_stages", None)
+    t_eval = np.asarray(t_eval, dtype=float)
+
+    wall_start = time.perf_counter()
+    t0, t_bound = t_span
+    solver = solver_cls(ode, t0, np.asarray(y0, dtype=float), t_bound, rtol=rtol, atol=atol, **options)
+
+    ys = []
+    n_done = np.searchsorted(t_eval, t0, side="left")
+    # Points at t0 itself are the initial state, as in solve_ivp
+    while n_done < len(t_eval) and t_eval[n_done] == t0:
+        ys.append(solver.y.copy())
+        n_done += 1
+
+    n_accepted = 0
+    n_rejected = 0
+    while solver.status == "running":
+        calls_before = ode.calls
+        solver.step()
+        if solver.status == "failed":
+            stats.success = False
+            break
+        n_accepted += 1
+        if n_stages:
+            # Every explicit RK attempt costs exactly n_stages RHS evaluations
+            n_rejected += (ode.calls - calls_before) // n_stages - 1
+
+        n_next = np.searchsorted(t_eval, solver.t, side="right")
+        if n_next > n_done:
+            interpolant = solver.dense_output()
+            ys.extend(interpolant(t_eval[n_done:n_next]).T)
+            n_done = n_next
+
+    stats.wall_time = time.perf_counter() - wall_start
+    stats.nfev = int(solver.nfev)
+    stats.njev = int(solver.njev)
+    stats.nlu = int(solver.nlu)
+    stats.n_accepted = n_accepted
+    stats.n_rejected = n_rejected if n_stages else None
+    stats.rhs_calls = ode.calls
+    stats.rhs_time = ode.time
+    stats.solver_time = stats.wall_time - ode.time
+
+    y = np.array(ys).reshape(len(ys), len(y0)).T
+    return t_eval[: len(ys)], y, stats
+
+
+__all__ = ["SolverStats", "InstrumentedODE", "solve_with_stats"]
@@ -0,0 +1,216 @@
+"""Reading and writing pendulum trajectories on disk.
+
+Two formats are supported and picked from the file extension:
+
+- ``.npy``: a binary float64 array of shape (T, 3) holding the same
+  (Time, Theta, Theta Dot) columns as the CSV, at full precision.  Run
+  parameters (x0, omega, d, g, rtol, atol, ...) live in a JSON metadata
+  header stored next to it as ``<filename>.json``.  The array can be
+  memory-mapped, so huge runs load instantly.
+- anything else: the original CSV written by `integrator.save_trajectory_to_csv`.
+"""
+
+import io
+import json
+import os
+
+import numpy as np
+
+BINARY_EXTENSIONS = (".npy",)
+
+
+def is_binary_path(filename):
+    """Return True if filename should use the binary trajectory format."""
+    return os.path.splitext(str(filename))[1].lower() in BINARY_EXTENSIONS
+
+
+def metadata_path(filename):
+    """Return the path of the JSON metadata header stored alongside a binary trajectory."""
+    return str(filename) + ".json"
+
+
+def save_metadata(filename, metadata):
+    """Write the metadata header for a binary trajectory."""
+    with open(metadata_path(filename), "w") as file:
+        json.dump(metadata, file, indent=2, sort_keys=True)
+
+
+def load_metadata(filename):
+    """Read the metadata header of a binary trajectory; returns {} if there is none."""
+    try:
+        with open(metadata_path(filename), "r") as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {}
+
+
+def save_trajectory_npy(filename, times, theta_values, theta_dot_values, metadata=None):
+    """Save a trajectory as a (T, 3) float64 .npy file plus its JSON metadata header."""
+    data = np.column_stack([times, theta_values, theta_dot_values]).astype(np.float64, copy=False)
+    np.save(filename, data)
+    save_metadata(filename, dict(metadata or {}))
+
+
+def load_trajectory_npy(filename, mmap_mode=None):
+    """Load a binary trajectory and return (times, theta_values, theta_dot_values, metadata).
+
+    With mmap_mode="r" the columns are read-only views into a memory map, so
+    nothing is read from disk until it is touched.
+    """
+    data = np.load(filename, mmap_mode=mmap_mode)
+    return data[:, 0], data[:, 1], data[:, 2], load_metadata(filename)
+
+
+def load_trajectory_csv(filename):
+    """Load a CSV trajectory (Time, Theta, Theta Dot) and return (times, theta_values, theta_dot_values)."""
+    data = np.loadtxt(filename, delimiter=",", skiprows=1, ndmin=2)
+    return data[:, 0], data[:, 1], data[:, 2]
+
+
+def write_trajectory_stream(filename, chunks, n_samples=None, metadata=None, fmt="{:.4f}"):
+    """Write (times, theta_values, theta_dot_values) chunks to disk as they arrive.
+
+    The format follows the file extension.  Binary output is preallocated and
+    filled through a memory map, so it needs the total n_samples up front;
+    CSV rows are appended chunk by chunk.  Returns the number of rows written.
+    """
+    rows = 0
+    if is_binary_path(filename):
+        if n_samples is None:
+            raise ValueError("n_samples is required when streaming to a binary trajectory file")
+        data = np.lib.format.open_memmap(filename, mode="w+", dtype=np.float64, shape=(n_samples, 3))
+        for times, theta_values, theta_dot_values in chunks:
+            n = len(times)
+            if rows + n > n_samples:
+                raise ValueError(f"stream produced more than n_samples={n_samples} rows")
+            data[rows:rows + n, 0] = times
+            data[rows:rows + n, 1] = theta_values
+            data[rows:rows + n, 2] = theta_dot_values
+            rows += n
+        data.flush()
+        del data
+        if rows != n_samples:
+            raise ValueError(f"stream produced {rows} rows, expected n_samples={n_samples}")
+        save_metadata(filename, dict(metadata or {}))
+        return rows
+
+    import csv
+
+    with open(filename, mode="w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["Time", "Theta", "Theta Dot"])
+        for times, theta_values, theta_dot_values in chunks:
+            for t, th, thd in zip(times, theta_values, theta_dot_values):
+                writer.writerow([fmt.format(t), fmt.format(th), fmt.format(thd)])
+            rows += len(times)
+    return rows
+
+
+def _read_npy_header(file):
+    version = np.lib.format.read_magic(file)
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(file)
+    else:
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(file)
+    if fortran_order or dtype != np.float64 or len(shape) != 2 or shape[1] != 3:
+        raise ValueError(f"{file.name} is not a (T, 3) float64 trajectory")
+    return version, shape[0], file.tell()
+
+
+def _set_npy_rows(filename, n_rows):
+    """Rewrite the shape in a trajectory .npy header to (n_rows, 3) and drop any data past it."""
+    with open(filename, "r+b") as file:
+        version, _, header_end = _read_npy_header(file)
+        header = io.BytesIO()
+        header_dict = {"descr": np.dtype(np.float64).str, "fortran_order": False, "shape": (n_rows, 3)}
+        if version == (1, 0):
+            np.lib.format.write_array_header_1_0(header, header_dict)
+        else:
+            np.lib.format.write_array_header_2_0(header, header_dict)
+        header = header.getvalue()
+        if len(header) == header_end:
+            # numpy pads headers so the row count can grow in place
+            file.seek(0)
+            file.write(header)
+            file.truncate(header_end + n_rows * 3 * 8)
+            return
+    # Header no longer fits: rewrite the whole file
+    data = np.array(np.load(filename, mmap_mode="r")[:n_rows])
+    np.save(filename, data)
+
+
+def trajectory_length(filename):
+    """Return the number of samples stored in a trajectory file."""
+    if is_binary_path(filename):
+        with open(filename, "rb") as file:
+            return _read_npy_header(file)[1]
+    with open(filename, "r") as file:
+        return max(0, sum(1 for _ in file) - 1)
+
+
+def append_trajectory(filename, times, theta_values, theta_dot_values, fmt="{:.4f}"):
+    """Append samples to an existing trajectory file in either format."""
+    if is_binary_path(filename):
+        data = np.column_stack([times, theta_values, theta_dot_values]).astype(np.float64, copy=False)
+        with open(filename, "r+b") as file:
+            _, n_rows, header_end = _read_npy_header(file)
+            file.seek(header_end + n_rows * 3 * 8)
+            file.write(np.ascontiguousarray(data).tobytes())
+        _set_npy_rows(filename, n_rows + len(data))
+        return
+
+    import csv
+
+    with open(filename, mode="a", newline="") as file:
+        writer = csv.writer(file)
+        for t, th, thd in zip(times, theta_values, theta_dot_values):
+            writer.writerow([fmt.format(t), fmt.format(th), fmt.format(thd)])
+
+
+def truncate_trajectory(filename, n_rows, size=None):
+    """Cut a trajectory file back to its first n_rows samples.
+
+    For CSV files pass the byte size the file had at n_rows (as recorded in a
+    checkpoint); binary files only need n_rows.
+    """
+    if is_binary_path(filename):
+        _set_npy_rows(filename, n_rows)
+    elif size is not None:
+        os.truncate(filename, size)
+    else:
+        raise ValueError("size is required to truncate a CSV trajectory")
+
+
+def save_trajectory(filename, times, theta_values, theta_dot_values, metadata=None):
+    """Save a trajectory, choosing the format from the file extension."""
+    if is_binary_path(filename):
+        save_trajectory_npy(filename, times, theta_values, theta_dot_values, metadata=metadata)
+    else:
+        from ComputationalProject.integrator import save_trajectory_to_csv
+
+        save_trajectory_to_csv(filename, times, theta_values, theta_dot_values)
+
+
+def load_trajectory(filename, mmap_mode=None):
+    """Load a trajectory in either format and return (times, theta_values, theta_dot_values, metadata).
+
+    mmap_mode only applies to binary files; CSV files carry no metadata, so {} is returned.
+    """
+    if is_binary_path(filename):
+        return load_trajectory_npy(filename, mmap_mode=mmap_mode)
+    times, theta_values, theta_dot_values = load_trajectory_csv(filename)
+    return times, theta_values, theta_dot_values, {}
+
+
+__all__ = [
+    "save_trajectory",
+    "load_trajectory",
+    "write_trajectory_stream",
+    "append_trajectory",
+    "truncate_trajectory",
+    "trajectory_length",
+    "save_trajectory_npy",
+    "load_trajectory_npy",
+    "load_trajectory_csv",
+    "is_binary_path",
+]
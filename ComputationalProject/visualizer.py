@@ -10,12 +10,18 @@ from typing import Sequence, Tuple
 
 import numpy as np
 
+from ComputationalProject.trajectory_io import is_binary_path, load_trajectory_npy
+
 
 def load_theta_series(csv_file: str) -> np.ndarray:
-    """Load theta values from a CSV created by the integrator.
+    """Load theta values from a trajectory file created by the integrator.
 
-    Expects header (Time, Theta, Theta Dot) and returns a 1D numpy array of theta values.
+    A CSV is expected to have header (Time, Theta, Theta Dot); a .npy file is
+    memory-mapped instead of parsed. Returns a 1D numpy array of theta values.
     """
+    if is_binary_path(csv_file):
+        return load_trajectory_npy(csv_file, mmap_mode="r")[1]
+
     theta_values = []
     with open(csv_file, mode="r") as file:
         reader = csv.reader(file)
@@ -38,14 +44,54 @@ def theta_to_positions(theta_values: Sequence[float], pivot: Tuple[int, int], d:
     return x_positions, y_positions
 
 
+def frame_count(duration: float, fps: int) -> int:
+    """Number of frames in an animation of `duration` seconds at `fps` (at least 1)."""
+    return max(1, int(round(duration * fps)))
+
+
+def resample_theta(theta_values: Sequence[float], n_frames: int) -> np.ndarray:
+    """Resample a theta series to exactly n_frames values spread evenly over it.
+
+    Intermediate frames are linearly interpolated between neighbouring samples,
+    so short series are stretched smoothly and long ones are thinned without
+    the speed drift of a rounded integer stride.
+    """
+    theta_arr = np.asarray(theta_values, dtype=float)
+    if len(theta_arr) == 1:
+        return np.full(n_frames, theta_arr[0])
+    positions = np.linspace(0.0, len(theta_arr) - 1, n_frames)
+    return np.interp(positions, np.arange(len(theta_arr)), theta_arr)
+
+
+def precompute_frames(
+    theta_values: Sequence[float], duration: float, fps: int, pivot: Tuple[int, int], d: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the bob's screen positions for every frame of the animation.
+
+    The result has exactly frame_count(duration, fps) entries, so playing one
+    per tick at `fps` takes `duration` seconds whatever the trajectory length.
+    """
+    theta_frames = resample_theta(theta_values, frame_count(duration, fps))
+    return theta_to_positions(theta_frames, pivot, d)
+
+
+def dirty_rect(pivot: Tuple[int, int], bob: Tuple[float, float], radius: int, pad: int = 3) -> Tuple[int, int, int, int]:
+    """Bounding box (left, top, width, height) of the rod from pivot to bob and the bob itself."""
+    left = int(np.floor(min(pivot[0], bob[0] - radius))) - pad
+    top = int(np.floor(min(pivot[1], bob[1] - radius))) - pad
+    right = int(np.ceil(max(pivot[0], bob[0] + radius))) + pad
+    bottom = int(np.ceil(max(pivot[1], bob[1] + radius))) + pad
+    return left, top, right - left, bottom - top
+
+
 if __name__ == "__main__":
     # Minimal pygame-based launcher kept behind __main__ so importing this
     # module remains side-effect free and testable.
     import pygame
     import argparse
 
-    parser = argparse.ArgumentParser(description="Animate pendulum theta series from CSV")
-    parser.add_argument("csv_file", help="CSV file (Time,Theta,Theta Dot)")
+    parser = argparse.ArgumentParser(description="Animate pendulum theta series from CSV or .npy")
+    parser.add_argument("csv_file", help="Trajectory file: CSV (Time,Theta,Theta Dot) or binary .npy")
     parser.add_argument("--duration", type=float, default=20.0, help="Total duration of animation in seconds")
     parser.add_argument("--d", type=float, default=200.0, help="Pendulum rod length in pixels")
     parser.add_argument("--x0", type=int, default=300, help="Half-width of horizontal guide line in pixels")
@@ -55,43 +101,47 @@ if __name__ == "__main__":
     args = parser.parse_args()
 
     theta_values = load_theta_series(args.csv_file)
-    total_frames = len(theta_values)
-    frame_rate = max(1, int(total_frames / args.duration))
-    frame_step = max(1, frame_rate // args.fps)
+    pivot = (args.screen[0] // 2, args.screen[1] // 2)
+    # Resample once up front: every frame then costs the same regardless of
+    # how many samples the trajectory holds.
+    x_positions, y_positions = precompute_frames(theta_values, args.duration, args.fps, pivot, args.d)
 
     pygame.init()
     screen = pygame.display.set_mode(tuple(args.screen))
     pygame.display.set_caption("Pendulum Visualization")
     clock = pygame.time.Clock()
 
-    pivot = (args.screen[0] // 2, args.screen[1] // 2)
-    x_positions, y_positions = theta_to_positions(theta_values, pivot, args.d)
-
     WHITE = (255, 255, 255)
     LIGHT_GREY = (200, 200, 200)
     BLUE = (50, 50, 200)
+    RADIUS = 10
+
+    # The guide line never changes, so draw it once and restore from this copy
+    background = pygame.Surface(screen.get_size()).convert()
+    background.fill(WHITE)
+    pygame.draw.line(background, LIGHT_GREY, (pivot[0] - args.x0, pivot[1]), (pivot[0] + args.x0, pivot[1]), 2)
+    screen.blit(background, (0, 0))
+    pygame.display.flip()
 
     running = True
-    frame = 0
-    while running:
+    previous = None
+    for frame in range(len(x_positions)):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
-
-        screen.fill(WHITE)
-        pygame.draw.line(screen, LIGHT_GREY, (pivot[0] - args.x0, pivot[1]), (pivot[0] + args.x0, pivot[1]), 2)
+        if not running:
+            break
 
         pendulum_x = x_positions[frame]
         pendulum_y = y_positions[frame]
+        current = pygame.Rect(dirty_rect(pivot, (pendulum_x, pendulum_y), RADIUS))
+        # Erase last frame's pendulum and draw the new one, touching only their boxes
+        dirty = current.union(previous) if previous is not None else current
+        screen.blit(background, dirty, dirty)
         pygame.draw.line(screen, BLUE, pivot, (pendulum_x, pendulum_y), 4)
-        pygame.draw.circle(screen, BLUE, (int(pendulum_x), int(pendulum_y)), 10)
-
-        pygame.display.flip()
-
-        frame += frame_step
-        if frame >= len(x_positions):
-            running = False
-            frame = 0
+        pygame.draw.circle(screen, BLUE, (int(pendulum_x), int(pendulum_y)), RADIUS)
+        pygame.display.update(dirty)
+        previous = current
 
         clock.tick(args.fps)
 
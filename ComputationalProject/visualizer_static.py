@@ -1,4 +1,4 @@
-"""Produce a static pendulum PNG using theta values from CSV.
+"""Produce a static pendulum PNG using theta values from a CSV or .npy trajectory.
 
 This script uses the same helper functions as the pygame visualizer, but
 creates a matplotlib figure (headless-friendly) for CI / make consumption.
@@ -7,29 +7,36 @@ creates a matplotlib figure (headless-friendly) for CI / make consumption.
 import argparse
 import os
 
-import matplotlib.pyplot as plt
-
+from ComputationalProject.lod import DEFAULT_MAX_POINTS, plot_lod
 from ComputationalProject.visualizer import load_theta_series, theta_to_positions
 
 
 def main():
     parser = argparse.ArgumentParser(description="Save a static pendulum visualization from a theta CSV")
-    parser.add_argument("csv_file", help="CSV file (Time,Theta,Theta Dot)")
+    parser.add_argument("csv_file", help="Trajectory file: CSV (Time,Theta,Theta Dot) or binary .npy")
     parser.add_argument("--out", default="figures/pendulum_static.png", help="Output PNG path")
     parser.add_argument("--d", type=float, default=200.0, help="Pendulum rod length in pixels")
     parser.add_argument("--pivot", type=float, nargs=2, default=[300, 300], help="Pivot location X Y")
+    parser.add_argument(
+        "--max-points",
+        type=int,
+        default=DEFAULT_MAX_POINTS,
+        help="Above this many samples the path is drawn as a density image instead of markers",
+    )
 
     args = parser.parse_args()
 
+    import matplotlib.pyplot as plt
+
     theta_values = load_theta_series(args.csv_file)
     pivot = (int(args.pivot[0]), int(args.pivot[1]))
     x, y = theta_to_positions(theta_values, pivot, args.d)
 
     os.makedirs(os.path.dirname(args.out), exist_ok=True)
 
-    # Plot the trajectory of the bob on a white background
+    # Plot the trajectory of the bob on a white background (decimated when huge)
     plt.figure(figsize=(6, 6))
-    plt.plot(x, y, "-o", markersize=3, linewidth=1, color="tab:blue")
+    plot_lod(plt.gca(), x, y, max_points=args.max_points, color="tab:blue", marker="o", markersize=3, linewidth=1, dpi=200)
     plt.title("Pendulum bob trajectory")
     plt.axis("equal")
     plt.gca().invert_yaxis()  # Keep the same coordinate system as the visualizer
@@ -1,7 +1,12 @@
+import os
+import sys
+
 import numpy as np
-from scipy.integrate import solve_ivp
 import matplotlib.pyplot as plt
 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from ComputationalProject.poincare import poincare_sections
+
 # Constants
 g = 9.81  # acceleration due to gravity (m/s^2)
 L = 1.0   # length of the pendulum (m)
@@ -31,54 +36,36 @@ initial_conditions = [
     [0.0, 0.0, 1.0],  # Different theta2 initial condition
 ]
 
-# Plotting
-plt.figure(figsize=(12, 8))
+max_events = 500  # Number of points to collect per initial condition
 
-for y0 in initial_conditions:
-    t_start = 0
-    t_interval = 50 * 2 * np.pi  # Time interval for each integration step
-    max_events = 500  # Number of points to collect per initial condition
-    total_events = 0
-    theta_vals = []
-    omega_vals = []
-    y_current = y0.copy()
 
-    while total_events < max_events:
-        t_end = t_start + t_interval
-        sol = solve_ivp(
-            system, [t_start, t_end], y_current,
-            events=theta2_event, dense_output=True
-        )
-        events = sol.y_events[0]
+def main():
+    # theta2 advances at unit rate and sin(theta2 / 2) rises through zero once
+    # every 4*pi, so this bound is never reached before max_events crossings.
+    t_max = (max_events + 1) * 4 * np.pi
+    sections = poincare_sections(system, initial_conditions, theta2_event, max_events, t_max=t_max)
 
-        if events.size > 0:
-            theta_vals.extend(events[:, 0])
-            omega_vals.extend(events[:, 1])
-            total_events = len(theta_vals)
+    # Plotting
+    plt.figure(figsize=(12, 8))
 
-        # Prepare for next iteration
-        t_start = sol.t[-1]
-        y_current = sol.y[:, -1]
+    for y0, (_, events) in zip(initial_conditions, sections):
+        theta_vals = events[:, 0]
+        omega_vals = events[:, 1]
+        plt.scatter(omega_vals, theta_vals, s=1, label=f"θ₀={y0[0]}, ω₀={y0[1]}")
 
-        # Break if no events are found to prevent infinite loop
-        if events.size == 0:
-            break
+    plt.title("Surface of Section for Various Initial Conditions")
+    plt.xlabel("ω")
+    plt.ylabel("θ")
+    plt.legend()
+    plt.grid(True)
 
-    # Limit to 500 points
-    theta_vals = theta_vals[:max_events]
-    omega_vals = omega_vals[:max_events]
-    plt.scatter(omega_vals, theta_vals, s=1, label=f"θ₀={y0[0]}, ω₀={y0[1]}")
+    figdir = os.path.join(os.path.dirname(__file__), "figures")
+    os.makedirs(figdir, exist_ok=True)
+    figpath = os.path.join(figdir, "6b.png")
+    plt.savefig(figpath, dpi=200, bbox_inches='tight')
+    print(f"Saved figure to {figpath}")
+    plt.close()
 
-plt.title("Surface of Section for Various Initial Conditions")
-plt.xlabel("ω")
-plt.ylabel("θ")
-plt.legend()
-plt.grid(True)
-import os
 
-figdir = os.path.join(os.path.dirname(__file__), "figures")
-os.makedirs(figdir, exist_ok=True)
-figpath = os.path.join(figdir, "6b.png")
-plt.savefig(figpath, dpi=200, bbox_inches='tight')
-print(f"Saved figure to {figpath}")
-plt.close()
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,10 @@
+import os
+import sys
+
 import numpy as np
-import sympy as sp
 
-# Define symbolic variable for w^2
-w2 = sp.symbols('w2')
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from ComputationalProject.symbolic import CART_PENDULUM, compile_eigensystem
 
 # System parameters
 M_val = 1  # Mass of the cart
@@ -11,48 +13,32 @@ l = 0.0155 # Length of the pendulum
 k = 158    # Spring constant
 g = 9.81   # Gravitational acceleration
 
-# K matrix (stiffness matrix)
-K = np.array([[M_val + m, m],
-              [m, m]], dtype=float)
-
-# M matrix (mass matrix)
-M = np.array([[k, 0],
-              [0, -m * g / l]], dtype=float)
-
-# Convert K and M to SymPy matrices
-K_sym = sp.Matrix(K)
-M_sym = sp.Matrix(M)
+# det(K - w^2 * M) is derived symbolically once, with K = [[M + m, m], [m, m]]
+# (stiffness) and M = [[k, 0], [0, -m g / l]] (mass); the generated NumPy code
+# is cached on disk, so later runs do not need SymPy at all
+eigensystem = compile_eigensystem(CART_PENDULUM)
+params = dict(M=M_val, m=m, l=l, k=k, g=g)
 
-# Compute the matrix (K - w^2 * M)
-A = K_sym - w2 * M_sym
-
-# Compute the determinant of (K - w^2 * M)
-determinant = A.det()
+coefficients = eigensystem.characteristic_coefficients(**params)
 print("Characteristic equation (determinant):")
-sp.pprint(determinant)
-
-# Solve the equation determinant = 0 for w^2
-w2_solutions = sp.solve(determinant, w2)
+degree = len(coefficients) - 1
+print(" + ".join(f"({c:.6g}) * w2**{degree - i}" for i, c in enumerate(coefficients)) + " = 0")
 
-# Convert the solutions to numerical values
-w2_values = [sol.evalf() for sol in w2_solutions]
+# Eigenvalues w^2 and normalized eigenvectors (as columns) straight from the compiled kernel
+w2_values, modes = eigensystem(**params)
 
 print("\nEigenvalues (w^2):")
 for i, w2_val in enumerate(w2_values):
     print(f"w^2_{i+1} = {w2_val}")
 
-# For each eigenvalue, compute the eigenvector
 print("\nCorresponding eigenvectors:")
 for i, w2_val in enumerate(w2_values):
-    # Substitute w^2 into (K - w^2 * M)
-    A_sub = A.subs(w2, w2_val)
-
-    # Compute the null space of (K - w^2 * M)
-    null_space = A_sub.nullspace()
-
-    if null_space:
-        eigenvector = null_space[0]
-        print(f"\nEigenvector corresponding to w^2_{i+1}:")
-        sp.pprint(eigenvector / eigenvector.norm())  # Normalized eigenvector
-    else:
-        print(f"\nNo eigenvector found for w^2_{i+1}")
+    print(f"\nEigenvector corresponding to w^2_{i+1}:")
+    print(modes[:, i])
+
+# The same kernel evaluates whole parameter grids at NumPy speed
+l_grid = np.linspace(0.005, 0.05, 200)[:, None]
+k_grid = np.linspace(50, 300, 200)[None, :]
+w2_grid, _ = eigensystem(M=M_val, m=m, l=l_grid, k=k_grid, g=g)
+print(f"\nw^2 over a {w2_grid.shape[0]}x{w2_grid.shape[1]} (l, k) grid: "
+      f"{np.min(w2_grid):.4g} to {np.max(w2_grid):.4g}")
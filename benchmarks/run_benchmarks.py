@@ -0,0 +1,223 @@
+"""Benchmarks for CLI start-up and the integrator, trajectory I/O, visualizer and ensemble hot paths.
+
+Each benchmark is timed several times and the best and median wall-clock
+times are written to a JSON file.  Pass --compare with an earlier results file
+to flag benchmarks that got slower than --threshold times their baseline; the
+script then exits with status 1 so it can gate CI.
+
+Usage (from the repository root):
+
+    python benchmarks/run_benchmarks.py --out bench.json
+    python benchmarks/run_benchmarks.py --compare bench.json --out new.json
+    python benchmarks/run_benchmarks.py --full      # include the 1e7-row I/O cases
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+import numpy as np
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, REPO_ROOT)
+from ComputationalProject.double_pendulum import double_pendulum_rhs  # noqa: E402
+from ComputationalProject.integrator import compute_pendulum_trajectory, save_trajectory_to_csv  # noqa: E402
+from ComputationalProject.poincare import poincare_section  # noqa: E402
+from ComputationalProject.shared_ensemble import run_shared_ensemble  # noqa: E402
+from ComputationalProject.sweep import chunk_bounds  # noqa: E402
+from ComputationalProject.trajectory_io import save_trajectory_npy  # noqa: E402
+from ComputationalProject.visualizer import load_theta_series, theta_to_positions  # noqa: E402
+
+
+def forced_pendulum(t, y):
+    # The Pset6/6b.py system
+    theta, omega, theta2 = y
+    return [omega, np.sin(theta2) - 9.81 * np.sin(theta), 1.0]
+
+
+def forced_pendulum_section(t, y):
+    return np.sin(y[2] / 2)
+
+
+forced_pendulum_section.direction = 1
+
+
+def double_pendulum_section(t, y):
+    return y[2]
+
+
+double_pendulum_section.direction = 1
+
+
+def integrator_cases():
+    for periods in (10, 100, 1000):
+        for tol in (1e-6, 1e-8, 1e-10):
+            yield f"integrator/periods={periods}/tol={tol:g}", lambda p=periods, r=tol: compute_pendulum_trajectory(
+                N_periods=p, rtol=r, atol=r, cache=False
+            )
+            yield f"integrator_numba/periods={periods}/tol={tol:g}", lambda p=periods, r=tol: compute_pendulum_trajectory(
+                N_periods=p, rtol=r, atol=r, cache=False, backend="numba"
+            )
+
+
+def io_cases(workdir, full):
+    sizes = [10**4, 10**5, 10**6] + ([10**7] if full else [])
+    for n in sizes:
+        times = np.linspace(0.0, 1.0, n)
+        theta_values = np.sin(times)
+        theta_dot_values = np.cos(times)
+        path = os.path.join(workdir, f"traj_{n}.csv")
+        save_trajectory_to_csv(path, times, theta_values, theta_dot_values)
+        yield f"io/save_csv/rows={n}", lambda p=path, t=times, a=theta_values, b=theta_dot_values: save_trajectory_to_csv(
+            p, t, a, b
+        )
+        yield f"io/load_theta_series/rows={n}", lambda p=path: load_theta_series(p)
+
+        npy_path = os.path.join(workdir, f"traj_{n}.npy")
+        save_trajectory_npy(npy_path, times, theta_values, theta_dot_values)
+        yield f"io/save_npy/rows={n}", lambda p=npy_path, t=times, a=theta_values, b=theta_dot_values: save_trajectory_npy(
+            p, t, a, b
+        )
+        yield f"io/load_theta_series_npy/rows={n}", lambda p=npy_path: np.asarray(load_theta_series(p)).sum()
+
+
+def visualizer_cases():
+    for n in (10**4, 10**5, 10**6, 10**7):
+        theta_values = np.linspace(0.0, 100.0, n)
+        yield f"visualizer/theta_to_positions/n={n}", lambda a=theta_values: theta_to_positions(a, (400, 300), 200.0)
+
+
+def section_cases():
+    yield "pset6/6b_section/crossings=100", lambda: poincare_section(
+        forced_pendulum, [0.1, 0.0, 0.0], forced_pendulum_section, 100
+    )
+    y0 = [0.5, 0.3, -1.0, 1.2]
+    yield "pset6/6c_section/t=200", lambda: poincare_section(
+        double_pendulum_rhs, y0, double_pendulum_section, 10**6, t_max=200.0, method="DOP853", rtol=1e-8, atol=1e-8
+    )
+
+
+def payload_chunk(n_rows, n_times):
+    # Stand-in for an ensemble chunk whose result transfer, not its integration, dominates
+    return np.ones((n_rows, n_times)), np.ones((n_rows, n_times))
+
+
+def pickled_ensemble(n_members, n_times, chunk_size, max_workers):
+    result = np.empty((2, n_members, n_times))
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            pool.submit(payload_chunk, stop - start, n_times): (start, stop)
+            for start, stop in chunk_bounds(n_members, chunk_size)
+        }
+        for future in as_completed(futures):
+            start, stop = futures[future]
+            result[:, start:stop] = future.result()
+    return result
+
+
+def ensemble_cases():
+    # Pool result transfer: pickled return values vs. workers writing into a shared memmap
+    n_members, n_times, chunk_size = 4096, 1001, 256
+    yield "ensemble/return/pickled", lambda: pickled_ensemble(n_members, n_times, chunk_size, 2)
+    tasks = [(start, stop, (stop - start, n_times)) for start, stop in chunk_bounds(n_members, chunk_size)]
+    yield "ensemble/return/shared", lambda: run_shared_ensemble(payload_chunk, tasks, (2, n_members, n_times), max_workers=2)
+
+
+def run_python(*args):
+    subprocess.run([sys.executable, *args], cwd=REPO_ROOT, check=True, stdout=subprocess.DEVNULL)
+
+
+def startup_cases():
+    # Fresh interpreters, so these measure import cost; heavy dependencies
+    # (scipy, matplotlib, numba, pygame) must stay off these paths.
+    for module in ("ComputationalProject.integrator", "ComputationalProject.numericalIntegrator"):
+        yield f"startup/import/{module}", lambda m=module: run_python("-c", f"import {m}")
+    yield "startup/numericalIntegrator_help", lambda: run_python("-m", "ComputationalProject.numericalIntegrator", "--help")
+
+
+def time_case(func, repeat):
+    func()  # warm-up (imports, caches)
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return {"min": min(samples), "median": statistics.median(samples), "repeat": repeat}
+
+
+def compare(results, baseline, threshold):
+    """Return a list of (name, ratio) for benchmarks slower than threshold x baseline."""
+    regressions = []
+    for name, current in results.items():
+        base = baseline.get(name)
+        if base is None or base["min"] <= 0:
+            continue
+        ratio = current["min"] / base["min"]
+        status = "REGRESSION" if ratio > threshold else "ok"
+        print(f"  {name:55s} {base['min']:10.4f}s -> {current['min']:10.4f}s  x{ratio:5.2f}  {status}")
+        if ratio > threshold:
+            regressions.append((name, ratio))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run performance benchmarks and write results as JSON")
+    parser.add_argument("--out", default="bench_results.json", help="JSON file to write results to")
+    parser.add_argument("--compare", default=None, help="Baseline JSON file to compare against")
+    parser.add_argument("--threshold", type=float, default=1.25, help="Slowdown ratio counted as a regression")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed repetitions per benchmark")
+    parser.add_argument("--filter", default="", help="Only run benchmarks whose name contains this string")
+    parser.add_argument("--full", action="store_true", help="Include the largest (1e7-row) I/O cases")
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        suites = [
+            startup_cases(),
+            integrator_cases(),
+            io_cases(workdir, args.full),
+            visualizer_cases(),
+            section_cases(),
+            ensemble_cases(),
+        ]
+        for suite in suites:
+            for name, func in suite:
+                if args.filter not in name:
+                    continue
+                results[name] = time_case(func, args.repeat)
+                print(f"{name:55s} min {results[name]['min']:.4f}s  median {results[name]['median']:.4f}s")
+
+    payload = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "results": results,
+    }
+    with open(args.out, "w") as file:
+        json.dump(payload, file, indent=2, sort_keys=True)
+    print(f"Wrote {len(results)} results to {args.out}")
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)["results"]
+        print(f"Comparison against {args.compare} (threshold x{args.threshold}):")
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s) found")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
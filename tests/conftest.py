@@ -0,0 +1,20 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from ComputationalProject import cache
+
+
+@pytest.fixture(autouse=True)
+def _isolated_caches(tmp_path_factory, monkeypatch):
+    # Keep the suite away from the user's ~/.cache/phys111: trajectories go to a
+    # per-test directory (also for subprocesses) and kernel sources to a shared one.
+    cache_dir = str(tmp_path_factory.mktemp("trajectory_cache"))
+    monkeypatch.setenv("PHYS111_CACHE_DIR", cache_dir)
+    monkeypatch.setenv("PHYS111_KERNEL_DIR", str(tmp_path_factory.getbasetemp() / "kernels"))
+    cache.configure_cache(cache_dir=cache_dir)
+    yield
+    cache._configured = False
+    cache._default_cache = None
@@ -0,0 +1,62 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from ComputationalProject.basins import FAILED, UNRESOLVED, basin_map, classify_initial_conditions
+
+# Damped, strongly driven: a resting orbit and a period-2 rotation coexist
+TWO_ATTRACTORS = dict(x0=4.0, omega=2.5, damping=0.2, max_periods=200)
+
+
+def test_undriven_damped_pendulum_settles_onto_rest_point_early():
+    result = basin_map(np.linspace(-3.0, 3.0, 6), np.linspace(-2.0, 2.0, 5), x0=0.0, damping=0.5, max_periods=200)
+    assert result.labels.shape == (6, 5)
+    assert np.all(result.labels == 0)
+    (attractor,) = result.attractors
+    assert (attractor.period, attractor.winding) == (1, 0)
+    assert np.allclose(np.abs(attractor.points[0]), [np.pi, 0.0], atol=1e-4)
+    # Members left the ensemble long before max_periods
+    assert np.all(result.settle_periods < 100)
+
+
+def test_refinement_integrates_only_boundary_cells():
+    theta0_values = np.linspace(-np.pi, np.pi, 6, endpoint=False)
+    theta_dot0_values = np.linspace(-5.0, 5.0, 6)
+    coarse = basin_map(theta0_values, theta_dot0_values, **TWO_ATTRACTORS)
+    refined = basin_map(theta0_values, theta_dot0_values, refine_levels=1, **TWO_ATTRACTORS)
+
+    assert len(refined.attractors) >= 2
+    assert refined.labels.shape == (11, 11)
+    assert np.array_equal(refined.labels[::2, ::2], coarse.labels)
+    assert 36 < refined.n_integrated < 121
+    assert np.allclose(refined.theta0_values[1::2], 0.5 * (theta0_values[:-1] + theta0_values[1:]))
+
+    # Cells that were integrated agree with classifying them directly
+    integrated = refined.settle_periods > 0
+    integrated[::2, ::2] = False
+    TH, THD = np.meshgrid(refined.theta0_values, refined.theta_dot0_values, indexing="ij")
+    labels, _, attractors = classify_initial_conditions(TH[integrated], THD[integrated], **TWO_ATTRACTORS)
+
+    def signature(attractor_list, label):
+        return None if label == UNRESOLVED else (attractor_list[label].period, attractor_list[label].winding)
+
+    direct = [signature(attractors, label) for label in labels]
+    mapped = [signature(refined.attractors, label) for label in refined.labels[integrated]]
+    assert direct == mapped
+
+
+def test_non_finite_cell_is_labelled_failed():
+    labels, settle, attractors = classify_initial_conditions(
+        [0.5, np.nan, -0.5], 0.0, x0=0.0, damping=0.5, max_periods=200
+    )
+    assert list(labels) == [0, FAILED, 0]
+    assert settle[1] == -1 and np.all(settle[[0, 2]] > 0)
+    assert len(attractors) == 1
+
+
+def test_window_must_hold_two_cycles():
+    with pytest.raises(ValueError):
+        classify_initial_conditions([0.0], [0.0], max_period=4, window_periods=6)
@@ -0,0 +1,70 @@
+import json
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from ComputationalProject.batch import load_run_table, run_batch
+from ComputationalProject.integrator import compute_pendulum_trajectory
+from ComputationalProject.trajectory_io import load_trajectory
+
+
+def test_load_run_table_csv_and_jsonl(tmp_path):
+    csv_path = tmp_path / "runs.csv"
+    csv_path.write_text("name,x0,omega,periods\nfirst,0.5,2.0,4\nsecond,1.0,,\n")
+    assert load_run_table(str(csv_path)) == [
+        {"name": "first", "x0": 0.5, "omega": 2.0, "periods": 4},
+        {"name": "second", "x0": 1.0},
+    ]
+
+    jsonl_path = tmp_path / "runs.jsonl"
+    jsonl_path.write_text('{"x0": 2, "method": "DOP853"}\n\n{"bogus": 1}\n')
+    with pytest.raises(ValueError, match="bogus"):
+        load_run_table(str(jsonl_path))
+
+
+def test_load_run_table_short_and_long_csv_rows_and_json_arrays(tmp_path):
+    csv_path = tmp_path / "runs.csv"
+    csv_path.write_text("name,x0,omega,periods\nfirst,0.5\n")
+    assert load_run_table(str(csv_path)) == [{"name": "first", "x0": 0.5}]
+    csv_path.write_text("name,x0\nfirst,0.5\nsecond,1.0,extra\n")
+    with pytest.raises(ValueError, match="line 3"):
+        load_run_table(str(csv_path))
+
+    json_path = tmp_path / "runs.json"
+    json_path.write_text(json.dumps([{"x0": 1}, {"omega": 3.0, "name": "b"}]))
+    assert load_run_table(str(json_path)) == [{"x0": 1.0}, {"omega": 3.0, "name": "b"}]
+    json_path.write_text(json.dumps({"x0": 1}))
+    with pytest.raises(ValueError, match="list of run objects"):
+        load_run_table(str(json_path))
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_run_batch_writes_one_npz_archive(tmp_path, max_workers):
+    runs = [{"x0": 0.5, "omega": 2.0}, {"x0": 1.0, "omega": 3.0, "samples_per_period": 2}]
+    out = tmp_path / "results.npz"
+    lines = []
+    summary = run_batch(runs, str(out), defaults={"periods": 3}, max_workers=max_workers, progress=lines.append)
+
+    assert summary["n_runs"] == 2 and summary["n_failed"] == 0
+    assert "runs/s" in lines[-1]
+    with np.load(out) as archive:
+        manifest = json.loads(archive["runs.json"])
+        assert [entry["index"] for entry in manifest] == [0, 1]
+        assert archive["run_00001"].shape == (7, 3)
+        expected = compute_pendulum_trajectory(x0=0.5, omega=2.0, N_periods=3, cache=False)
+        assert np.allclose(archive["run_00000"].T, expected)
+
+
+def test_run_batch_directory_records_failures(tmp_path):
+    runs = [{"periods": 2}, {"periods": 2, "method": "NoSuchMethod"}]
+    summary = run_batch(runs, str(tmp_path / "out"), progress=None)
+    assert summary["n_failed"] == 1
+
+    with open(tmp_path / "out" / "runs.jsonl") as file:
+        manifest = [json.loads(line) for line in file]
+    assert manifest[0]["error"] is None and manifest[1]["error"].startswith("ValueError")
+    times, theta_values, _, meta = load_trajectory(str(tmp_path / "out" / manifest[0]["file"]))
+    assert len(times) == 3 and meta["periods"] == 2
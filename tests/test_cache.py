@@ -0,0 +1,83 @@
+import os
+import sys
+import numpy as np
+
+# Ensure project root is importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from ComputationalProject import cache as cache_module
+from ComputationalProject.cache import TrajectoryCache, trajectory_key
+from ComputationalProject.integrator import compute_pendulum_trajectory
+
+
+def test_trajectory_cache_hits_from_memory_and_disk(tmp_path):
+    cache = TrajectoryCache(cache_dir=str(tmp_path))
+    first = compute_pendulum_trajectory(theta0=0.1, theta_dot0=0.0, N_periods=3, cache=cache)
+    assert len(os.listdir(tmp_path)) == 1
+
+    # Same parameters from a fresh process-level cache must come from disk
+    fresh = TrajectoryCache(cache_dir=str(tmp_path))
+    second = compute_pendulum_trajectory(theta0=0.1, theta_dot0=0.0, N_periods=3, cache=fresh)
+    for a, b in zip(first, second):
+        assert np.array_equal(a, b)
+
+    # Returned arrays are copies; mutating them must not poison the cache
+    second[1][:] = 0.0
+    third = compute_pendulum_trajectory(theta0=0.1, theta_dot0=0.0, N_periods=3, cache=fresh)
+    assert np.array_equal(third[1], first[1])
+
+
+def test_trajectory_cache_evicts_least_recently_used(tmp_path):
+    times = np.arange(3.0)
+    cache = TrajectoryCache(cache_dir=str(tmp_path), memory_items=0)
+    cache.put("a", times, times, times)
+    entry_size = os.path.getsize(tmp_path / "a.npy")
+
+    # Room for exactly two entries; "a" is read again after "b" is written
+    cache.max_bytes = 2 * entry_size
+    cache.put("b", times, times, times)
+    assert cache.get("a") is not None  # refreshes "a", leaving "b" least recent
+
+    cache.put("c", times, times, times)
+    assert sorted(os.listdir(tmp_path)) == ["a.npy", "c.npy"]
+
+    # A fresh instance rebuilds the recency order from file mtimes
+    os.utime(tmp_path / "a.npy", (1, 1))
+    os.utime(tmp_path / "c.npy", (2, 2))
+    fresh = TrajectoryCache(cache_dir=str(tmp_path), max_bytes=2 * entry_size, memory_items=0)
+    fresh.put("d", times, times, times)
+    assert sorted(os.listdir(tmp_path)) == ["c.npy", "d.npy"]
+
+
+def test_size_bound_holds_across_caches_sharing_a_directory(tmp_path):
+    # Two instances stand in for two worker processes writing to one directory
+    times = np.arange(3.0)
+    first = TrajectoryCache(cache_dir=str(tmp_path), memory_items=0)
+    first.put("a", times, times, times)
+    entry_size = os.path.getsize(tmp_path / "a.npy")
+    first.max_bytes = 3 * entry_size
+    second = TrajectoryCache(cache_dir=str(tmp_path), max_bytes=3 * entry_size, memory_items=0)
+
+    for key in "bcdef":
+        for suffix, cache in (("1", first), ("2", second)):
+            cache.put(key + suffix, times, times, times)
+            assert key + suffix + ".npy" in os.listdir(tmp_path)
+            assert len(os.listdir(tmp_path)) <= 3
+
+
+def test_oversized_entry_stays_in_memory_only(tmp_path):
+    times = np.arange(3.0)
+    cache = TrajectoryCache(cache_dir=str(tmp_path))
+    cache.put("small", times, times, times)
+    cache.max_bytes = os.path.getsize(tmp_path / "small.npy")
+
+    big = np.arange(1000.0)
+    cache.put("big", big, big, big)
+    assert os.listdir(tmp_path) == ["small.npy"]
+    assert np.array_equal(cache.get("big")[1], big)
+
+
+def test_trajectory_key_includes_cache_version(monkeypatch):
+    args = (1.0, 2.0, 0.1, 0.0, 1.0, 9.81, 0.0, [0.0, 1.0], "RK45", 1e-8, 1e-8)
+    before = trajectory_key(*args)
+    monkeypatch.setattr(cache_module, "CACHE_VERSION", cache_module.CACHE_VERSION + 1)
+    assert trajectory_key(*args) != before
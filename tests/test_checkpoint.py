@@ -0,0 +1,47 @@
+import os
+import sys
+import numpy as np
+
+# Ensure project root is importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from ComputationalProject.checkpoint import extend, read_checkpoint, run_params, start_trajectory
+from ComputationalProject.integrator import iter_pendulum_trajectory
+from ComputationalProject.trajectory_io import append_trajectory, load_trajectory
+
+
+def test_extend_matches_single_run_and_survives_interruption(tmp_path):
+    # Undriven oscillation about theta = pi so chunk boundaries do not matter
+    params = run_params(x0=0.0, samples_per_period=2)
+    kwargs = dict(x0=0.0, theta0=np.pi + 0.1, theta_dot0=0.0, samples_per_period=2, chunk_periods=2)
+    expected = np.concatenate([np.column_stack(c) for c in iter_pendulum_trajectory(N_periods=5, **kwargs)])
+
+    for name in ("run.npy", "run.csv"):
+        path = str(tmp_path / name)
+        start_trajectory(path, params, theta0=np.pi + 0.1, theta_dot0=0.0)
+        extend(path, 2, chunk_periods=2)
+
+        # Simulate a crash that wrote rows without updating the checkpoint
+        append_trajectory(path, [99.0], [99.0], [99.0])
+        checkpoint = extend(path, 3, chunk_periods=2)
+
+        assert checkpoint["n_periods"] == 5
+        assert checkpoint["n_rows"] == 11
+        assert read_checkpoint(path)["t"] == checkpoint["t"]
+        times, theta_values, theta_dot_values, _ = load_trajectory(path)
+        stored = np.column_stack([times, theta_values, theta_dot_values])
+        assert stored.shape == (11, 3)
+        assert np.allclose(stored, expected, atol=1e-4 if name.endswith(".csv") else 1e-6)
+
+
+def test_cli_writes_checkpoint_only_when_asked(tmp_path, monkeypatch):
+    from ComputationalProject import numericalIntegrator
+    from ComputationalProject.checkpoint import checkpoint_path
+
+    plain, kept = str(tmp_path / "plain.npy"), str(tmp_path / "kept.npy")
+    monkeypatch.setattr(sys, "argv", ["numericalIntegrator.py", "--periods", "2", "--save", plain])
+    numericalIntegrator.main()
+    monkeypatch.setattr(sys, "argv", ["numericalIntegrator.py", "--periods", "2", "--checkpoint", "--save", kept])
+    numericalIntegrator.main()
+
+    assert os.path.exists(plain) and not os.path.exists(checkpoint_path(plain))
+    assert read_checkpoint(kept)["n_periods"] == 2
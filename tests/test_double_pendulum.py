@@ -0,0 +1,26 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from ComputationalProject.double_pendulum import generate_initial_conditions, hamiltonian
+
+
+def test_generate_initial_conditions_returns_exactly_n_on_shell():
+    states = generate_initial_conditions(1.0, 500, rng=np.random.default_rng(42))
+    assert states.shape == (500, 4)
+    theta1, omega1, theta2, omega2 = states.T
+    assert np.allclose(hamiltonian(theta1, theta2, omega1, omega2), 1.0, atol=1e-10)
+    assert np.all(np.abs(omega1) <= 3.0)
+    # Both roots of the quadratic for omega2 are used
+    assert np.any(omega2 > 0) and np.any(omega2 < 0)
+
+
+def test_generate_initial_conditions_is_reproducible_and_checks_energy():
+    a = generate_initial_conditions(1.0, 20, rng=np.random.default_rng(7))
+    b = generate_initial_conditions(1.0, 20, rng=np.random.default_rng(7))
+    assert np.array_equal(a, b)
+    with pytest.raises(ValueError):
+        generate_initial_conditions(-100.0, 5)
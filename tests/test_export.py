@@ -0,0 +1,45 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from ComputationalProject.export import FrameRenderer, export_animation
+from ComputationalProject.trajectory_io import save_trajectory_npy
+
+
+def test_frame_renderer_draws_bob_at_position():
+    renderer = FrameRenderer(screen=(120, 80), x0=40, radius=5)
+    frame = renderer.render(30.0, 60.0)
+    assert frame.shape == (80, 120, 3) and frame.dtype == np.uint8
+    # Bob pixels are blue, the far corner stays white
+    assert tuple(frame[60, 30]) == (50, 50, 200)
+    assert tuple(frame[5, 115]) == (255, 255, 255)
+    # Restoring the cached background leaves no trace of the previous frame
+    frame = renderer.render(90.0, 60.0)
+    assert tuple(frame[60, 30]) == (255, 255, 255)
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_export_png_sequence_in_order(tmp_path, max_workers):
+    theta = np.linspace(0.0, np.pi, 500)
+    path = tmp_path / "run.npy"
+    save_trajectory_npy(str(path), np.arange(500.0), theta, np.zeros(500))
+
+    out = tmp_path / "frames"
+    n_frames = export_animation(
+        str(path), str(out), duration=1.0, fps=12, d=30.0, screen=(80, 80), max_workers=max_workers, chunk_frames=5
+    )
+    assert n_frames == 12
+    assert sorted(os.listdir(out)) == [f"frame_{i:05d}.png" for i in range(12)]
+
+
+def test_export_gif(tmp_path):
+    from PIL import Image
+
+    out = tmp_path / "anim.gif"
+    n_frames = export_animation(np.linspace(0.0, 3.0, 50), str(out), duration=0.5, fps=10, screen=(64, 48), max_workers=1)
+    with Image.open(out) as image:
+        assert image.n_frames == n_frames == 5
+        assert image.size == (64, 48)
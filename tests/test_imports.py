@@ -0,0 +1,39 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+import ComputationalProject  # noqa: E402
+
+HEAVY = ("scipy", "matplotlib", "numba", "pygame")
+
+
+def _loaded_after(statement):
+    code = f"import sys\n{statement}\nprint(' '.join(m for m in {HEAVY!r} if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return result.stdout.split()
+
+
+@pytest.mark.parametrize(
+    "module",
+    ["ComputationalProject", "ComputationalProject.integrator", "ComputationalProject.numericalIntegrator",
+     "ComputationalProject.checkpoint", "ComputationalProject.visualizer", "ComputationalProject.visualizer_static"],
+)
+def test_cli_modules_import_without_heavy_dependencies(module):
+    assert _loaded_after(f"import {module}") == []
+
+
+def test_scipy_is_loaded_on_first_solve():
+    statement = "from ComputationalProject.integrator import compute_pendulum_trajectory\n"
+    statement += "compute_pendulum_trajectory(N_periods=1, cache=False)"
+    assert _loaded_after(statement) == ["scipy"]
+
+
+def test_package_attributes_load_submodules_lazily():
+    assert ComputationalProject.lod.plot_lod is not None
+    assert "lod" in dir(ComputationalProject)
+    with pytest.raises(AttributeError):
+        ComputationalProject.not_a_module
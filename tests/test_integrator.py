@@ -4,7 +4,14 @@ import numpy as np
 
 # Ensure project root is importable
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from ComputationalProject.integrator import compute_pendulum_trajectory
+from ComputationalProject.integrator import (
+    compute_pendulum_ensemble,
+    compute_pendulum_trajectory,
+    compute_stroboscopic_map,
+    iter_pendulum_trajectory,
+    pendulum_jacobian_factory,
+    pendulum_ode_factory,
+)
 
 
 def test_compute_pendulum_trajectory_shapes_and_finite():
@@ -16,3 +23,81 @@ def test_compute_pendulum_trajectory_shapes_and_finite():
     assert theta_values.shape == theta_dot_values.shape == (5,)
     assert np.all(np.isfinite(theta_values))
     assert np.all(np.isfinite(theta_dot_values))
+
+
+def test_compute_pendulum_ensemble_matches_single_runs():
+    theta0 = np.array([0.1, 1.0, np.pi])
+    theta_dot0 = np.array([0.0, 0.5, 2.5])
+    x0 = np.array([1.0, 0.5, 1.0])
+
+    times, theta_values, theta_dot_values = compute_pendulum_ensemble(
+        x0=x0, omega=2.0, theta0=theta0, theta_dot0=theta_dot0, N_periods=4
+    )
+
+    assert times.shape == (5,)
+    assert theta_values.shape == theta_dot_values.shape == (3, 5)
+    for i in range(3):
+        _, theta_ref, theta_dot_ref = compute_pendulum_trajectory(
+            x0=x0[i], omega=2.0, theta0=theta0[i], theta_dot0=theta_dot0[i], N_periods=4
+        )
+        assert np.allclose(theta_values[i], theta_ref, atol=1e-4)
+        assert np.allclose(theta_dot_values[i], theta_dot_ref, atol=1e-4)
+
+
+def test_compute_pendulum_ensemble_returns_nan_rows_for_broken_members():
+    # A NaN initial condition and a zero-length pendulum used to keep the step loop running forever
+    with np.errstate(divide="ignore", invalid="ignore"):
+        times, theta_values, theta_dot_values = compute_pendulum_ensemble(
+            theta0=[0.1, np.nan, 0.1], theta_dot0=0.0, d=[1.0, 1.0, 0.0], N_periods=2
+        )
+
+    _, theta_ref, theta_dot_ref = compute_pendulum_trajectory(theta0=0.1, theta_dot0=0.0, N_periods=2)
+    assert np.allclose(theta_values[0], theta_ref, atol=1e-4)
+    assert np.allclose(theta_dot_values[0], theta_dot_ref, atol=1e-4)
+    assert np.all(np.isnan(theta_values[1:])) and np.all(np.isnan(theta_dot_values[1:]))
+
+
+def test_vectorized_ode_and_analytic_jacobian():
+    scalar_ode = pendulum_ode_factory(x0=1.0, omega=2.0)
+    vector_ode = pendulum_ode_factory(x0=1.0, omega=2.0, vectorized=True)
+    jac = pendulum_jacobian_factory(x0=1.0, omega=2.0)
+
+    y = np.array([[0.3, 2.0, -1.0], [0.2, -0.5, 1.5]])
+    out = vector_ode(0.7, y)
+    assert out.shape == (2, 3)
+    for k in range(3):
+        assert np.allclose(out[:, k], scalar_ode(0.7, y[:, k]))
+
+    # Compare against central finite differences
+    y0 = y[:, 0]
+    eps = 1e-6
+    fd = np.column_stack([
+        (vector_ode(0.7, y0 + eps * e) - vector_ode(0.7, y0 - eps * e)) / (2 * eps)
+        for e in np.eye(2)
+    ])
+    assert np.allclose(jac(0.7, y0), fd, atol=1e-6)
+
+
+def test_iter_pendulum_trajectory_chunks_match_single_run():
+    # Undriven small oscillation about the stable point theta = pi: restarting
+    # the solver at each window must not change the answer beyond tolerance.
+    kwargs = dict(x0=0.0, omega=2.0, theta0=np.pi + 0.1, theta_dot0=0.0)
+    chunks = list(iter_pendulum_trajectory(N_periods=6, samples_per_period=4, chunk_periods=2, **kwargs))
+
+    assert [len(c[0]) for c in chunks] == [8, 8, 8, 1]
+    times = np.concatenate([c[0] for c in chunks])
+    theta_values = np.concatenate([c[1] for c in chunks])
+
+    t_eval = 2 * np.pi / 4 * np.arange(25)
+    ref_times, ref_theta, _ = compute_pendulum_trajectory(t_eval=t_eval, **kwargs)
+    assert np.allclose(times, ref_times)
+    assert np.allclose(theta_values, ref_theta, atol=1e-6)
+
+
+def test_compute_stroboscopic_map_matches_default_sampling():
+    times, theta_values, theta_dot_values = compute_pendulum_trajectory(N_periods=20, cache=False)
+    t_map, theta_map, theta_dot_map = compute_stroboscopic_map(N_periods=20, transient_periods=5)
+    assert t_map.shape == (16,)
+    assert np.allclose(t_map, times[5:])
+    assert np.allclose(theta_map, theta_values[5:], atol=1e-10)
+    assert np.allclose(theta_dot_map, theta_dot_values[5:], atol=1e-10)
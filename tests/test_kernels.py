@@ -0,0 +1,53 @@
+import os
+import sys
+import numpy as np
+import pytest
+from scipy.integrate import solve_ivp
+
+# Ensure project root is importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from ComputationalProject.double_pendulum import double_pendulum_rhs
+from ComputationalProject.integrator import compute_pendulum_trajectory
+from ComputationalProject.kernels import HAVE_NUMBA, dopri5_pendulum, rk4_double_pendulum
+
+
+def test_numba_backend_matches_scipy():
+    kwargs = dict(x0=1.0, omega=2.0, theta0=0.1, theta_dot0=0.0, N_periods=3, cache=False)
+    times, theta_ref, theta_dot_ref = compute_pendulum_trajectory(**kwargs)
+
+    for method, extra in (("RK45", {}), ("RK4", {"step_size": 1e-3})):
+        t, theta_values, theta_dot_values, stats = compute_pendulum_trajectory(
+            backend="numba", solver_method=method, return_stats=True, **extra, **kwargs
+        )
+        assert np.array_equal(t, times)
+        assert np.allclose(theta_values, theta_ref, atol=1e-5)
+        assert np.allclose(theta_dot_values, theta_dot_ref, atol=1e-5)
+        assert stats.success
+
+
+def test_kernels_run_without_numba():
+    # The interpreted fallback is the same source, so it must agree with the compiled one
+    py_dopri5 = getattr(dopri5_pendulum, "py_func", dopri5_pendulum)
+    t_eval = 2 * np.pi * np.arange(4.0)
+    out_py = np.empty((2, 4))
+    status, nfev, n_accepted, n_rejected = py_dopri5(t_eval, 0.1, 0.0, 1.0, 2.0, 1.0, 9.81, 0.0, 1e-8, 1e-8, out_py)
+    assert status == 0
+    assert nfev == 6 * (n_accepted + n_rejected) + 2
+    if HAVE_NUMBA:
+        out_jit = np.empty((2, 4))
+        dopri5_pendulum(t_eval, 0.1, 0.0, 1.0, 2.0, 1.0, 9.81, 0.0, 1e-8, 1e-8, out_jit)
+        assert np.allclose(out_py, out_jit)
+
+
+def test_rk4_double_pendulum_matches_solve_ivp():
+    y0 = np.array([0.5, 0.3, -1.0, 1.2])
+    out = np.empty((4, 11))
+    rk4_double_pendulum(y0, 1e-3, 1000, 100, 9.81, 1.0, 1.0, 1.0, 1.0, out)
+
+    sol = solve_ivp(double_pendulum_rhs, [0, 1], y0, t_eval=np.linspace(0, 1, 11), rtol=1e-10, atol=1e-10)
+    assert np.allclose(out, sol.y, atol=1e-8)
+
+
+def test_rk4_requires_the_numba_backend():
+    with pytest.raises(ValueError, match="RK4"):
+        compute_pendulum_trajectory(solver_method="RK4", N_periods=1, cache=False)
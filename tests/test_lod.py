@@ -0,0 +1,63 @@
+import os
+import sys
+
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from ComputationalProject.lod import _axes_pixels, density_image, is_ascending, minmax_decimate, plot_lod
+
+
+def test_minmax_decimate_keeps_extremes_per_column():
+    x = np.linspace(0.0, 1.0, 100001)
+    y = np.sin(40 * np.pi * x)
+    y[12345] = 5.0  # a single spike must survive decimation
+    x_small, y_small = minmax_decimate(x, y, n_columns=200)
+
+    assert len(x_small) <= 800
+    assert np.all(np.diff(x_small) > 0)
+    assert y_small.max() == 5.0
+    assert np.isclose(y_small.min(), y.min())
+    assert x_small[0] == x[0] and x_small[-1] == x[-1]
+
+    # Chunk boundaries that cut through columns give the same points
+    x_chunked, y_chunked = minmax_decimate(x, y, n_columns=200, chunk_size=7777)
+    assert np.array_equal(x_chunked, x_small) and np.array_equal(y_chunked, y_small)
+
+
+def test_is_ascending_checks_across_chunk_boundaries():
+    x = np.arange(100.0)
+    assert is_ascending(x, chunk_size=10)
+    x[50] = x[49] - 1  # a drop exactly at a chunk start
+    assert not is_ascending(x, chunk_size=10)
+
+
+def test_density_image_counts_every_point_in_chunks():
+    rng = np.random.default_rng(0)
+    x, y = rng.normal(size=(2, 25000))
+    counts, extent = density_image(x, y, bins=(40, 30), chunk_size=7000)
+    assert counts.shape == (30, 40)
+    assert counts.sum() == 25000
+    assert extent == (x.min(), x.max(), y.min(), y.max())
+
+
+def test_plot_lod_switches_representation_above_threshold():
+    fig, ax = plt.subplots()
+    t = np.linspace(0.0, 10.0, 5000)
+    assert len(plot_lod(ax, t, np.sin(t), max_points=10000).get_xdata()) == 5000
+    # Time series are decimated, clouds become a density image
+    assert len(plot_lod(ax, t, np.sin(t), max_points=1000).get_xdata()) < 5000
+    image = plot_lod(ax, np.sin(t), np.cos(3 * t), style="scatter", max_points=1000)
+    assert isinstance(image, matplotlib.image.AxesImage)
+    plt.close(fig)
+
+
+def test_axes_pixels_follow_the_output_dpi():
+    fig, ax = plt.subplots(dpi=100)
+    width, height = _axes_pixels(ax)
+    width_200, height_200 = _axes_pixels(ax, dpi=200)
+    assert abs(width_200 - 2 * width) <= 2 and abs(height_200 - 2 * height) <= 2
+    plt.close(fig)
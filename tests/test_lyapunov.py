@@ -0,0 +1,37 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from ComputationalProject.lyapunov import largest_lyapunov_exponent, lyapunov_map
+
+
+def test_exponent_of_unstable_equilibrium_is_its_growth_rate():
+    # Undriven and balanced at theta=0, the tangent vector grows like exp(sqrt(g/d) t);
+    # near the stable equilibrium theta=pi the motion is regular.
+    lam = largest_lyapunov_exponent(
+        x0=0.0, omega=1.0, theta0=[0.0, 0.0, np.pi], theta_dot0=[0.0, 0.0, 0.1], d=[1.0, 4.0, 1.0],
+        N_periods=20, transient_periods=2, rtol=1e-8, atol=1e-10,
+    )
+    assert lam.shape == (3,)
+    assert np.allclose(lam[:2], [np.sqrt(9.81), np.sqrt(9.81 / 4)], rtol=1e-2)
+    assert abs(lam[2]) < 0.05
+
+
+def test_lyapunov_map_flags_chaotic_drive():
+    lam = lyapunov_map([0.0, 0.5], [5.0], N_periods=60, transient_periods=10)
+    assert lam.shape == (2, 1)
+    assert abs(lam[0, 0]) < 0.05
+    assert lam[1, 0] > 0.1
+
+
+def test_broken_members_get_nan_exponents():
+    # A NaN initial condition and a zero-length pendulum must not stop the others
+    with np.errstate(divide="ignore", invalid="ignore"):
+        lam = largest_lyapunov_exponent(
+            x0=0.0, omega=1.0, theta0=[np.pi, np.nan, np.pi], theta_dot0=0.1, d=[1.0, 1.0, 0.0],
+            N_periods=10, transient_periods=2,
+        )
+    assert abs(lam[0]) < 0.05
+    assert np.all(np.isnan(lam[1:]))
@@ -0,0 +1,62 @@
+import os
+import sys
+
+import numpy as np
+from scipy.linalg import eig
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from ComputationalProject.normal_modes import cart_pendulum_matrices, cart_pendulum_modes, generalized_eig
+
+
+def _check_solutions(A, B, w2, modes):
+    # A v = w2 B v for every problem and every mode, with unit-norm modes
+    lhs = A @ modes
+    rhs = (B @ modes) * w2[..., None, :]
+    scale = np.abs(A).max(axis=(-2, -1))[..., None, None] * (1 + np.abs(w2)[..., None, :])
+    assert np.all(np.abs(lhs - rhs) <= 1e-10 * scale)
+    assert np.allclose(np.linalg.norm(modes, axis=-2), 1.0)
+
+
+def test_cart_pendulum_matches_scipy_for_pset7_values():
+    K, M = cart_pendulum_matrices()
+    w2, modes = cart_pendulum_modes()
+    expected = np.sort(np.real(eig(K, M)[0]))
+    assert w2.dtype == np.float64
+    assert np.allclose(w2, expected)
+    _check_solutions(K, M, w2, modes)
+
+
+def test_cart_pendulum_modes_over_parameter_grid():
+    l_values = np.linspace(0.01, 1.0, 40)
+    k_values = np.linspace(10.0, 300.0, 30)
+    K, M = cart_pendulum_matrices(l=l_values[:, None], k=k_values[None, :])
+    w2, modes = generalized_eig(K, M)
+    assert w2.shape == (40, 30, 2) and modes.shape == (40, 30, 2, 2)
+    _check_solutions(K, M, w2, modes)
+    i, j = 17, 5
+    assert np.allclose(w2[i, j], np.sort(np.real(eig(K[i, j], M[i, j])[0])))
+
+
+def test_batched_lapack_path_for_larger_systems():
+    rng = np.random.default_rng(3)
+    A = rng.normal(size=(50, 4, 4))
+    A = A + np.swapaxes(A, -1, -2)
+    B = rng.normal(size=(50, 4, 4))
+    B = B @ np.swapaxes(B, -1, -2) + 4 * np.eye(4)  # symmetric positive definite: real spectrum
+    w2, modes = generalized_eig(A, B)
+    assert w2.shape == (50, 4) and w2.dtype == np.float64
+    assert np.all(np.diff(w2, axis=-1) >= 0)
+    _check_solutions(A, B, w2, modes)
+
+
+def test_degenerate_2x2_problems_give_finite_modes():
+    # Equal eigenvalues with a full eigenspace (A = c B, including A = 0) and
+    # decoupled (diagonal) systems
+    A = np.array([2 * np.eye(2), np.zeros((2, 2)), np.diag([1.0, 3.0]), np.diag([3.0, 1.0]), 5 * np.diag([1.0, 2.0])])
+    B = np.array([np.eye(2), np.eye(2), np.eye(2), np.eye(2), np.diag([1.0, 2.0])])
+    w2, modes = generalized_eig(A, B)
+    assert np.all(np.isfinite(w2)) and np.all(np.isfinite(modes))
+    assert np.allclose(w2, [[2, 2], [0, 0], [1, 3], [1, 3], [5, 5]])
+    _check_solutions(A, B, w2, modes)
+    # The two modes of a double root still span the plane
+    assert np.all(np.abs(np.linalg.det(modes)) > 0.5)
@@ -0,0 +1,91 @@
+import os
+import sys
+import numpy as np
+from scipy.integrate import solve_ivp
+
+# Ensure project root is importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pytest
+
+from ComputationalProject.poincare import poincare_section, poincare_sections, stroboscopic_map
+
+
+def forced_pendulum(t, y):
+    theta, omega, phase = y
+    return [omega, np.sin(phase) - 9.81 * np.sin(theta), 1.0]
+
+
+def phase_section(t, y):
+    return np.sin(y[2] / 2)
+
+
+phase_section.direction = 1
+
+
+def test_poincare_section_matches_solve_ivp_events():
+    y0 = [0.1, 0.0, 0.0]
+    t_crossings, y_crossings = poincare_section(forced_pendulum, y0, phase_section, 5)
+
+    sol = solve_ivp(forced_pendulum, [0, 5 * 4 * np.pi - 1], y0, events=phase_section)
+    assert t_crossings.shape == (5,)
+    assert y_crossings.shape == (5, 3)
+    assert np.allclose(t_crossings, sol.t_events[0])
+    assert np.allclose(y_crossings, sol.y_events[0])
+
+
+def test_poincare_sections_parallel_keeps_order_and_stops_at_t_max():
+    y0s = [[0.1, 0.0, 0.0], [0.2, -0.1, 0.0]]
+    results = poincare_sections(forced_pendulum, y0s, phase_section, 100, t_max=10.0, max_workers=2)
+
+    assert len(results) == 2
+    for y0, (t_crossings, y_crossings) in zip(y0s, results):
+        # Only t = 0 and t = 4*pi... lie on the section; 4*pi > 10
+        assert np.allclose(t_crossings, [0.0])
+        assert np.allclose(y_crossings[0], y0)
+
+
+def test_stroboscopic_map_matches_solve_ivp_and_skips_transient(tmp_path):
+    y0 = [0.1, 0.0, 0.0]
+    period = 2 * np.pi
+    t_samples, y_samples = stroboscopic_map(forced_pendulum, y0, period, 8, rtol=1e-9, atol=1e-9)
+    ref = solve_ivp(forced_pendulum, [0, 8 * period], y0, t_eval=period * np.arange(9), rtol=1e-9, atol=1e-9)
+    assert np.allclose(t_samples, ref.t)
+    assert np.allclose(y_samples, ref.y.T, atol=1e-12)
+
+    out = np.lib.format.open_memmap(str(tmp_path / "strobe.npy"), mode="w+", shape=(4, 3))
+    t_late, y_late = stroboscopic_map(forced_pendulum, y0, period, 8, transient_periods=5, rtol=1e-9, atol=1e-9, out=out)
+    assert np.allclose(t_late, ref.t[5:])
+    assert np.allclose(y_late, ref.y.T[5:], atol=1e-6)
+    assert np.shares_memory(y_late, out)
+
+
+def oscillator(t, z):
+    q, p = z
+    return [p, -q]
+
+
+def q_section(t, z):
+    return z[0]
+
+
+q_section.direction = 1
+
+
+@pytest.mark.parametrize("method", ["implicit_midpoint", "stormer_verlet"])
+def test_symplectic_methods_run_sections_and_stroboscopic_maps(method):
+    t_crossings, z_crossings = poincare_section(
+        oscillator, [1.0, 0.0], q_section, 20, t_max=200.0, method=method, step_size=0.01
+    )
+    # q = cos t crosses upward at t = 3*pi/2 + 2*pi*k with p = 1
+    assert np.allclose(t_crossings, 1.5 * np.pi + 2 * np.pi * np.arange(20), atol=1e-3)
+    assert np.allclose(z_crossings, [[0.0, 1.0]] * 20, atol=1e-3)
+
+    t_samples, z_samples = stroboscopic_map(oscillator, [1.0, 0.0], 2 * np.pi, 50, method=method, step_size=0.01)
+    assert len(t_samples) == 51
+    energy = 0.5 * np.sum(z_samples**2, axis=1)
+    assert np.max(np.abs(energy - 0.5)) < 1e-4
+
+
+def test_stormer_verlet_rejects_odd_state():
+    with pytest.raises(ValueError):
+        poincare_section(forced_pendulum, [0.1, 0.0, 0.0], phase_section, 1, method="stormer_verlet")
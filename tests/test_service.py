@@ -0,0 +1,150 @@
+import asyncio
+import http.client
+import io
+import json
+import os
+import socket
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from ComputationalProject.integrator import compute_pendulum_trajectory
+from ComputationalProject.service import JOBS, ServiceConfig, TrajectoryService
+
+
+def _sleep_job(params):
+    time.sleep(params["seconds"])
+    return b"done"
+
+
+# The real endpoints plus one whose job is guaranteed to block for a given time
+SLEEP_JOBS = dict(JOBS, **{"/sleep": (_sleep_job, frozenset(["seconds"]))})
+
+
+def _request(port, method, path, params=None):
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+    body = None if params is None else json.dumps(params)
+    connection.request(method, path, body=body)
+    response = connection.getresponse()
+    data = response.read()
+    connection.close()
+    return response.status, data
+
+
+def _with_service(config, scenario, jobs=None):
+    async def run():
+        service = await TrajectoryService(config, jobs=jobs).start()
+        try:
+            return await scenario(service)
+        finally:
+            await service.close()
+
+    return asyncio.run(run())
+
+
+def test_trajectory_jobs_stream_npy_and_coalesce():
+    params = {"x0": 0.5, "omega": 3.0, "N_periods": 20, "samples_per_period": 4}
+
+    async def scenario(service):
+        # Started together, so the second and third join the first one's job
+        payloads = await asyncio.gather(*(service.run_job("/trajectory", params) for _ in range(3)))
+        stats = dict(service.stats)
+        loop = asyncio.get_running_loop()
+        calls = [loop.run_in_executor(None, _request, service.port, "POST", "/trajectory", params) for _ in range(3)]
+        results = await asyncio.gather(*calls)
+        health = await loop.run_in_executor(None, _request, service.port, "GET", "/health")
+        return payloads, results, json.loads(health[1]), stats
+
+    payloads, results, health, stats = _with_service(
+        ServiceConfig(port=0, max_workers=1, chunk_bytes=256, use_cache=False), scenario
+    )
+
+    expected = compute_pendulum_trajectory(
+        x0=0.5, omega=3.0, N_periods=20, t_eval=2 * np.pi / 4 * np.arange(81), cache=False
+    )
+    for status, data in results:
+        assert status == 200
+        rows = np.load(io.BytesIO(data))
+        assert rows.shape == (81, 3)
+        assert np.allclose(rows.T, expected)
+    assert payloads[0] == payloads[1] == payloads[2] == results[0][1]
+    assert stats["jobs"] == 1
+    assert stats["coalesced"] >= 1
+    assert health["workers"] == 1 and health["queued"] == 0
+
+
+def test_sweep_job_and_errors():
+    async def scenario(service):
+        loop = asyncio.get_running_loop()
+
+        def call(*args):
+            return loop.run_in_executor(None, _request, service.port, *args)
+
+        sweep = await call("POST", "/sweep", {"x0_values": [0.5, 1.0], "omega_values": [2.0], "N_periods": 3})
+        unknown = await call("POST", "/trajectory", {"bogus": 1})
+        missing = await call("GET", "/nowhere")
+        wrong_method = await call("GET", "/sweep")
+        return sweep, unknown, missing, wrong_method
+
+    sweep, unknown, missing, wrong_method = _with_service(ServiceConfig(port=0, max_workers=1, use_cache=False), scenario)
+    assert sweep[0] == 200
+    assert np.load(io.BytesIO(sweep[1])).shape == (2, 2, 1, 4)
+    assert unknown[0] == 400 and b"bogus" in unknown[1]
+    assert missing[0] == 404
+    assert wrong_method[0] == 405
+
+
+def test_job_timeout_and_full_queue():
+    async def scenario(service):
+        first = asyncio.ensure_future(service.run_job("/sleep", {"seconds": 1.0}))
+        await asyncio.sleep(0)
+        queue_status = timeout_status = after_timeout_status = None
+        try:
+            await service.run_job("/sleep", {"seconds": 0.0})
+        except Exception as exc:
+            queue_status = exc.status
+        try:
+            await first
+        except Exception as exc:
+            timeout_status = exc.status
+        # The timed-out job still occupies the only slot until its worker finishes
+        health = service.health()
+        try:
+            await service.run_job("/sleep", {"seconds": 0.01})
+        except Exception as exc:
+            after_timeout_status = exc.status
+        while service.health()["abandoned"]:
+            await asyncio.sleep(0.05)
+        later = await service.run_job("/sleep", {"seconds": 0.0})
+        return queue_status, timeout_status, health, after_timeout_status, later
+
+    config = ServiceConfig(port=0, max_workers=1, max_queue=0, job_timeout=0.2, use_cache=False)
+    queue_status, timeout_status, health, after_timeout_status, later = _with_service(config, scenario, SLEEP_JOBS)
+    assert (queue_status, timeout_status) == (503, 504)
+    assert health["running"] == 1 and health["abandoned"] == 1
+    assert after_timeout_status == 503
+    assert later == b"done"
+
+
+def _raw_request(port, data):
+    with socket.create_connection(("127.0.0.1", port), timeout=10) as sock:
+        sock.sendall(data)
+        return sock.recv(4096).split(b"\r\n", 1)[0]
+
+
+def test_bad_content_length_and_idle_client():
+    async def scenario(service):
+        loop = asyncio.get_running_loop()
+        bad_length = await loop.run_in_executor(
+            None, _raw_request, service.port, b"POST /trajectory HTTP/1.1\r\nContent-Length: abc\r\n\r\n"
+        )
+        # Sends only half a request line and then goes quiet
+        idle = await loop.run_in_executor(None, _raw_request, service.port, b"POST /traj")
+        return bad_length, idle
+
+    config = ServiceConfig(port=0, max_workers=1, use_cache=False, read_timeout=0.2)
+    bad_length, idle = _with_service(config, scenario)
+    assert bad_length == b"HTTP/1.1 400 Bad Request"
+    assert idle == b"HTTP/1.1 408 Request Timeout"
@@ -0,0 +1,43 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from ComputationalProject.shared_ensemble import run_shared_ensemble
+from ComputationalProject.sweep import chunk_bounds
+
+
+def _square_and_cube(values):
+    return values**2, values**3
+
+
+def _tasks(n_members, chunk_size):
+    values = np.arange(n_members, dtype=float)[:, None] + np.linspace(0.0, 1.0, 5)
+    return [(start, stop, (values[start:stop],)) for start, stop in chunk_bounds(n_members, chunk_size)], values
+
+
+def test_pool_workers_write_into_scratch_memmap(tmp_path, monkeypatch):
+    monkeypatch.setenv("PHYS111_SHARED_DIR", str(tmp_path))
+    tasks, values = _tasks(10, 3)
+    completed = []
+    result = run_shared_ensemble(
+        _square_and_cube, tasks, (2, 10, 5), max_workers=2, on_complete=lambda start, stop: completed.append(start)
+    )
+    assert isinstance(result, np.memmap)
+    assert np.array_equal(result[0], values**2)
+    assert np.array_equal(result[1], values**3)
+    assert sorted(completed) == [0, 3, 6, 9]
+    # The scratch file is unlinked once the workers are done
+    assert os.listdir(tmp_path) == []
+
+    in_process = run_shared_ensemble(_square_and_cube, tasks, (2, 10, 5), max_workers=1)
+    assert type(in_process) is np.ndarray
+    assert np.array_equal(in_process, result)
+
+
+def test_results_kept_in_given_npy_file(tmp_path):
+    tasks, values = _tasks(4, 2)
+    path = str(tmp_path / "out.npy")
+    run_shared_ensemble(_square_and_cube, tasks, (2, 4, 5), path=path, max_workers=2)
+    assert np.array_equal(np.load(path)[1], values**3)
@@ -0,0 +1,42 @@
+import os
+import sys
+import numpy as np
+
+# Ensure project root is importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from ComputationalProject.integrator import compute_pendulum_ensemble
+from ComputationalProject.sweep import chunk_bounds, sweep_pendulum
+
+
+def test_chunk_bounds_cover_range():
+    assert chunk_bounds(7, 3) == [(0, 3), (3, 6), (6, 7)]
+
+
+def test_sweep_pendulum_matches_ensemble_and_keeps_order():
+    x0_values = np.array([0.5, 1.0, 1.5])
+    omega_values = np.array([1.0, 2.0])
+
+    times, theta_values, theta_dot_values = sweep_pendulum(
+        x0_values, omega_values, theta0=0.2, theta_dot0=0.0, N_periods=3, max_workers=2, chunk_size=2
+    )
+
+    assert times.shape == (4,)
+    assert theta_values.shape == theta_dot_values.shape == (3, 2, 4)
+
+    X0, OMEGA = np.meshgrid(x0_values, omega_values, indexing="ij")
+    _, theta_ref, theta_dot_ref = compute_pendulum_ensemble(
+        x0=X0.ravel(), omega=OMEGA.ravel(), theta0=0.2, theta_dot0=0.0, N_periods=3
+    )
+    assert np.allclose(theta_values.reshape(6, 4), theta_ref)
+    assert np.allclose(theta_dot_values.reshape(6, 4), theta_dot_ref)
+
+
+def test_sweep_pendulum_writes_results_to_out_file(tmp_path):
+    path = str(tmp_path / "sweep.npy")
+    times, theta_values, theta_dot_values = sweep_pendulum(
+        [0.5, 1.0], [2.0], theta0=0.2, theta_dot0=0.0, N_periods=2, max_workers=1, out=path
+    )
+    saved = np.load(path)
+    assert saved.shape == (2, 2, 3)
+    assert np.array_equal(saved[0], theta_values.reshape(2, 3))
+    assert np.array_equal(saved[1], theta_dot_values.reshape(2, 3))
@@ -0,0 +1,82 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from ComputationalProject import symbolic
+from ComputationalProject.normal_modes import cart_pendulum_modes, generalized_eig
+from ComputationalProject.symbolic import CART_PENDULUM, compile_eigensystem, model_key
+
+
+@pytest.fixture(autouse=True)
+def _fresh_compiled(monkeypatch):
+    monkeypatch.setattr(symbolic, "_compiled", {})
+
+
+def test_compiled_cart_pendulum_matches_normal_modes_on_grid(tmp_path):
+    eigensystem = compile_eigensystem(CART_PENDULUM, cache_dir=str(tmp_path))
+    l_values = np.linspace(0.01, 1.0, 30)[:, None]
+    k_values = np.linspace(10.0, 300.0, 25)[None, :]
+    w2, modes = eigensystem(M=1.0, m=0.1, l=l_values, k=k_values, g=9.81)
+    expected_w2, expected_modes = cart_pendulum_modes(l=l_values, k=k_values)
+    assert w2.shape == (30, 25, 2) and modes.shape == (30, 25, 2, 2)
+    assert np.allclose(w2, expected_w2, rtol=1e-10, atol=1e-14)
+    assert np.allclose(modes, expected_modes, atol=1e-10)
+
+    coefficients = eigensystem.characteristic_coefficients(1.0, 0.1, l_values, k_values, 9.81)
+    assert coefficients.shape == (30, 25, 3)
+    roots = np.sort(np.roots(coefficients[0, 0]))
+    assert np.allclose(roots, w2[0, 0])
+
+
+def test_compiled_model_handles_complex_spectrum(tmp_path):
+    model = {"params": ["a", "b"], "K": [["a", "b"], ["-b", "a"]], "M": [["1", "0"], ["0", "1"]]}
+    eigensystem = compile_eigensystem(model, cache_dir=str(tmp_path))
+    w2, modes = eigensystem(a=[1.0, 2.0], b=0.5)
+    K = np.array([[[1.0, 0.5], [-0.5, 1.0]], [[2.0, 0.5], [-0.5, 2.0]]])
+    expected_w2, expected_modes = generalized_eig(K, np.eye(2))
+    assert np.iscomplexobj(w2)
+    assert np.allclose(w2, expected_w2)
+    assert np.allclose(K @ modes, modes * w2[:, None, :])
+
+
+def test_cache_hit_reuses_generated_source_without_sympy(tmp_path, monkeypatch):
+    first = compile_eigensystem(CART_PENDULUM, cache_dir=str(tmp_path))
+    cached_file = tmp_path / (model_key(CART_PENDULUM) + ".py")
+    assert cached_file.read_text() == first.source
+
+    monkeypatch.setattr(symbolic, "_compiled", {})
+
+    def _no_sympy(model):
+        raise AssertionError("source should come from the cache")
+
+    monkeypatch.setattr(symbolic, "generate_eigensystem_source", _no_sympy)
+    second = compile_eigensystem(CART_PENDULUM, cache_dir=str(tmp_path))
+    assert second is not first
+    assert second.source == first.source
+    assert np.allclose(second(1.0, 0.1, 0.0155, 158.0, 9.81)[0], cart_pendulum_modes()[0])
+
+
+@pytest.mark.parametrize("corrupt", ["truncated", "garbage"])
+def test_corrupt_cache_entry_is_regenerated(tmp_path, monkeypatch, corrupt):
+    good = compile_eigensystem(CART_PENDULUM, cache_dir=str(tmp_path))
+    cached_file = tmp_path / (model_key(CART_PENDULUM) + ".py")
+    if corrupt == "truncated":
+        # Cut off before the eigensystem function: still valid Python, but incomplete
+        cached_file.write_text(good.source[: good.source.index("def eigensystem")])
+    else:
+        cached_file.write_text(good.source[: len(good.source) // 2] + "(((")
+    monkeypatch.setattr(symbolic, "_compiled", {})
+
+    fresh = compile_eigensystem(CART_PENDULUM, cache_dir=str(tmp_path))
+    assert fresh.source == good.source
+    assert cached_file.read_text() == good.source
+    assert np.allclose(fresh(1.0, 0.1, 0.0155, 158.0, 9.81)[0], cart_pendulum_modes()[0])
+
+
+def test_missing_parameter_raises(tmp_path):
+    eigensystem = compile_eigensystem(CART_PENDULUM, cache_dir=str(tmp_path))
+    with pytest.raises(TypeError):
+        eigensystem(M=1.0, m=0.1, l=0.0155, k=158.0)
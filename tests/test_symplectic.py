@@ -0,0 +1,42 @@
+import os
+import sys
+import numpy as np
+
+# Ensure project root is importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from ComputationalProject.double_pendulum import hamiltonian, integrate_double_pendulum
+from ComputationalProject.integrator import compute_pendulum_trajectory
+from ComputationalProject.symplectic import implicit_midpoint, stormer_verlet
+
+
+def test_fixed_step_methods_on_harmonic_oscillator_ensemble():
+    y0 = np.array([[1.0, 0.0, 0.5], [0.0, 1.0, -0.5]])  # (q, p) for three members
+
+    # The implicit midpoint rule conserves quadratic invariants exactly
+    _, ys = implicit_midpoint(lambda t, y: np.array([y[1], -y[0]]), 0.0, y0, 0.1, 2000, record_every=100)
+    energy = ys[0] ** 2 + ys[1] ** 2
+    assert ys.shape == (2, 3, 21)
+    assert np.allclose(energy, energy[:, :1], atol=1e-10)
+
+    # Stormer-Verlet keeps the energy error bounded at O(h^2) with no drift
+    _, q, p = stormer_verlet(lambda t, q, p: p, lambda t, q, p: -q, 0.0, y0[0], y0[1], 0.1, 2000)
+    energy = q**2 + p**2
+    assert np.max(np.abs(energy - energy[:, :1])) < 0.01
+
+
+def test_double_pendulum_energy_stays_bounded():
+    y0 = np.array([[0.5, 0.3, -1.0, 1.2], [1.0, 0.0, 0.5, 0.0]]).T
+    for method in ("stormer_verlet", "implicit_midpoint"):
+        times, y = integrate_double_pendulum(y0, 0.02, 5000, method=method, record_every=10)
+        H = hamiltonian(y[0], y[2], y[1], y[3])
+        assert times[-1] == 100.0
+        assert np.max(np.abs(H - H[:, :1])) < 0.05
+
+
+def test_compute_pendulum_trajectory_accepts_symplectic_methods():
+    kwargs = dict(x0=1.0, omega=2.0, theta0=0.1, theta_dot0=0.0, N_periods=2, cache=False)
+    _, theta_ref, _ = compute_pendulum_trajectory(**kwargs)
+    for method in ("stormer_verlet", "implicit_midpoint"):
+        times, theta_values, _ = compute_pendulum_trajectory(solver_method=method, step_size=0.002, **kwargs)
+        assert times.shape == (3,)
+        assert np.allclose(theta_values, theta_ref, atol=1e-3)
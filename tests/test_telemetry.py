@@ -0,0 +1,31 @@
+import os
+import sys
+import numpy as np
+
+# Ensure project root is importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from ComputationalProject.integrator import compute_pendulum_trajectory
+
+
+def test_stats_match_plain_run_and_account_for_every_rhs_call():
+    kwargs = dict(theta0=0.1, theta_dot0=0.0, N_periods=4, rtol=1e-6, atol=1e-6, cache=False)
+    times, theta_values, theta_dot_values = compute_pendulum_trajectory(**kwargs)
+    t2, theta2, theta_dot2, stats = compute_pendulum_trajectory(return_stats=True, **kwargs)
+
+    assert np.array_equal(times, t2)
+    assert np.allclose(theta_values, theta2)
+    assert np.allclose(theta_dot_values, theta_dot2)
+
+    # RK45: 6 evaluations per attempted step plus 2 for the initial step selection
+    assert stats.method == "RK45"
+    assert stats.nfev == stats.rhs_calls == 6 * (stats.n_accepted + stats.n_rejected) + 2
+    assert 0.0 < stats.rhs_time <= stats.wall_time
+    assert stats.to_dict()["success"] is True
+
+
+def test_stats_for_implicit_solver_report_jacobian_use():
+    *_, stats = compute_pendulum_trajectory(
+        theta0=0.1, theta_dot0=0.0, N_periods=2, solver_method="Radau", cache=False, return_stats=True
+    )
+    assert stats.njev > 0
+    assert stats.n_rejected is None
@@ -0,0 +1,47 @@
+import os
+import sys
+import numpy as np
+
+# Ensure project root is importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from ComputationalProject.trajectory_io import load_trajectory, save_trajectory, write_trajectory_stream
+from ComputationalProject.visualizer import load_theta_series
+
+
+def test_binary_round_trip_keeps_precision_and_metadata(tmp_path):
+    p = str(tmp_path / "traj.npy")
+    times = np.linspace(0.0, 1.0, 5)
+    theta_values = np.sqrt(2.0) * times
+    theta_dot_values = np.pi * times
+
+    save_trajectory(p, times, theta_values, theta_dot_values, metadata={"x0": 1.0, "omega": 2.0})
+    t, th, thd, meta = load_trajectory(p, mmap_mode="r")
+
+    assert np.array_equal(t, times)
+    assert np.array_equal(th, theta_values)
+    assert np.array_equal(thd, theta_dot_values)
+    assert meta == {"x0": 1.0, "omega": 2.0}
+    assert np.array_equal(load_theta_series(p), theta_values)
+
+
+def test_csv_round_trip(tmp_path):
+    p = str(tmp_path / "traj.csv")
+    times = np.array([0.0, 1.0])
+    save_trajectory(p, times, [0.5, 1.5], [2.0, 3.0])
+
+    t, th, thd, meta = load_trajectory(p)
+    assert np.allclose(t, times)
+    assert np.allclose(th, [0.5, 1.5])
+    assert np.allclose(thd, [2.0, 3.0])
+    assert meta == {}
+
+
+def test_write_trajectory_stream_binary(tmp_path):
+    p = str(tmp_path / "stream.npy")
+    chunks = ((np.arange(i, i + 3.0), np.zeros(3), np.ones(3)) for i in (0, 3))
+
+    assert write_trajectory_stream(p, chunks, n_samples=6, metadata={"omega": 2.0}) == 6
+    t, th, thd, meta = load_trajectory(p)
+    assert np.array_equal(t, np.arange(6.0))
+    assert np.array_equal(thd, np.ones(6))
+    assert meta == {"omega": 2.0}
@@ -5,7 +5,14 @@ import numpy as np
 
 # Ensure project root is importable
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from ComputationalProject.visualizer import theta_to_positions, load_theta_series
+from ComputationalProject.visualizer import (
+    dirty_rect,
+    frame_count,
+    load_theta_series,
+    precompute_frames,
+    resample_theta,
+    theta_to_positions,
+)
 
 
 def test_theta_to_positions_basic():
@@ -27,3 +34,17 @@ def test_load_theta_series(tmp_path):
     arr = load_theta_series(str(p))
     assert arr.shape == (2,)
     assert np.allclose(arr, [0.0, 1.5708])
+
+
+def test_precompute_frames_has_exact_frame_count():
+    theta_values = np.linspace(0.0, 10.0, 100001)
+    x_pos, y_pos = precompute_frames(theta_values, duration=2.5, fps=60, pivot=(0, 0), d=1.0)
+    assert x_pos.shape == y_pos.shape == (frame_count(2.5, 60),) == (150,)
+    # Endpoints are kept and interior frames are interpolated, not strided
+    assert np.allclose(resample_theta(theta_values, 150)[[0, -1]], [0.0, 10.0])
+    assert np.allclose(resample_theta([0.0, 1.0], 5), [0.0, 0.25, 0.5, 0.75, 1.0])
+
+
+def test_dirty_rect_covers_rod_and_bob():
+    left, top, width, height = dirty_rect(pivot=(100, 100), bob=(150.0, 40.0), radius=10, pad=0)
+    assert (left, top, width, height) == (100, 30, 60, 70)